@@ -0,0 +1,64 @@
+"""
+Sample (ground truth, miner answer) pairs from recorded validator traffic for the scoring benchmark.
+
+    python benchmarks/extract_answer_pairs.py --recording records.jsonl.gz --output benchmarks/data/answer_pairs.json
+    python benchmarks/extract_answer_pairs.py --recording a.jsonl.gz --recording b.jsonl.gz --max-pairs 1000
+
+Recordings are written by the validator with --neuron.record_path. Every successful response of a
+recorded batch gives one pair, exactly as `_get_correctness` passes it to `_compare_numerical_answers`
+(the raw ground truth and the stripped miner answer). Duplicate pairs are dropped, then `--max-pairs`
+are sampled with a fixed seed, so the same recordings always give the same corpus.
+"""
+import os
+import sys
+import json
+import random
+import argparse
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from logicnet.validator.recorder import read_recording  # noqa: E402
+
+SEED = 42
+
+
+def extract_answer_pairs(recording_paths: list[str], max_pairs: int, seed: int = SEED) -> list[dict]:
+    pairs = {}
+    for path in recording_paths:
+        for record in read_recording(path):
+            if record["type"] != "batch":
+                continue
+            ground_truth = record["base_synapse"]["ground_truth_answer"]
+            for response in record["responses"]:
+                if response["status_code"] != 200 or response["logic_answer"] is None:
+                    continue
+                miner_answer = response["logic_answer"].strip()
+                pairs.setdefault((ground_truth, miner_answer), None)
+    pairs = list(pairs)
+    if len(pairs) > max_pairs:
+        pairs = random.Random(seed).sample(pairs, max_pairs)
+    return [{"ground_truth": ground_truth, "miner_answer": miner_answer} for ground_truth, miner_answer in pairs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sample answer pairs for the scoring benchmark from validator recordings.")
+    parser.add_argument("--recording", action="append", required=True, help="Recording to read, can be repeated.")
+    parser.add_argument("--output", default=None, help="Write the pairs here instead of stdout.")
+    parser.add_argument("--max-pairs", type=int, default=500, help="Number of pairs to sample.")
+    parser.add_argument("--seed", type=int, default=SEED, help="Sampling seed.")
+    args = parser.parse_args()
+
+    pairs = extract_answer_pairs(args.recording, args.max_pairs, args.seed)
+    # One pair per line, like the committed corpus.
+    output = "[\n" + ",\n".join(f"  {json.dumps(pair, ensure_ascii=False)}" for pair in pairs) + "\n]\n" if pairs else "[]\n"
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+        print(f"Wrote {len(pairs)} answer pairs to {args.output}", file=sys.stderr)
+    else:
+        print(output, end="")
+
+
+if __name__ == "__main__":
+    main()
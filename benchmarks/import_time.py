@@ -0,0 +1,93 @@
+"""
+Cold import time of the logicnet entry points.
+
+    python benchmarks/import_time.py --repeat 5 --output import_time.json
+
+Each target is imported in a fresh interpreter with `-X importtime`. The report gives the median
+wall time, the slowest modules by cumulative import time, and which heavy validator-only
+dependencies ended up loaded.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TARGETS = {
+    "logicnet": "import logicnet",
+    "miner": "import logicnet.miner, logicnet.protocol, logicnet.base.miner",
+    "validator": "import logicnet.validator; logicnet.validator.LogicRewarder; logicnet.validator.LogicChallenger",
+}
+HEAVY_MODULES = ["torch", "sentence_transformers", "sympy", "datasets", "openai", "transformers"]
+
+
+def import_once(statement: str):
+    probe = (
+        f"{statement}\n"
+        "import sys, json\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": REPO_ROOT},
+    )
+    wall = time.perf_counter() - start
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+
+    modules = []
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.append((int(cumulative), name.strip()))
+    return wall, modules, json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def benchmark(statement: str, repeat: int, top: int) -> dict:
+    walls = []
+    for _ in range(repeat):
+        wall, modules, heavy = import_once(statement)
+        walls.append(wall)
+    top_level = sorted((m for m in modules if "." not in m[1].strip()), reverse=True)[:top]
+    return {
+        "statement": statement,
+        "median_seconds": round(statistics.median(walls), 3),
+        "min_seconds": round(min(walls), 3),
+        "heavy_modules_loaded": heavy,
+        "slowest_imports_ms": {name: round(us / 1000, 1) for us, name in top_level},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import time of logicnet entry points.")
+    parser.add_argument("--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Slowest top-level imports to report.")
+    parser.add_argument("--output", default=None, help="Write the JSON report here instead of stdout.")
+    args = parser.parse_args()
+
+    results = {}
+    for target in args.targets:
+        try:
+            results[target] = benchmark(TARGETS[target], args.repeat, args.top)
+        except RuntimeError as e:
+            results[target] = {"statement": TARGETS[target], "error": str(e)}
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
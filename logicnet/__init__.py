@@ -1,9 +1,4 @@
-# Import all submodules.
-from . import protocol
-from . import base
-from . import validator
-from . import miner
-from . import utils
+import importlib
 
 __version__ = "1.6.0"
 version_split = __version__.split(".")
@@ -15,3 +10,17 @@ __spec_version__ = (
 
 
 __all__ = ["protocol", "base", "validator", "miner", "utils"]
+
+
+def __getattr__(name):
+    # Submodules are imported on first access, so a miner never pays for validator-only
+    # dependencies (torch, sentence_transformers, sympy, datasets).
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
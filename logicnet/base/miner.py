@@ -24,9 +24,11 @@ class BaseMinerNeuron(BaseNeuron):
         self.axon.attach(
             forward_fn=self.forward,
             blacklist_fn=self.blacklist,
+            priority_fn=self.priority,
         ).attach(
             forward_fn=self.forward_info,
             blacklist_fn=self.blacklist_info,
+            priority_fn=self.priority_info,
         )
         bt.logging.info(f"\033[1;32m🧠 Axon created: {self.axon}\033[0m")
 
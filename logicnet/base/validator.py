@@ -8,6 +8,7 @@ from typing import List
 from traceback import print_exception
 
 from logicnet.base.neuron import BaseNeuron
+from logicnet.utils.metrics import span
 
 
 class BaseValidatorNeuron(BaseNeuron):
@@ -101,15 +102,6 @@ class BaseValidatorNeuron(BaseNeuron):
         # This loop maintains the validator's operations until intentionally stopped.
         while True:
             try:
-                if self.config.proxy.port:
-                    try:
-                        self.validator_proxy.get_credentials()
-                        bt.logging.info(
-                            "\033[1;32m🔌 Validator proxy ping to proxy-client successfully\033[0m"
-                        )
-                    except Exception:
-                        bt.logging.warning("\033[1;33m⚠️ Warning, proxy can't ping to proxy-client.\033[0m")
-
                 bt.logging.info(f"\033[1;32m🔄 step({self.step}) block({self.block})\033[0m")
 
                 # Run forward.
@@ -224,14 +216,15 @@ class BaseValidatorNeuron(BaseNeuron):
         bt.logging.info(f"processed_weight_uids {processed_weight_uids}")
 
         # Set the weights on chain via our subtensor connection.
-        self.subtensor.set_weights(
-            wallet=self.wallet,
-            netuid=self.config.netuid,
-            uids=processed_weight_uids,
-            weights=processed_weights,
-            wait_for_finalization=False,
-            version_key=self.spec_version,
-        )
+        with span("set_weights"):
+            self.subtensor.set_weights(
+                wallet=self.wallet,
+                netuid=self.config.netuid,
+                uids=processed_weight_uids,
+                weights=processed_weights,
+                wait_for_finalization=False,
+                version_key=self.spec_version,
+            )
 
         bt.logging.info(f"\033[1;32m⚖️ Set weights: {processed_weights}\033[0m")
 
@@ -253,10 +246,12 @@ class BaseValidatorNeuron(BaseNeuron):
             "\033[1;32m🔄 Metagraph updated, re-syncing hotkeys, dendrite pool and moving averages\033[0m"
         )
         # Zero out all hotkeys that have been replaced.
+        replaced_uids = []
         for uid, hotkey in enumerate(self.hotkeys):
             if (hotkey != self.metagraph.hotkeys[uid]):
                 bt.logging.info(f"\033[1;32m🔄 Hotkey {hotkey} has been replaced\033[0m")
                 self.scores[uid] = 0  # hotkey has been replaced
+                replaced_uids.append(uid)
 
         # Check to see if the metagraph has changed size.
         # If so, we need to add new hotkeys and moving averages.
@@ -272,6 +267,11 @@ class BaseValidatorNeuron(BaseNeuron):
 
         # Update the hotkeys.
         self.hotkeys = copy.deepcopy(self.metagraph.hotkeys)
+        self.on_metagraph_updated(replaced_uids)
+
+    def on_metagraph_updated(self, replaced_uids: List[int]):
+        """Called after a metagraph change with the UIDs whose hotkey was replaced. Override to drop per-UID state."""
+        pass
 
     def update_scores(self, rewards: torch.FloatTensor, uids: List[int]):
         """Performs exponential moving average on the scores based on the rewards received from the miners."""
@@ -1,5 +1,5 @@
 from .blacklist import check_limit, check_min_stake
-from .forward import solve, extract_code_block
+from .forward import solve, solve_streaming, extract_code_block
 
 __all__ = [
     "check_limit",
@@ -8,4 +8,5 @@ __all__ = [
     "generate",
     "extract_code_block",
     "solve",
+    "solve_streaming",
 ]
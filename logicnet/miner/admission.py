@@ -0,0 +1,99 @@
+import heapq
+import asyncio
+import itertools
+
+SERVICE_TIME_EMA_ALPHA = 0.2
+
+
+class AdmissionTimeout(Exception):
+    """A request found no free slot in time. Raised so the axon reports a failure, not an empty answer."""
+
+
+class AdmissionController:
+    """
+    Miner-side admission control for incoming requests.
+
+    At most `max_concurrency` requests are solved at once. Requests beyond that wait in a priority
+    queue ordered by validator stake, and `should_reject` lets the blacklist turn away requests that
+    would not finish before their timeout, so overload costs a few fast rejections instead of
+    timing out every request at once.
+
+    Must be used from a single event loop (the axon's).
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max(1, max_concurrency)
+        self.in_flight = 0
+        self.waiters = []
+        self.num_waiting = 0
+        self.counter = itertools.count()
+        # Exponential moving average of the time it takes to solve a request, unknown until the first one is served.
+        self.avg_service_time = None
+        self.num_rejected = 0
+
+    def expected_wait(self, priority: float) -> float:
+        """Expected queueing delay for a new request with this priority."""
+        if self.in_flight < self.max_concurrency or not self.avg_service_time:
+            return 0.0
+        ahead = sum(
+            1 for neg_priority, _, future in self.waiters
+            if not future.done() and -neg_priority >= priority
+        )
+        # With every slot busy, one frees up every avg_service_time / max_concurrency seconds on average.
+        return (ahead + 1) * self.avg_service_time / self.max_concurrency
+
+    def should_reject(self, priority: float, timeout: float) -> bool:
+        """True if the request is expected to wait and be solved past its timeout."""
+        if not self.avg_service_time:
+            return False
+        if self.expected_wait(priority) + self.avg_service_time > timeout:
+            self.num_rejected += 1
+            return True
+        return False
+
+    async def acquire(self, priority: float):
+        """Wait for a free slot. Higher priority requests are admitted first."""
+        if self.in_flight < self.max_concurrency and not self.num_waiting:
+            self.in_flight += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.waiters, (-priority, next(self.counter), future))
+        self.num_waiting += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed to us just as we gave up, pass it on.
+                self._hand_over()
+            else:
+                self.num_waiting -= 1
+            raise
+
+    def release(self, service_time: float = None):
+        """Free a slot and record how long the request took to solve."""
+        if service_time is not None:
+            if self.avg_service_time is None:
+                self.avg_service_time = service_time
+            else:
+                self.avg_service_time = (
+                    SERVICE_TIME_EMA_ALPHA * service_time
+                    + (1 - SERVICE_TIME_EMA_ALPHA) * self.avg_service_time
+                )
+        self._hand_over()
+
+    def _hand_over(self):
+        while self.waiters:
+            _, _, future = heapq.heappop(self.waiters)
+            if not future.done():
+                self.num_waiting -= 1
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "waiting": self.num_waiting,
+            "rejected": self.num_rejected,
+            "avg_service_time": self.avg_service_time,
+        }
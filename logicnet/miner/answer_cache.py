@@ -0,0 +1,130 @@
+import os
+import json
+import threading
+import numpy as np
+import bittensor as bt
+from collections import OrderedDict
+from typing import Optional, Tuple
+from logicnet.utils.regex_helper import extract_numbers
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class AnswerCache:
+    """
+    Semantic cache of solved questions for the miner.
+
+    Questions are embedded with MiniLM and kept, L2-normalized, in a fixed-capacity matrix, so a lookup
+    is one matrix-vector product over at most `max_entries` rows. A hit is the most similar stored
+    question above `threshold` that also has exactly the same numbers, since questions differing only
+    in their numbers embed almost identically. When full, the least recently used entry is overwritten.
+    The index is persisted atomically to `path`.npz and reloaded on start.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 10000,
+        threshold: float = 0.95,
+        model_name: str = EMBEDDING_MODEL,
+    ):
+        from sentence_transformers import SentenceTransformer
+
+        self.path = os.path.expanduser(path)
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.embedder = SentenceTransformer(model_name)
+        dim = self.embedder.get_sentence_embedding_dimension()
+        self.embeddings = np.zeros((max_entries, dim), dtype=np.float32)
+        self.entries = []
+        # slot -> None, ordered from least to most recently used
+        self.lru = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        self.load()
+
+    def embed(self, question: str) -> np.ndarray:
+        return self.embedder.encode(question, normalize_embeddings=True).astype(np.float32)
+
+    def lookup(self, question: str) -> Tuple[Optional[Tuple[str, str]], np.ndarray]:
+        """Return ((reasoning, answer) or None, question embedding)."""
+        embedding = self.embed(question)
+        with self.lock:
+            size = len(self.entries)
+            if size:
+                similarities = self.embeddings[:size] @ embedding
+                candidates = np.flatnonzero(similarities >= self.threshold)
+                if len(candidates):
+                    numbers = extract_numbers(question)
+                    for slot in candidates[np.argsort(-similarities[candidates])]:
+                        slot = int(slot)
+                        entry = self.entries[slot]
+                        if extract_numbers(entry["question"]) == numbers:
+                            self.hits += 1
+                            self.lru.move_to_end(slot)
+                            return (entry["reasoning"], entry["answer"]), embedding
+            self.misses += 1
+        return None, embedding
+
+    def add(self, question: str, reasoning: str, answer: str, embedding: np.ndarray = None):
+        if embedding is None:
+            embedding = self.embed(question)
+        entry = {"question": question, "reasoning": reasoning, "answer": answer}
+        with self.lock:
+            if len(self.entries) < self.max_entries:
+                slot = len(self.entries)
+                self.entries.append(entry)
+            else:
+                slot, _ = self.lru.popitem(last=False)
+                self.entries[slot] = entry
+            self.embeddings[slot] = embedding
+            self.lru[slot] = None
+            self.dirty = True
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+    def save(self):
+        """Persist the index if it changed since the last save."""
+        with self.lock:
+            if not self.dirty:
+                return
+            size = len(self.entries)
+            embeddings = self.embeddings[:size].copy()
+            state = {"entries": self.entries[:], "lru": list(self.lru.keys())}
+            self.dirty = False
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # Embeddings and entries go in one file replaced in a single step, so a crash mid-save
+        # leaves the previous index intact rather than embeddings that do not match their entries.
+        with open(self.path + ".npz.tmp", "wb") as f:
+            np.savez(f, embeddings=embeddings, state=np.array(json.dumps(state)))
+        os.replace(self.path + ".npz.tmp", self.path + ".npz")
+
+    def load(self):
+        if not os.path.exists(self.path + ".npz"):
+            return
+        try:
+            with np.load(self.path + ".npz") as data:
+                embeddings = data["embeddings"]
+                state = json.loads(str(data["state"]))
+            size = min(len(state["entries"]), len(embeddings), self.max_entries)
+            if embeddings.shape[1] != self.embeddings.shape[1]:
+                raise ValueError("Embedding dimension does not match the model")
+            self.embeddings[:size] = embeddings[:size]
+            self.entries = state["entries"][:size]
+            self.lru = OrderedDict((slot, None) for slot in state["lru"] if slot < size)
+            for slot in range(size):
+                if slot not in self.lru:
+                    self.lru[slot] = None
+                    self.lru.move_to_end(slot, last=False)
+            bt.logging.info(f"Loaded {size} entries into the answer cache from {self.path}")
+        except Exception as e:
+            bt.logging.warning(f"Failed to load answer cache from {self.path}: {e}")
@@ -0,0 +1,120 @@
+import time
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+import openai
+import bittensor as bt
+
+LATENCY_EMA_ALPHA = 0.2
+
+
+class Backend:
+    """One OpenAI-compatible inference endpoint and its load / health bookkeeping."""
+
+    def __init__(self, base_url: str, api_key: str):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.client = openai.AsyncOpenAI(base_url=base_url, api_key=api_key)
+        self.outstanding = 0
+        self.avg_latency = None
+        self.consecutive_failures = 0
+        self.healthy = True
+        self.total_requests = 0
+        self.total_failures = 0
+
+    def to_dict(self):
+        return {
+            "base_url": self.base_url,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "avg_latency": round(self.avg_latency, 2) if self.avg_latency is not None else None,
+            "requests": self.total_requests,
+            "failures": self.total_failures,
+        }
+
+
+class BackendPool:
+    """
+    Spread miner requests over several LLM backends.
+
+    Each request goes to the healthy backend with the fewest outstanding requests (ties broken by
+    lower average latency). A backend is ejected after `max_failures` consecutive failed requests or
+    health checks, and re-admitted once `run_health_checks` sees it complete a one-token request for
+    `model` again; a listing endpoint can answer while completions fail. If every backend is ejected, requests are
+    still spread over all of them rather than failing outright.
+    """
+
+    def __init__(self, base_urls: list[str], api_key: str, model: str, max_failures: int = 3):
+        if not base_urls:
+            raise ValueError("At least one LLM backend base url is required")
+        self.backends = [Backend(base_url, api_key) for base_url in base_urls]
+        self.model = model
+        self.max_failures = max_failures
+        self.health_check_executor = ThreadPoolExecutor(
+            max_workers=len(self.backends), thread_name_prefix="llm-health-check"
+        )
+
+    def acquire(self) -> Backend:
+        candidates = [backend for backend in self.backends if backend.healthy] or self.backends
+        backend = min(
+            candidates,
+            key=lambda b: (b.outstanding, b.avg_latency if b.avg_latency is not None else 0.0),
+        )
+        backend.outstanding += 1
+        backend.total_requests += 1
+        return backend
+
+    def release(self, backend: Backend, latency: float, success: bool):
+        backend.outstanding -= 1
+        if success:
+            backend.consecutive_failures = 0
+            if backend.avg_latency is None:
+                backend.avg_latency = latency
+            else:
+                backend.avg_latency = (
+                    LATENCY_EMA_ALPHA * latency + (1 - LATENCY_EMA_ALPHA) * backend.avg_latency
+                )
+            return
+        backend.total_failures += 1
+        backend.consecutive_failures += 1
+        if backend.healthy and backend.consecutive_failures >= self.max_failures:
+            backend.healthy = False
+            bt.logging.warning(
+                f"\033[1;35m🛑 Ejecting LLM backend {backend.base_url} after {backend.consecutive_failures} consecutive failures\033[0m"
+            )
+
+    def run_health_checks(self, timeout: float = 10):
+        """Probe every backend concurrently, ejecting dead ones and re-admitting recovered ones."""
+        list(self.health_check_executor.map(lambda backend: self.check_backend(backend, timeout), self.backends))
+
+    def check_backend(self, backend: Backend, timeout: float):
+        start = time.time()
+        try:
+            response = httpx.post(
+                f"{backend.base_url}/chat/completions",
+                headers={"Authorization": f"Bearer {backend.api_key}"},
+                json={
+                    "model": self.model,
+                    "messages": [{"role": "user", "content": "1 + 1 ="}],
+                    "max_tokens": 1,
+                },
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            if not response.json().get("choices"):
+                raise ValueError("Completion has no choices")
+            if not backend.healthy:
+                bt.logging.info(
+                    f"\033[1;32m✅ LLM backend {backend.base_url} is back after {round(time.time() - start, 2)}s health check\033[0m"
+                )
+            backend.healthy = True
+            backend.consecutive_failures = 0
+        except Exception as e:
+            backend.consecutive_failures += 1
+            if backend.healthy and backend.consecutive_failures >= self.max_failures:
+                backend.healthy = False
+                bt.logging.warning(
+                    f"\033[1;35m🛑 Ejecting LLM backend {backend.base_url} after {backend.consecutive_failures} consecutive failures, last health check: {e}\033[0m"
+                )
+
+    def stats(self) -> list[dict]:
+        return [backend.to_dict() for backend in self.backends]
@@ -2,6 +2,37 @@ import time
 import bittensor as bt
 
 
+class SlidingWindowCounter:
+    """
+    Sliding-window-counter rate limiter for a single validator.
+
+    Keeps the request count of the current and the previous fixed window and estimates the count over
+    the last `interval` seconds as `previous * overlap + current`, so every check is O(1) and there is
+    no burst allowance at window boundaries like a plain fixed window has.
+    """
+
+    __slots__ = ("interval", "window_start", "current", "previous")
+
+    def __init__(self, interval: float, now: float):
+        self.interval = interval
+        self.window_start = now
+        self.current = 0
+        self.previous = 0
+
+    def hit(self, limit: float, now: float) -> bool:
+        """Count a request. Return True if it exceeds `limit`, in which case it is not counted."""
+        windows_passed = int((now - self.window_start) // self.interval)
+        if windows_passed > 0:
+            self.previous = self.current if windows_passed == 1 else 0
+            self.current = 0
+            self.window_start += windows_passed * self.interval
+        overlap = 1 - (now - self.window_start) / self.interval
+        if self.previous * overlap + self.current + 1 > limit:
+            return True
+        self.current += 1
+        return False
+
+
 def check_min_stake(stake: float, validator_uid: int, min_stake: float):
     return stake < min_stake
 
@@ -9,31 +40,17 @@ def check_min_stake(stake: float, validator_uid: int, min_stake: float):
 def check_limit(
     self, uid: str, stake: int, volume_per_validator: dict, interval: int = 600
 ):
-    bt.logging.info(self.validator_logs)
-
     # Get the current max_request for the validator
     max_request = volume_per_validator.get(uid, 1)
+    now = time.time()
+
+    counter = self.validator_logs.get(uid)
+    if counter is None or counter.interval != interval:
+        counter = self.validator_logs[uid] = SlidingWindowCounter(interval, now)
 
-    if uid not in self.validator_logs:
-        self.validator_logs[uid] = {
-            "start_interval": time.time(),
-            "max_request": max_request,
-            "request_counter": 1,
-        }
-    else:
-        # Update max_request in case it has changed
-        self.validator_logs[uid]["max_request"] = max_request
-
-        if time.time() - self.validator_logs[uid]["start_interval"] > interval:
-            self.validator_logs[uid]["start_interval"] = time.time()
-            self.validator_logs[uid]["request_counter"] = 1
-            bt.logging.info(f"Resetting counting log for uid: {uid}")
-        else:
-            self.validator_logs[uid]["request_counter"] += 1
-
-    # Log the current state for debugging
-    bt.logging.info(f"{self.validator_logs}")
-
-    if self.validator_logs[uid]["request_counter"] > self.validator_logs[uid]["max_request"]:
+    if counter.hit(max_request, now):
+        bt.logging.debug(
+            f"Limit exceeded for uid {uid}: max_request {max_request}, current {counter.current}, previous {counter.previous}"
+        )
         return True  # Limit exceeded
     return False  # Within limit
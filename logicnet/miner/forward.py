@@ -2,23 +2,64 @@ from logicnet.protocol import LogicSynapse
 import openai
 import bittensor as bt
 import traceback
+import asyncio
+import time
 import re
 
+ANSWER_START = "<answer>"
+ANSWER_END = "</answer>"
+# Seconds kept in reserve before synapse.timeout to send the response back to the validator
+DEADLINE_MARGIN = 4
+# Answer sent when the deadline cuts generation off before the answer is complete
+TIMEOUT_ANSWER = ""
+STREAM_SOLVE_SYSTEM_PROMPT = (
+    "Solve the user's problem. Reason step by step first. "
+    f"Then give the final short answer as a sentence in math latex, wrapped as {ANSWER_START}final answer{ANSWER_END}. "
+    f"Do not write anything after {ANSWER_END}."
+)
+
+
+def is_backend_error(error: Exception) -> bool:
+    """Transport and HTTP errors from the LLM backend, as opposed to deadlines or bad output."""
+    return isinstance(error, (openai.APIConnectionError, openai.APIStatusError))
+
+
+def solve_deadline(synapse: LogicSynapse, deadline: float = None) -> float:
+    """
+    Monotonic time by which solving must stop. `deadline` is when synapse.timeout runs out counted
+    from the request's arrival, so time spent waiting for admission is not given out twice.
+    """
+    if deadline is None:
+        deadline = time.monotonic() + synapse.timeout
+    return deadline - DEADLINE_MARGIN
+
+
+def time_left(deadline: float) -> float:
+    return max(deadline - time.monotonic(), 0.1)
+
 
 async def solve(
-    synapse: LogicSynapse, openai_client: openai.AsyncOpenAI, model: str
+    synapse: LogicSynapse,
+    openai_client: openai.AsyncOpenAI,
+    model: str,
+    deadline: float = None,
+    on_backend_error=None,
 ) -> LogicSynapse:
     try:
         bt.logging.info(f"Received synapse: {synapse}")
+        deadline = solve_deadline(synapse, deadline)
         logic_question: str = synapse.logic_question
         messages = [
             {"role": "user", "content": logic_question},
         ]
-        response = await openai_client.chat.completions.create(
-            model=model,
-            messages=messages,
-            max_tokens=2048,
-            temperature=0.8,
+        response = await asyncio.wait_for(
+            openai_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                max_tokens=2048,
+                temperature=0.8,
+            ),
+            timeout=time_left(deadline),
         )
         synapse.logic_reasoning = response.choices[0].message.content
 
@@ -32,20 +73,116 @@ async def solve(
             ]
         )
 
-        response = await openai_client.chat.completions.create(
-            model=model,
-            messages=messages,
-            max_tokens=512,
-            temperature=0.7,
+        response = await asyncio.wait_for(
+            openai_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                max_tokens=512,
+                temperature=0.7,
+            ),
+            timeout=time_left(deadline),
         )
         synapse.logic_answer = response.choices[0].message.content
 
         bt.logging.info(f"Logic answer: {synapse.logic_answer}")
         bt.logging.info(f"Logic reasoning: {synapse.logic_reasoning}")
         return synapse
+    except asyncio.TimeoutError:
+        bt.logging.warning("Solve deadline reached before the answer was complete")
+        synapse.logic_answer = TIMEOUT_ANSWER
+        return synapse
     except Exception as e:
         bt.logging.error(f"Error in forward: {e}")
         traceback.print_exc()
+        if on_backend_error is not None and is_backend_error(e):
+            on_backend_error(e)
+        return synapse
+
+
+async def solve_streaming(
+    synapse: LogicSynapse,
+    openai_client: openai.AsyncOpenAI,
+    model: str,
+    deadline: float = None,
+    on_backend_error=None,
+) -> LogicSynapse:
+    """
+    Single-call solve: reasoning and final answer come from one streamed completion. Generation stops
+    as soon as the answer delimiter is closed, or when the deadline derived from synapse.timeout is hit.
+    """
+    try:
+        bt.logging.info(f"Received synapse: {synapse}")
+        deadline = solve_deadline(synapse, deadline)
+        messages = [
+            {"role": "system", "content": STREAM_SOLVE_SYSTEM_PROMPT},
+            {"role": "user", "content": synapse.logic_question},
+        ]
+        stream = await asyncio.wait_for(
+            openai_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                max_tokens=2048,
+                temperature=0.8,
+                stop=[ANSWER_END],
+                stream=True,
+            ),
+            timeout=time_left(deadline),
+        )
+
+        chunks = []
+        timed_out = False
+        try:
+            # The server stops at ANSWER_END (it is not included in the output), so the stream ends on its own
+            # once the answer is closed.
+            stream_iterator = stream.__aiter__()
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    timed_out = True
+                    break
+                try:
+                    chunk = await asyncio.wait_for(stream_iterator.__anext__(), timeout=remaining)
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    timed_out = True
+                    break
+                if chunk.choices and chunk.choices[0].delta.content:
+                    chunks.append(chunk.choices[0].delta.content)
+        finally:
+            await stream.close()
+
+        if timed_out:
+            # Partial reasoning is not an answer; say so instead of passing its last line off as one.
+            bt.logging.warning("Solve deadline reached before the answer was complete")
+            synapse.logic_reasoning = "".join(chunks).strip()
+            synapse.logic_answer = TIMEOUT_ANSWER
+        else:
+            synapse.logic_reasoning, synapse.logic_answer = split_reasoning_and_answer("".join(chunks))
+        bt.logging.info(f"Logic answer: {synapse.logic_answer}")
+        bt.logging.info(f"Logic reasoning: {synapse.logic_reasoning}")
+        return synapse
+    except asyncio.TimeoutError:
+        bt.logging.warning("Solve deadline reached before the answer was complete")
+        synapse.logic_answer = TIMEOUT_ANSWER
+        return synapse
+    except Exception as e:
+        bt.logging.error(f"Error in forward: {e}")
+        traceback.print_exc()
+        if on_backend_error is not None and is_backend_error(e):
+            on_backend_error(e)
+        return synapse
+
+
+def split_reasoning_and_answer(text: str):
+    """Split a streamed completion into (reasoning, answer) using the answer delimiters."""
+    if ANSWER_START in text:
+        reasoning, answer = text.split(ANSWER_START, 1)
+        answer = answer.split(ANSWER_END, 1)[0]
+        return reasoning.strip(), answer.strip()
+    # The model finished without following the format, fall back to the last line.
+    lines = [line for line in text.strip().splitlines() if line.strip()]
+    return text.strip(), lines[-1].strip() if lines else ""
 
 
 def extract_code_block(text):
@@ -1,5 +1,7 @@
 from . import config
 from . import misc
 from . import volume_setting
+from . import metrics
+from . import profiler
 
-__all__ = ["config", "misc", "volume_setting"]
+__all__ = ["config", "misc", "volume_setting", "metrics", "profiler"]
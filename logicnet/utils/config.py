@@ -30,6 +30,7 @@ def check_config(cls, config: "bt.Config"):
         logger.add(
             os.path.join(config.neuron.full_path, "events.log"),
             rotation=config.neuron.events_retention_size,
+            compression="gz",
             serialize=True,
             enqueue=True,
             backtrace=False,
@@ -96,6 +97,56 @@ def add_args(cls, parser):
             default=4096,
         )
 
+        parser.add_argument(
+            "--neuron.reward_events_sample_rate",
+            type=float,
+            help="Fraction of rewarded batches written to the events log.",
+            default=1.0,
+        )
+
+        parser.add_argument(
+            "--neuron.reward_events_verbosity",
+            type=str,
+            choices=["summary", "full"],
+            help="summary: scores only. full: also miner responses, questions and ground truths.",
+            default="summary",
+        )
+
+        parser.add_argument(
+            "--neuron.record_path",
+            type=str,
+            help="Record every rewarded (synapse, responses) batch to this gzip JSONL file for offline replay.",
+            default=None,
+        )
+
+        parser.add_argument(
+            "--neuron.metrics_port",
+            type=int,
+            help="Serve per-stage latency histograms on http://0.0.0.0:<port>/metrics. Collection is off when unset.",
+            default=None,
+        )
+
+        parser.add_argument(
+            "--neuron.profile",
+            action="store_true",
+            help="Run the sampling profiler: folded stacks, per-function stats and tracemalloc snapshots under <full_path>/profile.",
+            default=False,
+        )
+
+        parser.add_argument(
+            "--neuron.profile_interval",
+            type=float,
+            help="Seconds between profiler stack samples.",
+            default=0.05,
+        )
+
+        parser.add_argument(
+            "--neuron.profile_dump_interval",
+            type=float,
+            help="Seconds between profile dumps.",
+            default=300,
+        )
+
         parser.add_argument(
             "--loop_base_time",
             type=int,
@@ -150,6 +201,41 @@ def add_args(cls, parser):
             default=0.1,
         )
 
+        parser.add_argument(
+            "--proxy.hedge_k",
+            type=int,
+            help="Number of miners raced for each organic request",
+            default=3,
+        )
+
+        parser.add_argument(
+            "--proxy.hedge_delay",
+            type=float,
+            help="Seconds to wait for a miner before also sending the organic request to the next one",
+            default=4.0,
+        )
+
+        parser.add_argument(
+            "--proxy.workers",
+            type=int,
+            help="Run the proxy as a separate service with this many uvicorn workers. 0 serves it from a thread inside the validator",
+            default=0,
+        )
+
+        parser.add_argument(
+            "--proxy.max_reward_workers",
+            type=int,
+            help="Threads scoring organic responses in the background",
+            default=4,
+        )
+
+        parser.add_argument(
+            "--proxy.max_pending_rewards",
+            type=int,
+            help="Organic rewards queued at most; further ones are dropped until the queue drains",
+            default=64,
+        )
+
         parser.add_argument(
             "--min_stake",
             type=int,
@@ -216,6 +302,49 @@ def add_args(cls, parser):
             default=600,
         )
 
+        parser.add_argument(
+            "--miner.max_concurrency",
+            type=int,
+            help="The maximum number of requests solved at the same time, should match what the LLM backend can handle",
+            default=16,
+        )
+
+        parser.add_argument(
+            "--miner.solve_mode",
+            type=str,
+            choices=["two_step", "stream"],
+            help="two_step: reasoning then a second call for the short answer. stream: reasoning and answer in one streamed call",
+            default="two_step",
+        )
+
+        parser.add_argument(
+            "--miner.cache.enabled",
+            action="store_true",
+            help="If set, answer paraphrases of already solved questions from a semantic answer cache",
+            default=False,
+        )
+
+        parser.add_argument(
+            "--miner.cache.path",
+            type=str,
+            help="Path prefix of the persisted answer cache. Defaults to <neuron.full_path>/answer_cache",
+            default=None,
+        )
+
+        parser.add_argument(
+            "--miner.cache.threshold",
+            type=float,
+            help="Minimum cosine similarity between questions for a cache hit",
+            default=0.95,
+        )
+
+        parser.add_argument(
+            "--miner.cache.max_entries",
+            type=int,
+            help="Maximum number of cached answers, least recently used are evicted first",
+            default=10000,
+        )
+
         parser.add_argument(
             "--miner.llm_client.base_url",
             type=str,
@@ -223,6 +352,14 @@ def add_args(cls, parser):
             default="http://localhost:8000/v1",
         )
 
+        parser.add_argument(
+            "--miner.llm_client.base_urls",
+            type=str,
+            nargs="+",
+            help="Base urls of several LLM backends serving the same model. Requests are load balanced across them. Overrides --miner.llm_client.base_url",
+            default=None,
+        )
+
         parser.add_argument(
             "--miner.llm_client.model",
             type=str,
@@ -0,0 +1,135 @@
+import os
+import glob
+import gzip
+import json
+import time
+import shutil
+import tempfile
+import threading
+import bittensor as bt
+
+SHIP_INTERVAL = 300
+# Multipart chunk for large logs; MinIO requires at least 5 MiB.
+PART_SIZE = 16 * 1024 * 1024
+
+
+class LogShipper:
+    """
+    Ship rotated log files to MinIO from a background thread.
+
+    Every `interval` seconds the log directory is stat-scanned. For each pattern the newest file
+    is the live log; every older (rotated) file that is not yet in the local manifest is gzipped
+    to a temp file and uploaded, with multipart upload for anything larger than `part_size`. The
+    manifest is a JSON file next to the validator state, so the bucket is only listed once, to
+    seed a missing manifest, instead of on every pass.
+    """
+
+    def __init__(
+        self,
+        minio_manager,
+        bucket_name: str,
+        folder: str,
+        log_dir: str,
+        patterns: list[str],
+        manifest_path: str,
+        interval: float = SHIP_INTERVAL,
+        part_size: int = PART_SIZE,
+    ):
+        self.minio_manager = minio_manager
+        self.bucket_name = bucket_name
+        self.folder = folder
+        self.log_dir = log_dir
+        self.patterns = patterns
+        self.manifest_path = manifest_path
+        self.interval = interval
+        self.part_size = part_size
+        # Loaded on the shipper thread: seeding it may list the whole bucket once.
+        self.manifest = None
+
+    def _load_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            bt.logging.warning(f"Failed to read log manifest {self.manifest_path}, rebuilding it: {e}")
+
+        manifest = {}
+        prefix = f"{self.folder}/"
+        for object_name in self.minio_manager.get_uploaded_files(self.bucket_name):
+            if object_name.startswith(prefix):
+                file_name = object_name[len(prefix):]
+                if file_name.endswith(".gz"):
+                    file_name = file_name[:-3]
+                manifest[file_name] = {"object": object_name}
+        return manifest
+
+    def _save_manifest(self):
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.manifest, f)
+        os.replace(tmp_path, self.manifest_path)
+
+    def start(self):
+        threading.Thread(target=self._run, daemon=True, name="log-shipper").start()
+
+    def _run(self):
+        while True:
+            try:
+                self.scan()
+            except Exception as e:
+                bt.logging.error(f"Error shipping log files: {e}")
+            time.sleep(self.interval)
+
+    def scan(self) -> int:
+        """Upload every rotated log file missing from the manifest. Returns the number uploaded."""
+        if self.manifest is None:
+            self.manifest = self._load_manifest()
+        uploaded = 0
+        for pattern in self.patterns:
+            files = []
+            for path in glob.glob(os.path.join(self.log_dir, pattern)):
+                try:
+                    files.append((os.stat(path).st_mtime, path))
+                except FileNotFoundError:
+                    continue
+            # The most recently written file is the live log, still being appended to.
+            for _, path in sorted(files, reverse=True)[1:]:
+                if os.path.basename(path) not in self.manifest and self.ship(path):
+                    uploaded += 1
+        return uploaded
+
+    def ship(self, path: str) -> bool:
+        file_name = os.path.basename(path)
+        object_name = f"{file_name}.gz"
+        work_dir = os.path.dirname(self.manifest_path) or None
+        with tempfile.NamedTemporaryFile(dir=work_dir, suffix=".gz", delete=False) as tmp:
+            tmp_path = tmp.name
+        try:
+            with open(path, "rb") as src, gzip.open(tmp_path, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, length=1024 * 1024)
+            bt.logging.info(f"Uploading {path} to MinIO as {object_name}")
+            if not self.minio_manager.upload_file(
+                tmp_path,
+                self.bucket_name,
+                self.folder,
+                object_name=object_name,
+                content_type="application/gzip",
+                part_size=self.part_size,
+            ):
+                return False
+            self.manifest[file_name] = {
+                "object": f"{self.folder}/{object_name}",
+                "size": os.path.getsize(path),
+                "compressed_size": os.path.getsize(tmp_path),
+                "uploaded_at": int(time.time()),
+            }
+            self._save_manifest()
+            bt.logging.info(f"\033[1;32m✅ Uploaded {file_name} to MinIO\033[0m")
+            return True
+        finally:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,165 @@
+import os
+import time
+import bisect
+import resource
+import threading
+import bittensor as bt
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STAGE_METRIC = "logicnet_stage_duration_seconds"
+# Upper bounds in seconds; stages range from sub-millisecond checks to multi-minute epochs.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram in the Prometheus layout."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> list[int]:
+        total = 0
+        cumulative = []
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+
+class _Span:
+    __slots__ = ("registry", "stage", "start")
+
+    def __init__(self, registry, stage: str):
+        self.registry = registry
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.registry.observe(self.stage, time.perf_counter() - self.start)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class MetricsRegistry:
+    """
+    Per-stage latency histograms for the validator pipeline.
+
+    Disabled by default: `span()` then returns a shared no-op context manager, so instrumented code
+    pays one attribute check per stage and records nothing.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.histograms = {}
+        self.gauges = {}
+        self.lock = threading.Lock()
+        self.server = None
+
+    def enable(self):
+        self.enabled = True
+
+    def span(self, stage: str):
+        if not self.enabled:
+            return NOOP_SPAN
+        return _Span(self, stage)
+
+    def observe(self, stage: str, seconds: float):
+        if not self.enabled:
+            return
+        with self.lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram()
+            histogram.observe(seconds)
+
+    def gauge(self, name: str, help_text: str, read):
+        """Register a gauge whose value is read by calling `read()` at render time."""
+        with self.lock:
+            self.gauges[name] = (help_text, read)
+
+    def render(self) -> str:
+        """Render all histograms and gauges in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {STAGE_METRIC} Time spent in each validator pipeline stage.",
+            f"# TYPE {STAGE_METRIC} histogram",
+        ]
+        with self.lock:
+            for stage, histogram in sorted(self.histograms.items()):
+                bounds = [str(bound) for bound in histogram.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, histogram.cumulative_counts()):
+                    lines.append(f'{STAGE_METRIC}_bucket{{stage="{stage}",le="{bound}"}} {count}')
+                lines.append(f'{STAGE_METRIC}_sum{{stage="{stage}"}} {histogram.sum}')
+                lines.append(f'{STAGE_METRIC}_count{{stage="{stage}"}} {histogram.count}')
+            gauges = sorted(self.gauges.items())
+        for name, (help_text, read) in gauges:
+            try:
+                value = read()
+            except Exception:
+                continue
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {value}"]
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int, host: str = "0.0.0.0"):
+        """Enable collection and serve `GET /metrics` from a daemon thread."""
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.enable()
+        self.server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True, name="metrics").start()
+        bt.logging.info(f"\033[1;32m📈 Serving stage metrics on http://{host}:{port}/metrics\033[0m")
+
+
+def resident_memory_bytes() -> int:
+    """Current RSS of this process; falls back to the peak RSS where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+METRICS = MetricsRegistry()
+METRICS.gauge("logicnet_process_resident_memory_bytes", "Resident set size of the process.", resident_memory_bytes)
+
+
+def span(stage: str):
+    """Time a pipeline stage: `with span("dendrite_query"): ...`."""
+    return METRICS.span(stage)
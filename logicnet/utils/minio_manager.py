@@ -9,6 +9,7 @@ class MinioManager:
         self.minio_endpoint = minio_endpoint
         self.access_key = access_key
         self.secret_key = secret_key
+        self.existing_buckets = set()
         
         self.minio_client = self.initialize_minio_client()
 
@@ -22,26 +23,35 @@ class MinioManager:
         )
     
     def ensure_bucket_exists(self, bucket_name):
-        """Check if bucket exists, create if it doesn't."""
+        """Check if bucket exists, create if it doesn't. Checked once per bucket."""
+        if bucket_name in self.existing_buckets:
+            return
         try:
             if not self.minio_client.bucket_exists(bucket_name):
                 self.minio_client.make_bucket(bucket_name)
                 print(f"Bucket '{bucket_name}' created")
             else:
                 print(f"Bucket '{bucket_name}' already exists")
+            self.existing_buckets.add(bucket_name)
         except S3Error as e:
             print(f"Error checking/creating bucket: {e}")
             raise
 
-    def upload_file(self, file_path, bucket_name, minio_folder_path):
-        """Upload a single file to MinIO."""
+    def upload_file(self, file_path, bucket_name, minio_folder_path, object_name=None, content_type="application/octet-stream", part_size=0):
+        """Upload a single file to MinIO. Files larger than part_size (min 5 MiB) are sent as a multipart upload."""
         self.ensure_bucket_exists(bucket_name)
         try:
-            object_name = os.path.basename(file_path)
+            object_name = object_name or os.path.basename(file_path)
             if not os.path.exists(file_path):
                 print(f"File '{file_path}' not found, skipping")
                 return False
-            self.minio_client.fput_object(bucket_name, f"{minio_folder_path}/{object_name}", file_path)
+            self.minio_client.fput_object(
+                bucket_name,
+                f"{minio_folder_path}/{object_name}",
+                file_path,
+                content_type=content_type,
+                part_size=part_size,
+            )
             print(f"Uploaded '{file_path}' to bucket '{bucket_name}' as '{object_name}'")
             return True
         except S3Error as e:
@@ -0,0 +1,195 @@
+import os
+import gc
+import sys
+import json
+import time
+import resource
+import threading
+import tracemalloc
+import bittensor as bt
+from collections import Counter
+from contextlib import nullcontext
+
+SAMPLE_INTERVAL = 0.05
+DUMP_INTERVAL = 300
+MAX_STACK_DEPTH = 64
+TOP_N = 30
+# Frames recorded per traced allocation. One is enough for per-line statistics and keeps the
+# always-on tracing cheap.
+ALLOC_TRACE_FRAMES = 1
+
+
+class SamplingProfiler:
+    """
+    Low-overhead wall-clock sampling profiler for the whole validator process.
+
+    A daemon thread wakes every `sample_interval` seconds and records the Python stack of every
+    other thread via `sys._current_frames()`: the main loop, the per-batch asyncio event loop
+    threads, the correctness ThreadPoolExecutor workers and the background writers. Every
+    `dump_interval` seconds it writes, into `output_dir`:
+
+    - `stacks-<ts>.folded`: folded stacks ("thread;module:function;... count"), loadable by
+      flamegraph.pl, speedscope or inferno.
+    - `stats-<ts>.json`: top functions by self and inclusive samples, process CPU time and max RSS
+      of the window, and the object types that grew most since the previous dump.
+
+    tracemalloc runs for as long as the profiler does, keeping `ALLOC_TRACE_FRAMES` frames per
+    allocation. `trace_allocations(label)` compares snapshots taken before and after the wrapped
+    block and writes the largest growth to `alloc-<label>-<ts>.txt`; allocations made by other
+    threads meanwhile are included. Disabled, it returns a no-op context manager.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.output_dir = None
+        self.lock = threading.Lock()
+        self.stacks = Counter()
+        self.self_samples = Counter()
+        self.inclusive_samples = Counter()
+        self.num_samples = 0
+        self.previous_types = None
+        self.snapshot_lock = threading.Lock()
+
+    def start(self, output_dir: str, sample_interval: float = SAMPLE_INTERVAL, dump_interval: float = DUMP_INTERVAL):
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.sample_interval = sample_interval
+        self.dump_interval = dump_interval
+        # Started once and never stopped, so overlapping traced blocks cannot switch it off under
+        # each other. Left alone if something else (e.g. PYTHONTRACEMALLOC) already runs it.
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(ALLOC_TRACE_FRAMES)
+        self.enabled = True
+        threading.Thread(target=self._run, daemon=True, name="sampling-profiler").start()
+        bt.logging.info(
+            f"\033[1;34m🔬 Sampling profiler writing to {output_dir} every {dump_interval}s\033[0m"
+        )
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        window_start = time.time()
+        cpu_start = time.process_time()
+        while True:
+            time.sleep(self.sample_interval)
+            try:
+                self._sample(own_ident)
+            except Exception as e:
+                bt.logging.debug(f"Profiler sample failed: {e}")
+            if time.time() - window_start >= self.dump_interval:
+                cpu_seconds = time.process_time() - cpu_start
+                try:
+                    self.dump(time.time() - window_start, cpu_seconds)
+                except Exception as e:
+                    bt.logging.warning(f"Failed to write profile dump: {e}")
+                window_start = time.time()
+                cpu_start = time.process_time()
+
+    def _sample(self, own_ident: int):
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            functions = []
+            while frame is not None and len(functions) < MAX_STACK_DEPTH:
+                code = frame.f_code
+                module = os.path.splitext(os.path.basename(code.co_filename))[0]
+                functions.append(f"{module}:{code.co_name}")
+                frame = frame.f_back
+            if not functions:
+                continue
+            thread_name = thread_names.get(ident, str(ident))
+            # Pool worker names carry an index (ThreadPoolExecutor-0_3); group them per pool.
+            thread_name = thread_name.rsplit("_", 1)[0] if thread_name.startswith("ThreadPoolExecutor") else thread_name
+            functions.reverse()
+            with self.lock:
+                self.stacks[";".join([thread_name] + functions)] += 1
+                self.self_samples[functions[-1]] += 1
+                for function in set(functions):
+                    self.inclusive_samples[function] += 1
+                self.num_samples += 1
+
+    def dump(self, window_seconds: float, cpu_seconds: float):
+        with self.lock:
+            stacks, self.stacks = self.stacks, Counter()
+            self_samples, self.self_samples = self.self_samples, Counter()
+            inclusive_samples, self.inclusive_samples = self.inclusive_samples, Counter()
+            num_samples, self.num_samples = self.num_samples, 0
+        timestamp = time.strftime("%Y%m%d-%H%M%S")
+
+        with open(os.path.join(self.output_dir, f"stacks-{timestamp}.folded"), "w") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+        type_counts = Counter(type(obj).__name__ for obj in gc.get_objects())
+        growth = Counter()
+        if self.previous_types is not None:
+            growth = Counter({name: count - self.previous_types.get(name, 0) for name, count in type_counts.items()})
+        self.previous_types = type_counts
+
+        stats = {
+            "window_seconds": round(window_seconds, 1),
+            "process_cpu_seconds": round(cpu_seconds, 2),
+            "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+            "samples": num_samples,
+            "sample_interval": self.sample_interval,
+            "top_self": self._top(self_samples),
+            "top_inclusive": self._top(inclusive_samples),
+            "object_growth": dict(growth.most_common(TOP_N)),
+        }
+        with open(os.path.join(self.output_dir, f"stats-{timestamp}.json"), "w") as f:
+            json.dump(stats, f, indent=2)
+        bt.logging.info(
+            f"\033[1;34m🔬 Profile window: {stats['process_cpu_seconds']}s CPU, max RSS {stats['max_rss_mb']} MB, "
+            f"top: {list(stats['top_self'])[:5]}\033[0m"
+        )
+
+    def _top(self, samples: Counter) -> dict:
+        # Wall-clock seconds spent in each function, estimated from the sample counts.
+        return {
+            function: round(count * self.sample_interval, 2)
+            for function, count in samples.most_common(TOP_N)
+        }
+
+    def trace_allocations(self, label: str):
+        if not self.enabled:
+            return nullcontext()
+        return _AllocationTrace(self, label)
+
+
+class _AllocationTrace:
+    def __init__(self, profiler: SamplingProfiler, label: str):
+        self.profiler = profiler
+        self.label = label
+
+    def __enter__(self):
+        self.before = self._take_snapshot()
+        self.start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            after = self._take_snapshot()
+            if self.before is None or after is None:
+                raise RuntimeError("tracemalloc is not tracing")
+            current, _ = tracemalloc.get_traced_memory()
+            diff = after.compare_to(self.before, "lineno")[:TOP_N]
+            timestamp = time.strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(self.profiler.output_dir, f"alloc-{self.label}-{timestamp}.txt")
+            with open(path, "w") as f:
+                f.write(f"{self.label}: {round(time.time() - self.start, 3)}s, traced {round(current / 2**20, 2)} MB\n")
+                for stat in diff:
+                    f.write(f"{stat}\n")
+        except Exception as e:
+            bt.logging.warning(f"Failed to write allocation snapshot for {self.label}: {e}")
+        return False
+
+    def _take_snapshot(self):
+        # Snapshots copy every live trace; taking them one at a time bounds the memory spent on them.
+        with self.profiler.snapshot_lock:
+            if not tracemalloc.is_tracing():
+                return None
+            snapshot = tracemalloc.take_snapshot()
+        return snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+
+
+PROFILER = SamplingProfiler()
@@ -1,49 +1,96 @@
+import threading
+import numpy as np
 import bittensor as bt
-import torch
+from collections import OrderedDict
 
 MIN_RATE_LIMIT = 2
 MAX_RATE_LIMIT = 80
 
 
-def get_rate_limit_per_validator(
-    metagraph,
+def compute_rate_limit_per_validator(
+    total_stake,
     epoch_volume: int,
     min_stake: int,
-    log: bool = True,
 ) -> dict:
     """
     Calculate the rate limit for each validator based on the epoch volume and the stake of the validators.
     The rate limit is the number of requests that a validator can process in a single epoch.
     """
-    all_stakes = [stake for stake in metagraph.total_stake.tolist()]
-    all_uids = [uid for uid in range(len(all_stakes))]
-    valid_stakes = [stake for stake in all_stakes if stake >= min_stake]
-    valid_uids = [uid for uid, stake in zip(all_uids, all_stakes) if stake >= min_stake]
+    all_stakes = np.asarray(total_stake, dtype=np.float32).reshape(-1)
+    is_valid = all_stakes >= min_stake
 
-    if not valid_stakes:
+    if not is_valid.any():
         bt.logging.warning(
             (
                 f"No validators with stake greater than {min_stake} found. "
                 "Assigning equal volume to all validators."
                 f"Total volume: {epoch_volume}"
-                f"Metagraph stake: {metagraph.total_stake.tolist()}"
+                f"Metagraph stake: {all_stakes.tolist()}"
             )
         )
-        valid_uids = all_uids
-        valid_stakes = [0] * len(all_stakes)
-        min_stake = 0
+        valid_uids = np.arange(len(all_stakes))
+        valid_stakes = np.zeros(len(all_stakes), dtype=np.float32)
+    else:
+        valid_uids = np.flatnonzero(is_valid)
+        valid_stakes = all_stakes[is_valid]
 
-    valid_stakes = torch.tensor(valid_stakes) + 1e-4
+    valid_stakes = valid_stakes + np.float32(1e-4)
     normalized_valid_stakes = valid_stakes / valid_stakes.sum()
-    volume_per_validator = epoch_volume * normalized_valid_stakes
-    volume_per_validator = torch.floor(volume_per_validator)
-    volume_per_validator = dict(zip(valid_uids, volume_per_validator.tolist()))
-    for uid, volume in volume_per_validator.items():
-        if metagraph.total_stake[uid] >= min_stake:
-            volume_per_validator[uid] = min(MAX_RATE_LIMIT, max(MIN_RATE_LIMIT, volume))
+    volume_per_validator = np.floor(np.float32(epoch_volume) * normalized_valid_stakes)
+    # Every validator kept here has at least min_stake (or min_stake was dropped to 0), so all are clamped.
+    volume_per_validator = np.clip(volume_per_validator, MIN_RATE_LIMIT, MAX_RATE_LIMIT)
+    return dict(zip(valid_uids.tolist(), volume_per_validator.tolist()))
+
+
+class RateLimitTable:
+    """
+    Per-validator rate limits, computed once per metagraph block and cached by
+    (block, epoch_volume, min_stake). The metagraph block only moves when the metagraph is
+    re-synced, so repeated lookups between syncs never recompute the table.
+
+    Returned tables are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self.tables = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, metagraph, epoch_volume: int, min_stake: int, log: bool = False) -> dict:
+        key = (int(metagraph.block), epoch_volume, min_stake)
+        with self.lock:
+            table = self.tables.get(key)
+            if table is not None:
+                self.tables.move_to_end(key)
+                return table
+
+        table = compute_rate_limit_per_validator(metagraph.total_stake, epoch_volume, min_stake)
         if log:
             bt.logging.info(
-                f"Volume for {uid}-validator: stake: {metagraph.total_stake[uid]}, volume: {volume_per_validator[uid]}"
+                f"Rate limit table at block {key[0]} for epoch volume {epoch_volume}: {table}"
             )
+        with self.lock:
+            self.tables[key] = table
+            while len(self.tables) > self.maxsize:
+                self.tables.popitem(last=False)
+        return table
+
+    def lookup(self, metagraph, uid: int, epoch_volume: int, min_stake: int, default=MIN_RATE_LIMIT):
+        """Rate limit of a single validator uid."""
+        return self.get(metagraph, epoch_volume, min_stake).get(uid, default)
 
-    return volume_per_validator
+
+RATE_LIMIT_TABLE = RateLimitTable()
+
+
+def get_rate_limit_per_validator(
+    metagraph,
+    epoch_volume: int,
+    min_stake: int,
+    log: bool = True,
+) -> dict:
+    """
+    Calculate the rate limit for each validator based on the epoch volume and the stake of the validators.
+    Served from the shared RATE_LIMIT_TABLE, so it is only recomputed when the metagraph block changes.
+    """
+    return RATE_LIMIT_TABLE.get(metagraph, epoch_volume, min_stake, log=log)
@@ -1,6 +1,11 @@
-from .challenger.challenger import LogicChallenger
-from .miner_manager import MinerManager, MinerInfo
-from .rewarder import LogicRewarder
+import importlib
+
+_EXPORTS = {
+    "LogicChallenger": ".challenger.challenger",
+    "MinerManager": ".miner_manager",
+    "MinerInfo": ".miner_manager",
+    "LogicRewarder": ".rewarder",
+}
 
 __all__ = [
     "MinerManager",
@@ -8,3 +13,16 @@ __all__ = [
     "LogicRewarder",
     "MinerInfo",
 ]
+
+
+def __getattr__(name):
+    # Resolved on first access: the rewarder alone pulls in torch, sympy and sentence_transformers.
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,44 +1,68 @@
 import os
 import openai
-import random
 import re
+import time
 import uuid
-import requests
+import queue
+import threading
+from collections import deque
 from logicnet.protocol import LogicSynapse
 from logicnet.validator.prompt import REPRHASE_CODE_TASK_TEMPLATE
 import bittensor as bt
 from .human_noise import get_condition
+from .rephrase_cache import RephraseCache, REPHRASE_CACHE_SIZE
+from .dataset_provider import DatasetProvider
+from .task_source import TaskSource, TaskPoolSource, LocalTaskBank, TASK_BANK_MAX_TASKS, parse_dataset_weights
 from logicnet.utils.model_selector import model_selector
-from datasets import load_dataset
+from logicnet.utils.metrics import span
+from logicnet.validator.llm_accounting import LLM_ACCOUNTANT
 from typing import Tuple
 
-DATASET_WEIGHT = [60,20,20]
+# Persona variants kept per question. Task-pool questions rarely repeat, so extra variants are only
+# generated for questions that come back, and only within the background budget below. Cached
+# variants are served to other personas only once the question has this many.
+REPHRASE_VARIANTS_PER_QUESTION = 3
+# Background rephrasings per hour spent on extra variants of repeated questions
+REPHRASE_PREFILL_PER_HOUR = 60
 
 class LogicChallenger:
     def __init__(self, model_pool: dict, validator_mode: bool = True):
         self.model_pool = model_pool
-        self.retry_count = 0
         self.task_pool_url = os.getenv("TASK_POOL_URL")
-        if not self.task_pool_url:
-            raise ValueError("TASK_POOL_URL is not set")
-        self.access_token = None
+        task_bank_path = os.getenv("TASK_BANK_PATH")
+        if not self.task_pool_url and not task_bank_path:
+            raise ValueError("Neither TASK_POOL_URL nor TASK_BANK_PATH is set")
         self.validator_mode = validator_mode
 
-    def _login(self):
-        """Login to TaskPoolServer to get access token"""
-        try:
-            response = requests.post(
-                f"{self.task_pool_url}/auth/login",
-                json={
-                    "username": os.getenv("VALIDATOR_USERNAME"),
-                    "password": os.getenv("VALIDATOR_PASSWORD")
-                }
+        # Task sources are tried in order: the remote task pool (mirrored into the local bank when
+        # both are configured), then the local task bank during task-pool outages.
+        self.task_bank = None
+        if task_bank_path:
+            self.task_bank = LocalTaskBank(
+                task_bank_path,
+                dataset_weights=parse_dataset_weights(os.getenv("TASK_BANK_WEIGHTS", "")),
+                max_tasks=int(os.getenv("TASK_BANK_MAX_TASKS") or TASK_BANK_MAX_TASKS),
+            )
+        self.task_sources: list[TaskSource] = []
+        if self.task_pool_url:
+            self.task_sources.append(TaskPoolSource(self.task_pool_url, task_bank=self.task_bank))
+        if self.task_bank is not None:
+            self.task_sources.append(self.task_bank)
+        self.dummy_dataset = DatasetProvider(os.getenv("DUMMY_DATASET_PATH") or "openai/gsm8k")
+
+        self.rephrase_cache = None
+        rephrase_cache_path = os.getenv("REPHRASE_CACHE_PATH")
+        if rephrase_cache_path:
+            self.rephrase_cache = RephraseCache(
+                rephrase_cache_path,
+                max_entries=int(os.getenv("REPHRASE_CACHE_SIZE", REPHRASE_CACHE_SIZE)),
             )
-            self.access_token = response.json()["access_token"]
-        except Exception as e:
-            bt.logging.error(f"Failed to login to TaskPoolServer: {e}")
-            self.access_token = None
-            raise
+            self.rephrase_variants = int(os.getenv("REPHRASE_VARIANTS_PER_QUESTION", REPHRASE_VARIANTS_PER_QUESTION))
+            self.rephrase_prefill_per_hour = int(os.getenv("REPHRASE_PREFILL_PER_HOUR", REPHRASE_PREFILL_PER_HOUR))
+            self.rephrase_prefill_times = deque()
+            self.rephrase_queue = queue.Queue(maxsize=1024)
+            if self.rephrase_variants > 1 and self.rephrase_prefill_per_hour > 0:
+                threading.Thread(target=self._fill_rephrase_cache, daemon=True).start()
 
     def __call__(self, synapse: LogicSynapse) -> LogicSynapse:
         if self.validator_mode:
@@ -46,13 +70,8 @@ class LogicChallenger:
         return self.get_dummy_challenge(synapse)
     
     def get_dummy_challenge(self, synapse: LogicSynapse):
-        ds = load_dataset("openai/gsm8k", "main")
-        bt.logging.debug("Generating problem using GSM8K dataset.")
-        data_set = ds['train']
-        bt.logging.info(f"Loaded GSM8K dataset with {len(data_set['question'])} entries")
-        random_index = random.randint(0, len(data_set['question']) - 1)
-        question = data_set['question'][random_index]
-        answer = data_set['answer'][random_index]
+        bt.logging.debug(f"Generating problem using {self.dummy_dataset.path} dataset.")
+        question, answer = self.dummy_dataset.sample()
         raw_question = f"Find the solution of this question:\n---\n{question}\n---\n"
 
         # Revise the problem
@@ -77,7 +96,10 @@ class LogicChallenger:
 
         # Revise the problem
         conditions: dict = get_condition()
-        revised_logic_question: str = self.get_revised_logic_question(atom_logic_question, conditions)
+        with span("rephrase"):
+            revised_logic_question: str = self.get_revised_logic_question(
+                atom_logic_question, conditions, task_uid=unique_uid
+            )
         
         # Log the raw question, revised question, and answer with UID
         bt.logging.debug(f"[{unique_uid}] Raw question: {atom_logic_question}")
@@ -93,58 +115,80 @@ class LogicChallenger:
 
     def get_atom_logic_problem(self) -> Tuple[str, str]:
         """
-        Retrieve a random logic problem (question and answer) from TaskPoolServer.
+        Retrieve a random logic problem (question and answer) from the configured task sources.
         Returns:
             (atom_logic_question, atom_logic_answer) as a tuple of strings.
         """
+        for task_source in self.task_sources:
+            try:
+                with span("task_fetch"):
+                    return task_source.get_task()
+            except Exception as e:
+                bt.logging.error(f"Error fetching task from {type(task_source).__name__}: {e}")
+
+        bt.logging.error("No task source available. Returning a default question and answer.")
+        return (
+            "A triangle has interior angles A, B, and C. If A + B + C represents the sum of these angles in degrees, find the value of A + B + C.",
+            "180"
+        )
+
+    def get_revised_logic_question(self, logic_question: str, conditions: dict, task_uid: str = None) -> str:
+        """
+        Rephrase the question as the given persona. When the rephrase cache is enabled, the cached
+        rephrasing for this persona is served if there is one, and a random cached variant once the
+        question has `rephrase_variants` of them. Otherwise the question is rephrased inline as the
+        persona and cached; questions that come back also get their remaining variants generated
+        in the background.
+        """
+        if self.rephrase_cache is None:
+            return self._rephrase_with_llm(logic_question, conditions, task_uid)
+
+        cached = self.rephrase_cache.get(logic_question, conditions)
+        num_variants = 0
+        if cached is None:
+            num_variants = self.rephrase_cache.count(logic_question)
+            if num_variants >= self.rephrase_variants:
+                cached, _ = self.rephrase_cache.sample(logic_question)
+        if cached is not None:
+            bt.logging.debug("Serving revised question from rephrase cache.")
+            return cached
+
+        revised_question = self._rephrase_with_llm(logic_question, conditions, task_uid)
+        self.rephrase_cache.put(logic_question, conditions, revised_question)
+        if num_variants:
+            # A repeated question: generate its remaining variants off the request path.
+            for _ in range(self.rephrase_variants - num_variants - 1):
+                self._schedule_rephrase(logic_question)
+        return revised_question
+
+    def _schedule_rephrase(self, logic_question: str):
+        """Queue a rephrasing with a fresh persona for the background filler, dropping it if the queue is full."""
+        if self.rephrase_variants <= 1 or self.rephrase_prefill_per_hour <= 0:
+            return
         try:
-            if not self.access_token:
-                self._login()
-            if not self.access_token:
-                raise ValueError("Failed to get access token")
-
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-            response = requests.get(
-                f"{self.task_pool_url}/tasks/random",
-                headers=headers
-            )
-            
-            # Check for authentication/authorization errors
-            if response.status_code in [401, 403]:
-                bt.logging.warning("Authentication/Authorization error. Attempting to re-login...")
-                self._login()  # Re-login to get new token
-                headers = {"Authorization": f"Bearer {self.access_token}"}
-                response = requests.get(
-                    f"{self.task_pool_url}/tasks/random",
-                    headers=headers
-                )
-            
-            response.raise_for_status()
-            task_data = response.json()
-            
-            atom_question = task_data["question"]
-            atom_answer = task_data["answer"]
-            
-            if atom_question is None or atom_answer is None:
-                raise ValueError("Failed to get atom logic problem")
-            
-            bt.logging.debug("Successfully fetched task from TaskPoolServer")
-            return atom_question, atom_answer
-            
-        except Exception as e:
-            bt.logging.error(f"Error fetching task from TaskPoolServer: {e}")
-            bt.logging.error(f"Current Access Token: {self.access_token}")
-            self.retry_count += 1
-            self._login()
-            if self.retry_count > 3:
-                bt.logging.error("Max retries reached. Returning a default question and answer.")
-                return (
-                    "A triangle has interior angles A, B, and C. If A + B + C represents the sum of these angles in degrees, find the value of A + B + C.",
-                    "180"
-                )
-            return self.get_atom_logic_problem()
+            self.rephrase_queue.put_nowait((logic_question, get_condition()))
+        except queue.Full:
+            pass
+
+    def _fill_rephrase_cache(self):
+        while True:
+            logic_question, conditions = self.rephrase_queue.get()
+            if self.rephrase_cache.count(logic_question) >= self.rephrase_variants:
+                continue
+            now = time.time()
+            while self.rephrase_prefill_times and now - self.rephrase_prefill_times[0] > 3600:
+                self.rephrase_prefill_times.popleft()
+            if len(self.rephrase_prefill_times) >= self.rephrase_prefill_per_hour:
+                # Over budget: drop the request, the question keeps serving its existing variants.
+                continue
+            self.rephrase_prefill_times.append(now)
+            try:
+                revised_question = self._rephrase_with_llm(logic_question, conditions)
+                self.rephrase_cache.put(logic_question, conditions, revised_question)
+            except Exception as e:
+                bt.logging.warning(f"Failed to fill rephrase cache: {e}")
 
-    def get_revised_logic_question(self, logic_question: str, conditions: dict) -> str:
+    def _rephrase_with_llm(self, logic_question: str, conditions: dict, task_uid: str = None) -> str:
         if "python" in logic_question.lower() or "gen-code" in logic_question.lower():
             messages = [
                 {
@@ -183,7 +227,11 @@ class LogicChallenger:
             bt.logging.debug(f"Initiating request with model '{model}' at base URL '{base_url}'.")
 
             try:
-                response = openai_client.chat.completions.create(
+                response = LLM_ACCOUNTANT.create(
+                    openai_client,
+                    "rephrase",
+                    task_uid,
+                    attempt=attempt,
                     model=model,
                     messages=messages,
                     max_tokens=1024,
@@ -0,0 +1,57 @@
+import random
+import threading
+import bittensor as bt
+from typing import Tuple
+from datasets import load_dataset
+
+LOCAL_DATASET_FORMATS = {
+    ".jsonl": "json",
+    ".json": "json",
+    ".parquet": "parquet",
+}
+
+
+class DatasetProvider:
+    """
+    Question/answer dataset loaded once and sampled by row index.
+
+    `path` is either a Hugging Face dataset id (default GSM8K) or a local JSONL/Parquet task file.
+    Both are backed by a memory-mapped Arrow table, so sampling a row never materializes whole columns.
+    """
+
+    def __init__(
+        self,
+        path: str = "openai/gsm8k",
+        name: str = "main",
+        split: str = "train",
+        question_field: str = "question",
+        answer_field: str = "answer",
+    ):
+        self.path = path
+        self.name = name
+        self.split = split
+        self.question_field = question_field
+        self.answer_field = answer_field
+        self.dataset = None
+        self.lock = threading.Lock()
+
+    def _load(self):
+        with self.lock:
+            if self.dataset is not None:
+                return self.dataset
+            extension = "." + self.path.rsplit(".", 1)[-1].lower() if "." in self.path else ""
+            if extension in LOCAL_DATASET_FORMATS:
+                dataset = load_dataset(
+                    LOCAL_DATASET_FORMATS[extension], data_files=self.path, split="train"
+                )
+            else:
+                dataset = load_dataset(self.path, self.name, split=self.split)
+            bt.logging.info(f"Loaded dataset {self.path} with {len(dataset)} entries")
+            self.dataset = dataset
+            return dataset
+
+    def sample(self) -> Tuple[str, str]:
+        """Return the (question, answer) of a random row."""
+        dataset = self.dataset if self.dataset is not None else self._load()
+        row = dataset[random.randrange(len(dataset))]
+        return row[self.question_field], row[self.answer_field]
@@ -0,0 +1,121 @@
+import os
+import time
+import random
+import sqlite3
+import hashlib
+import threading
+from typing import Optional, Tuple
+
+REPHRASE_CACHE_SIZE = 50000
+
+
+class RephraseCache:
+    """
+    Disk-backed pool of persona rephrasings keyed by (question hash, profile, mood, tone).
+    Backed by SQLite so it survives restarts; the least recently served rephrasings are evicted
+    once the pool grows past `max_entries`.
+    """
+
+    def __init__(self, path: str, max_entries: int = REPHRASE_CACHE_SIZE):
+        self.path = os.path.expanduser(path)
+        self.max_entries = max_entries
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self.lock:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS rephrasings ("
+                "question_hash TEXT, profile TEXT, mood TEXT, tone TEXT, "
+                "text TEXT, created_at REAL, last_used REAL, "
+                "PRIMARY KEY (question_hash, profile, mood, tone))"
+            )
+            columns = [row[1] for row in self.conn.execute("PRAGMA table_info(rephrasings)")]
+            if "last_used" not in columns:
+                # Caches written before LRU eviction only tracked creation time.
+                self.conn.execute("ALTER TABLE rephrasings ADD COLUMN last_used REAL")
+                self.conn.execute("UPDATE rephrasings SET last_used = created_at")
+            self.conn.execute("DROP INDEX IF EXISTS idx_created_at")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_last_used ON rephrasings (last_used)"
+            )
+            self.conn.commit()
+            self.size = self.conn.execute("SELECT COUNT(*) FROM rephrasings").fetchone()[0]
+
+    @staticmethod
+    def hash_question(question: str) -> str:
+        return hashlib.sha256(question.encode("utf-8")).hexdigest()
+
+    def get(self, question: str, conditions: dict) -> Optional[str]:
+        """Return the rephrasing for this exact persona, if cached."""
+        key = (
+            self.hash_question(question),
+            conditions["profile"],
+            conditions["mood"],
+            conditions["tone"],
+        )
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT text FROM rephrasings "
+                "WHERE question_hash = ? AND profile = ? AND mood = ? AND tone = ?",
+                key,
+            ).fetchone()
+            if row:
+                self._touch(key)
+        return row[0] if row else None
+
+    def count(self, question: str) -> int:
+        """Number of cached persona variants for a question."""
+        with self.lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM rephrasings WHERE question_hash = ?",
+                (self.hash_question(question),),
+            ).fetchone()[0]
+
+    def sample(self, question: str) -> Optional[Tuple[str, dict]]:
+        """Return a random cached rephrasing of the question and the persona that produced it."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT text, profile, mood, tone FROM rephrasings WHERE question_hash = ?",
+                (self.hash_question(question),),
+            ).fetchall()
+            if not rows:
+                return None
+            text, profile, mood, tone = random.choice(rows)
+            self._touch((self.hash_question(question), profile, mood, tone))
+        return text, {"profile": profile, "mood": mood, "tone": tone}
+
+    def _touch(self, key: tuple):
+        """Mark a rephrasing as just served. Must be called with the lock held."""
+        self.conn.execute(
+            "UPDATE rephrasings SET last_used = ? "
+            "WHERE question_hash = ? AND profile = ? AND mood = ? AND tone = ?",
+            (time.time(), *key),
+        )
+        self.conn.commit()
+
+    def put(self, question: str, conditions: dict, text: str):
+        now = time.time()
+        with self.lock:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO rephrasings "
+                "(question_hash, profile, mood, tone, text, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.hash_question(question),
+                    conditions["profile"],
+                    conditions["mood"],
+                    conditions["tone"],
+                    text,
+                    now,
+                    now,
+                ),
+            )
+            self.size += cursor.rowcount
+            if self.size > self.max_entries:
+                self.conn.execute(
+                    "DELETE FROM rephrasings WHERE rowid IN "
+                    "(SELECT rowid FROM rephrasings ORDER BY last_used LIMIT ?)",
+                    (self.size - self.max_entries,),
+                )
+                self.size = self.max_entries
+            self.conn.commit()
@@ -0,0 +1,272 @@
+import os
+import time
+import random
+import sqlite3
+import hashlib
+import argparse
+import threading
+import requests
+import bittensor as bt
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional, Tuple
+
+# Tasks kept per dataset; once a dataset is full, new tasks replace random old ones
+TASK_BANK_MAX_TASKS = 100000
+# Dataset recorded for task-pool tasks whose payload does not name one
+TASK_POOL_DATASET = "task_pool"
+# Seconds to wait for the TaskPoolServer to answer a request
+TASK_POOL_REQUEST_TIMEOUT = 10
+# Seconds the TaskPoolServer is skipped after a failed fetch, so outages fall through to the task bank
+TASK_POOL_COOLDOWN = 60
+
+
+class TaskSource(ABC):
+    """A source of atom logic problems for the challenger."""
+
+    @abstractmethod
+    def get_task(self) -> Tuple[str, str]:
+        """Return a (question, answer) tuple. Raise if no task can be produced."""
+        ...
+
+    def get_task_with_dataset(self) -> Tuple[Optional[str], str, str]:
+        """Return a (dataset, question, answer) tuple; dataset is None if the source does not know it."""
+        question, answer = self.get_task()
+        return None, question, answer
+
+
+class LocalTaskBank(TaskSource):
+    """
+    On-disk indexed task bank backed by SQLite.
+
+    Every task gets a dense per-dataset index, so sampling is a weighted dataset pick followed by a
+    primary-key lookup on (dataset, idx) instead of an ORDER BY RANDOM() scan. A dataset holds at most
+    `max_tasks` tasks; past that, a new task overwrites a random slot so the index stays dense.
+
+    The bank also keeps the last cheat words fetched from the task pool, so rewards can still be
+    checked against them while the task pool is unreachable.
+    """
+
+    def __init__(self, path: str, dataset_weights: Optional[dict] = None, max_tasks: int = TASK_BANK_MAX_TASKS):
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.dataset_weights = dataset_weights or {}
+        self.max_tasks = max(1, max_tasks)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self.lock:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS tasks ("
+                "dataset TEXT, idx INTEGER, question_hash TEXT UNIQUE, question TEXT, answer TEXT, "
+                "PRIMARY KEY (dataset, idx))"
+            )
+            self.conn.execute("CREATE TABLE IF NOT EXISTS cheat_words (content TEXT PRIMARY KEY)")
+            self.conn.commit()
+            self.dataset_sizes = dict(
+                self.conn.execute("SELECT dataset, COUNT(*) FROM tasks GROUP BY dataset").fetchall()
+            )
+        bt.logging.info(f"Loaded task bank {self.path} with datasets {self.dataset_sizes}")
+
+    def __len__(self):
+        return sum(self.dataset_sizes.values())
+
+    def add_tasks(self, tasks: Iterable[Tuple[str, str, str]]) -> int:
+        """Insert (dataset, question, answer) tasks, skipping questions already in the bank."""
+        inserted = 0
+        with self.lock:
+            for dataset, question, answer in tasks:
+                question_hash = hashlib.sha256(question.encode("utf-8")).hexdigest()
+                if self.conn.execute(
+                    "SELECT 1 FROM tasks WHERE question_hash = ?", (question_hash,)
+                ).fetchone():
+                    continue
+                size = self.dataset_sizes.get(dataset, 0)
+                if size < self.max_tasks:
+                    self.conn.execute(
+                        "INSERT INTO tasks VALUES (?, ?, ?, ?, ?)",
+                        (dataset, size, question_hash, question, str(answer)),
+                    )
+                    self.dataset_sizes[dataset] = size + 1
+                else:
+                    self.conn.execute(
+                        "UPDATE tasks SET question_hash = ?, question = ?, answer = ? WHERE dataset = ? AND idx = ?",
+                        (question_hash, question, str(answer), dataset, random.randrange(size)),
+                    )
+                inserted += 1
+            self.conn.commit()
+        return inserted
+
+    def set_cheat_words(self, cheat_words: Iterable[str]):
+        """Replace the stored cheat words."""
+        with self.lock:
+            self.conn.execute("DELETE FROM cheat_words")
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO cheat_words VALUES (?)", [(word,) for word in cheat_words]
+            )
+            self.conn.commit()
+
+    def get_cheat_words(self) -> list[str]:
+        with self.lock:
+            return [row[0] for row in self.conn.execute("SELECT content FROM cheat_words").fetchall()]
+
+    def mirror(self, source: TaskSource, count: int, dataset: str = TASK_POOL_DATASET) -> int:
+        """Pull `count` tasks from another source into the bank, under their own dataset if known."""
+        tasks = []
+        for _ in range(count):
+            try:
+                task_dataset, question, answer = source.get_task_with_dataset()
+            except Exception as e:
+                bt.logging.warning(f"Stopped mirroring tasks: {e}")
+                break
+            tasks.append((task_dataset or dataset, question, answer))
+        return self.add_tasks(tasks)
+
+    def _pick_dataset(self) -> str:
+        datasets = [dataset for dataset, size in self.dataset_sizes.items() if size > 0]
+        if not datasets:
+            raise ValueError("Task bank is empty")
+        weights = [self.dataset_weights.get(dataset, 1) for dataset in datasets]
+        if not any(weights):
+            weights = [1] * len(datasets)
+        return random.choices(datasets, weights=weights)[0]
+
+    def get_task(self) -> Tuple[str, str]:
+        _, question, answer = self.get_task_with_dataset()
+        return question, answer
+
+    def get_task_with_dataset(self) -> Tuple[str, str, str]:
+        dataset = self._pick_dataset()
+        idx = random.randrange(self.dataset_sizes[dataset])
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT question, answer FROM tasks WHERE dataset = ? AND idx = ?",
+                (dataset, idx),
+            ).fetchone()
+        if row is None:
+            raise ValueError(f"Task {dataset}/{idx} not found in task bank")
+        return dataset, row[0], row[1]
+
+
+class TaskPoolSource(TaskSource):
+    """
+    Remote TaskPoolServer. If a task bank is given, every fetched task is written through to it,
+    so the local bank keeps mirroring the task pool while it is reachable.
+
+    After a failed fetch the server is skipped for `cooldown` seconds: `get_task` raises right away
+    and the challenger falls through to the task bank instead of paying for doomed requests.
+    """
+
+    def __init__(
+        self,
+        task_pool_url: str,
+        task_bank: Optional[LocalTaskBank] = None,
+        max_retries: int = 3,
+        cooldown: float = TASK_POOL_COOLDOWN,
+    ):
+        self.task_pool_url = task_pool_url
+        self.task_bank = task_bank
+        self.max_retries = max_retries
+        self.cooldown = cooldown
+        self.unavailable_until = 0.0
+        self.access_token = None
+
+    def _login(self):
+        """Login to TaskPoolServer to get access token"""
+        try:
+            response = requests.post(
+                f"{self.task_pool_url}/auth/login",
+                json={
+                    "username": os.getenv("VALIDATOR_USERNAME"),
+                    "password": os.getenv("VALIDATOR_PASSWORD")
+                },
+                timeout=TASK_POOL_REQUEST_TIMEOUT,
+            )
+            self.access_token = response.json()["access_token"]
+        except Exception as e:
+            bt.logging.error(f"Failed to login to TaskPoolServer: {e}")
+            self.access_token = None
+            raise
+
+    def _fetch_task(self) -> dict:
+        if not self.access_token:
+            self._login()
+        if not self.access_token:
+            raise ValueError("Failed to get access token")
+
+        headers = {"Authorization": f"Bearer {self.access_token}"}
+        response = requests.get(
+            f"{self.task_pool_url}/tasks/random", headers=headers, timeout=TASK_POOL_REQUEST_TIMEOUT
+        )
+
+        # Check for authentication/authorization errors
+        if response.status_code in [401, 403]:
+            bt.logging.warning("Authentication/Authorization error. Attempting to re-login...")
+            self._login()  # Re-login to get new token
+            headers = {"Authorization": f"Bearer {self.access_token}"}
+            response = requests.get(
+                f"{self.task_pool_url}/tasks/random", headers=headers, timeout=TASK_POOL_REQUEST_TIMEOUT
+            )
+
+        response.raise_for_status()
+        return response.json()
+
+    def get_task(self) -> Tuple[str, str]:
+        _, question, answer = self.get_task_with_dataset()
+        return question, answer
+
+    def get_task_with_dataset(self) -> Tuple[str, str, str]:
+        if time.monotonic() < self.unavailable_until:
+            raise RuntimeError(
+                f"TaskPoolServer skipped for {round(self.unavailable_until - time.monotonic())}s after a failure"
+            )
+        last_error = None
+        for attempt in range(self.max_retries):
+            try:
+                task_data = self._fetch_task()
+                atom_question = task_data["question"]
+                atom_answer = task_data["answer"]
+                if atom_question is None or atom_answer is None:
+                    raise ValueError("Failed to get atom logic problem")
+
+                bt.logging.debug("Successfully fetched task from TaskPoolServer")
+                dataset = task_data.get("dataset") or TASK_POOL_DATASET
+                if self.task_bank is not None:
+                    self.task_bank.add_tasks([(dataset, atom_question, atom_answer)])
+                return dataset, atom_question, atom_answer
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # The server is unreachable; retrying right away would fail the same way.
+                bt.logging.error(f"TaskPoolServer is unreachable: {e}")
+                last_error = e
+                break
+            except Exception as e:
+                bt.logging.error(f"Error fetching task from TaskPoolServer (attempt {attempt + 1}): {e}")
+                last_error = e
+        self.unavailable_until = time.monotonic() + self.cooldown
+        raise RuntimeError(f"Failed to fetch task from TaskPoolServer: {last_error}")
+
+
+def parse_dataset_weights(weights: str) -> dict:
+    """Parse "gsm8k:60,mmlu:20" into {"gsm8k": 60.0, "mmlu": 20.0}."""
+    dataset_weights = {}
+    for item in weights.split(","):
+        if ":" in item:
+            dataset, weight = item.rsplit(":", 1)
+            dataset_weights[dataset.strip()] = float(weight)
+    return dataset_weights
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Mirror TaskPoolServer tasks into a local task bank.")
+    parser.add_argument("--task_bank_path", type=str, default=os.getenv("TASK_BANK_PATH"))
+    parser.add_argument("--count", type=int, default=1000)
+    args = parser.parse_args()
+    if not args.task_bank_path:
+        raise ValueError("TASK_BANK_PATH is not set")
+
+    task_bank = LocalTaskBank(
+        args.task_bank_path, max_tasks=int(os.getenv("TASK_BANK_MAX_TASKS") or TASK_BANK_MAX_TASKS)
+    )
+    inserted = task_bank.mirror(TaskPoolSource(os.getenv("TASK_POOL_URL")), args.count)
+    bt.logging.info(f"Mirrored {inserted} new tasks into {args.task_bank_path}")
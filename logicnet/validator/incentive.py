@@ -0,0 +1,159 @@
+import os
+import json
+
+# Fields of a reward log kept in memory; the text fields only go to disk.
+NUMERIC_LOG_FIELDS = ("task_uid", "miner_uid", "reward", "correctness", "similarity", "process_time")
+SPILL_MAX_BYTES = 64 * 1024 * 1024
+# New representative logs buffered before they are appended to the spill file
+SPILL_BATCH_SIZE = 256
+
+
+def strip_reward_log(log: dict) -> dict:
+    """Keep the numeric fields of a reward log and drop the question, answer and reasoning text."""
+    return {field: log.get(field) for field in NUMERIC_LOG_FIELDS}
+
+
+def incentive_formula(rank):
+    """Cubic incentive curve over the rank, scaled to be roughly within [0, 1]."""
+    reward_value = -1.038e-7 * rank**3 + 6.214e-5 * rank**2 - 0.0129 * rank - 0.0118
+    # Scale up the reward value between 0 and 1
+    scaled_reward_value = reward_value + 1
+    return scaled_reward_value
+
+
+def apply_reward_scale(uids, rewards, reward_scales):
+    """Scale positive rewards based on miner volume: reward * (0.9 + 0.1 * reward_scale)."""
+    for i, uid in enumerate(uids):
+        if rewards[i] > 0:
+            rewards[i] = rewards[i] * (0.9 + 0.1 * reward_scales[uid])
+    return rewards
+
+
+class EpochAccumulator:
+    """
+    Per-UID running reward sum and count for one epoch.
+
+    Instead of every batch's reward logs, it keeps two numbers and one stripped representative log
+    (the UID's first of the epoch) per UID, so memory is bounded by the number of UIDs rather than
+    by the loop length. With `spill_path`, the full representative logs are appended to that JSONL
+    file, which is rotated to `<spill_path>.1` once it passes `spill_max_bytes`. Logs are buffered
+    and only written when there are new ones, in batches of `SPILL_BATCH_SIZE` and at the end of
+    the epoch.
+    """
+
+    def __init__(self, spill_path: str = None, spill_max_bytes: int = SPILL_MAX_BYTES):
+        self.spill_path = spill_path
+        self.spill_max_bytes = spill_max_bytes
+        self.pending_spill = []
+        self.reset()
+
+    def reset(self):
+        self.flush()
+        self.sums = {}
+        self.counts = {}
+        self.logs = {}
+
+    def __len__(self):
+        return len(self.sums)
+
+    def uids(self) -> list[int]:
+        return list(self.sums)
+
+    def add(self, uids, rewards, reward_logs):
+        """Fold one rewarded batch into the running sums."""
+        for uid, reward, log in zip(uids, rewards, reward_logs):
+            # Same left-to-right addition as sum() over the epoch's rewards, so means are bit-identical.
+            self.sums[uid] = self.sums.get(uid, 0) + reward
+            self.counts[uid] = self.counts.get(uid, 0) + 1
+            if uid not in self.logs:
+                self.logs[uid] = strip_reward_log(log)
+                if self.spill_path:
+                    self.pending_spill.append(log)
+        if len(self.pending_spill) >= SPILL_BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Append buffered representative logs to the spill file. Does nothing when none are new."""
+        if not self.pending_spill:
+            return
+        logs, self.pending_spill = self.pending_spill, []
+        try:
+            if os.path.getsize(self.spill_path) > self.spill_max_bytes:
+                os.replace(self.spill_path, f"{self.spill_path}.1")
+        except FileNotFoundError:
+            pass
+        with open(self.spill_path, "a") as f:
+            for log in logs:
+                f.write(json.dumps(log, default=str) + "\n")
+
+    def prune(self, uids):
+        """Forget UIDs that left the metagraph or changed hands mid-epoch."""
+        for uid in uids:
+            self.sums.pop(uid, None)
+            self.counts.pop(uid, None)
+            self.logs.pop(uid, None)
+
+    def incentive_rewards(self):
+        """
+        Returns:
+            tuple[list[int], list[float], list[dict]]: UIDs in first-seen order, their incentive
+                rewards and one stripped representative reward log per UID.
+        """
+        self.flush()
+        final_uids = list(self.sums)
+        ## compute mean value of rewards
+        final_rewards = [self.sums[uid] / self.counts[uid] for uid in final_uids]
+        representative_logs = [self.logs[uid] for uid in final_uids]
+        return final_uids, rank_incentive_rewards(final_rewards), representative_logs
+
+
+def rank_incentive_rewards(final_rewards):
+    """Map the mean reward of every UID to its incentive reward through its rank."""
+    ## set the rewards to 0 if the mean is negative
+    final_rewards = [reward if reward > 0 else 0 for reward in final_rewards]
+
+    # Now proceed with the incentive rewards calculation on these mean attempts
+    original_rewards = list(enumerate(final_rewards))
+    # Sort and rank as before, but now we're dealing with mean attempts.
+
+    # Sort rewards in descending order based on the score
+    sorted_rewards = sorted(original_rewards, key=lambda x: x[1], reverse=True)
+
+    # Calculate ranks, handling ties
+    ranks = []
+    for i, (reward_id, score) in enumerate(sorted_rewards):
+        rank = i + 1
+        ranks.append((reward_id, rank, score))
+
+    # Restore the original order
+    ranks.sort(key=lambda x: x[0])
+
+    incentive_rewards = []
+    for _, rank, score in ranks:
+        ## only give reward top 160 miners, set 0 reward for 90 bad miners
+        if score > 0.3 and rank <= 160:
+            incentive_rewards.append(incentive_formula(rank))
+        else:
+            incentive_rewards.append(incentive_formula(250)) # add smallest reward for top 90 bad miners
+
+    return incentive_rewards
+
+
+def compute_incentive_rewards(uids, rewards, reward_logs):
+    """
+    Calculate incentive rewards based on the rank.
+    Get the incentive rewards for the valid responses using the cubic function and valid_rewards rank.
+
+    Args:
+        uids (list[list[int]]): Miner UIDs of every rewarded batch in the epoch.
+        rewards (list[list[float]]): Rewards of every batch, aligned with `uids`.
+        reward_logs (list[list[dict]]): Reward logs of every batch, aligned with `uids`.
+
+    Returns:
+        tuple[list[int], list[float], list[dict]]: Final UIDs, their incentive rewards and one
+            stripped representative reward log per UID.
+    """
+    accumulator = EpochAccumulator()
+    for batch_uids, batch_rewards, batch_logs in zip(uids, rewards, reward_logs):
+        accumulator.add(batch_uids, batch_rewards, batch_logs)
+    return accumulator.incentive_rewards()
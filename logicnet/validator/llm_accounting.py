@@ -0,0 +1,169 @@
+import os
+import json
+import time
+import threading
+import bittensor as bt
+
+FLUSH_INTERVAL = 60
+# USD per 1K (prompt, completion) tokens. Models missing here (e.g. self-hosted vLLM) cost 0.
+# Override with a JSON file of the same shape via LLM_PRICES_PATH.
+DEFAULT_PRICES = {
+    "gpt-4o": (0.0025, 0.01),
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-4.1": (0.002, 0.008),
+    "gpt-4.1-mini": (0.0004, 0.0016),
+}
+
+
+class _Usage:
+    __slots__ = ("calls", "retries", "errors", "prompt_tokens", "completion_tokens", "latency", "cost")
+
+    def __init__(self):
+        self.calls = 0
+        self.retries = 0
+        self.errors = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.latency = 0.0
+        self.cost = 0.0
+
+    def add(self, other: "_Usage"):
+        for field in self.__slots__:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "errors": self.errors,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "latency": round(self.latency, 3),
+            "cost": round(self.cost, 6),
+        }
+
+
+class LLMAccountant:
+    """
+    Usage accounting for validator LLM calls.
+
+    `create()` wraps `chat.completions.create` on any OpenAI-compatible client and records
+    tokens, latency, retries and errors per (call_site, task_uid, model). Counters are kept in
+    memory; when `path` is set they are appended to a JSONL file every `flush_interval` seconds,
+    one compact row per key and window. `report_epoch()` logs and resets the per-call-site totals.
+    """
+
+    def __init__(self, path: str = None, flush_interval: float = FLUSH_INTERVAL, prices: dict = None):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.prices = dict(DEFAULT_PRICES if prices is None else prices)
+        self.pending = {}
+        self.epoch = {}
+        self.epoch_tasks = set()
+        self.epoch_start = time.time()
+        self.lock = threading.Lock()
+        self._flusher = None
+
+    def create(self, openai_client, call_site: str, task_uid: str = None, attempt: int = 0, **kwargs):
+        """Call `openai_client.chat.completions.create(**kwargs)` and account for it. Errors are re-raised."""
+        start = time.time()
+        try:
+            response = openai_client.chat.completions.create(**kwargs)
+        except Exception:
+            self.record(call_site, task_uid, kwargs.get("model"), time.time() - start, None, attempt, error=True)
+            raise
+        self.record(call_site, task_uid, kwargs.get("model"), time.time() - start, getattr(response, "usage", None), attempt)
+        return response
+
+    def record(self, call_site, task_uid, model, latency, usage, attempt=0, error=False):
+        item = _Usage()
+        item.calls = 1
+        item.retries = 1 if attempt > 0 else 0
+        item.errors = 1 if error else 0
+        item.latency = latency
+        if usage is not None:
+            item.prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+            item.completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+            prompt_price, completion_price = self.prices.get(model, (0.0, 0.0))
+            item.cost = (item.prompt_tokens * prompt_price + item.completion_tokens * completion_price) / 1000
+
+        with self.lock:
+            if self.path:
+                self.pending.setdefault((call_site, task_uid, model), _Usage()).add(item)
+            self.epoch.setdefault(call_site, _Usage()).add(item)
+            if task_uid is not None:
+                self.epoch_tasks.add(task_uid)
+        if self.path and self._flusher is None:
+            self._start_flusher()
+
+    def _start_flusher(self):
+        with self.lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True, name="llm-accounting")
+        self._flusher.start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self):
+        """Append the counters collected since the last flush to the JSONL store."""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        if not pending or not self.path:
+            return
+        now = round(time.time(), 3)
+        try:
+            with open(self.path, "a") as f:
+                for (call_site, task_uid, model), usage in pending.items():
+                    row = {"ts": now, "site": call_site, "task": task_uid, "model": model, **usage.to_dict()}
+                    f.write(json.dumps(row, separators=(",", ":")) + "\n")
+        except Exception as e:
+            bt.logging.warning(f"Failed to flush LLM usage to {self.path}: {e}")
+
+    def summary(self) -> dict:
+        """Totals per call site for the current epoch."""
+        total = _Usage()
+        with self.lock:
+            sites = {site: usage.to_dict() for site, usage in self.epoch.items()}
+            num_tasks = len(self.epoch_tasks)
+            for usage in self.epoch.values():
+                total.add(usage)
+        total = total.to_dict()
+        return {
+            "duration": round(time.time() - self.epoch_start, 1),
+            "tasks": num_tasks,
+            "total": total,
+            "cost_per_task": round(total["cost"] / num_tasks, 6) if num_tasks else None,
+            "sites": sites,
+        }
+
+    def report_epoch(self) -> dict:
+        """Log the epoch summary, flush the store and start a new epoch."""
+        summary = self.summary()
+        bt.logging.info(f"\033[1;34m💰 LLM usage this epoch: {json.dumps(summary)}\033[0m")
+        with self.lock:
+            self.epoch = {}
+            self.epoch_tasks = set()
+            self.epoch_start = time.time()
+        self.flush()
+        return summary
+
+
+def load_prices(path: str = None) -> dict:
+    prices = dict(DEFAULT_PRICES)
+    if path:
+        try:
+            with open(path) as f:
+                prices.update({model: tuple(price) for model, price in json.load(f).items()})
+        except Exception as e:
+            bt.logging.warning(f"Failed to load LLM prices from {path}: {e}")
+    return prices
+
+
+LLM_ACCOUNTANT = LLMAccountant(
+    path=os.getenv("LLM_USAGE_PATH") or None,
+    prices=load_prices(os.getenv("LLM_PRICES_PATH")),
+)
@@ -2,10 +2,11 @@ import bittensor as bt
 from logicnet.protocol import Information
 import torch
 from logicnet.utils.volume_setting import (
-    get_rate_limit_per_validator,
+    RATE_LIMIT_TABLE,
     MIN_RATE_LIMIT,
     MAX_RATE_LIMIT,
 )
+from logicnet.validator.incentive import strip_reward_log
 import traceback
 
 NO_OF_RECENT_SCORES = 5
@@ -108,14 +109,12 @@ class MinerManager:
                 miner_state.category = info.get("category", "")
                 miner_state.epoch_volume = info.get("epoch_volume") if info.get("epoch_volume") else 512
                 info = miner_state
-                rate_limit_per_validator: dict = get_rate_limit_per_validator(
+                rate_limit = RATE_LIMIT_TABLE.lookup(
                     metagraph=self.validator.metagraph,
+                    uid=self.validator.uid,
                     epoch_volume=info.epoch_volume,
                     min_stake=self.validator.config.min_stake,
-                    log=False,
-                )
-                rate_limit = rate_limit_per_validator.get(
-                    self.validator.uid, MIN_RATE_LIMIT
+                    default=MIN_RATE_LIMIT,
                 )
                 if rate_limit > MAX_RATE_LIMIT:
                     rate_limit = MAX_RATE_LIMIT
@@ -145,19 +144,53 @@ class MinerManager:
         ]
         return available_uids
 
+    def get_reward_scales(self, uids) -> dict:
+        """Reward scale per UID; UIDs pruned since they were queried get no reward."""
+        all_uids_info = self.all_uids_info
+        return {
+            uid: all_uids_info[uid].reward_scale if uid in all_uids_info else 0.0 for uid in uids
+        }
+
     def update_scores(self, uids, rewards, reward_logs):
         """
         Update miner's scores with new rewards
         """
+        all_uids_info = self.all_uids_info
         for uid, reward, reward_log in zip(uids, rewards, reward_logs):
-            self.all_uids_info[uid].scores.append(reward)
-            self.all_uids_info[uid].scores = self.all_uids_info[uid].scores[
-                -NO_OF_RECENT_SCORES:
-            ]
-            self.all_uids_info[uid].reward_logs.append(reward_log)
-            self.all_uids_info[uid].reward_logs = self.all_uids_info[uid].reward_logs[
-                -NO_OF_RECENT_SCORES:
-            ]
+            info = all_uids_info.get(uid)
+            if info is None:
+                # The UID was pruned while its batch was being scored.
+                continue
+            info.scores.append(reward)
+            info.scores = info.scores[-NO_OF_RECENT_SCORES:]
+            info.reward_logs.append(strip_reward_log(reward_log))
+            info.reward_logs = info.reward_logs[-NO_OF_RECENT_SCORES:]
+
+    def prune(self, replaced_uids=()):
+        """
+        Drop info of UIDs that left the metagraph and reset UIDs whose hotkey was replaced, so a new
+        miner does not inherit the previous owner's scores. Reward logs saved by older versions are
+        stripped down to their numeric fields.
+
+        Query threads iterate `all_uids_info` without a lock, so the pruned dict is built aside and
+        swapped in with a single assignment instead of deleting keys in place.
+        """
+        all_uids = [int(uid.item()) for uid in self.validator.metagraph.uids]
+        current_uids = set(all_uids)
+        replaced_uids = set(replaced_uids)
+        departed_uids = [uid for uid in self.all_uids_info if uid not in current_uids]
+        all_uids_info = {}
+        for uid in all_uids:
+            info = self.all_uids_info.get(uid)
+            if info is None or uid in replaced_uids:
+                info = MinerInfo()
+            info.reward_logs = [strip_reward_log(log) for log in info.reward_logs][-NO_OF_RECENT_SCORES:]
+            all_uids_info[uid] = info
+        self.all_uids = all_uids
+        self.all_uids_info = all_uids_info
+        if departed_uids or replaced_uids:
+            bt.logging.info(f"Pruned departed UIDs {departed_uids} and reset replaced UIDs {sorted(replaced_uids)}")
+        return departed_uids
 
     def get_on_chain_weights(self, category) -> torch.Tensor:
         """
@@ -0,0 +1,107 @@
+import gzip
+import json
+import atexit
+import threading
+import bittensor as bt
+from logicnet.protocol import LogicSynapse
+
+BASE_SYNAPSE_FIELDS = (
+    "logic_question",
+    "raw_logic_question",
+    "ground_truth_answer",
+    "category",
+    "timeout",
+    "task_uid",
+)
+
+
+class EpochRecorder:
+    """
+    Append-only recording of everything the rewarder sees, for offline replay.
+
+    Each rewarded batch becomes one JSON line in a gzip file: the base synapse, the miner UIDs,
+    each response's answer, reasoning, status and process time, and the miners' reward scales.
+    Cheat words are written as a separate line only when they change.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.last_cheat_words = None
+        self.file = gzip.open(path, "at", encoding="utf-8")
+        atexit.register(self.close)
+        bt.logging.info(f"\033[1;34m📼 Recording rewarded batches to {path}\033[0m")
+
+    def record(self, category, base_synapse, uids, responses, reward_scales, cheat_words):
+        record = {
+            "type": "batch",
+            "category": category,
+            "base_synapse": {field: getattr(base_synapse, field) for field in BASE_SYNAPSE_FIELDS},
+            "uids": [int(uid) for uid in uids],
+            "responses": [
+                {
+                    "logic_answer": response.logic_answer,
+                    "logic_reasoning": response.logic_reasoning,
+                    "status_code": response.dendrite.status_code,
+                    "process_time": response.dendrite.process_time,
+                }
+                for response in responses
+            ],
+            "reward_scales": {str(uid): scale for uid, scale in reward_scales.items()},
+        }
+        try:
+            with self.lock:
+                if cheat_words != self.last_cheat_words:
+                    self.last_cheat_words = list(cheat_words)
+                    self._write({"type": "cheat_words", "cheat_words": self.last_cheat_words})
+                self._write(record)
+                self.file.flush()
+        except Exception as e:
+            bt.logging.warning(f"Failed to record batch: {e}")
+
+    def mark_epoch(self):
+        """Mark the end of an epoch, so replay computes incentive rewards over the same batches."""
+        try:
+            with self.lock:
+                self._write({"type": "epoch_end"})
+                self.file.flush()
+        except Exception as e:
+            bt.logging.warning(f"Failed to record epoch end: {e}")
+
+    def _write(self, record: dict):
+        self.file.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+
+    def close(self):
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
+
+
+def read_recording(path: str):
+    """Yield the records of a recording, tolerating a truncated last line from a crashed validator."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    bt.logging.warning(f"Skipping truncated record in {path}")
+        except (EOFError, gzip.BadGzipFile) as e:
+            bt.logging.warning(f"Recording {path} has an incomplete gzip member, stopping there: {e}")
+
+
+def to_synapses(record: dict):
+    """Rebuild (base_synapse, responses) from a batch record."""
+    base_synapse = LogicSynapse(**record["base_synapse"])
+    responses = []
+    for response in record["responses"]:
+        synapse = LogicSynapse(
+            logic_answer=response["logic_answer"],
+            logic_reasoning=response["logic_reasoning"],
+        )
+        synapse.dendrite = bt.TerminalInfo(
+            status_code=response["status_code"],
+            process_time=response["process_time"],
+        )
+        responses.append(synapse)
+    return base_synapse, responses
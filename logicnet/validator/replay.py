@@ -0,0 +1,248 @@
+"""
+Re-score recorded validator batches offline.
+
+    python -m logicnet.validator.replay --recording records.jsonl.gz --output run.json
+    python -m logicnet.validator.replay --recording records.jsonl.gz --llm live --llm-cache llm_cache.json \\
+        --base-url https://api.openai.com/v1 --api-key $OPENAI_API_KEY --model gpt-4o-mini
+    python -m logicnet.validator.replay --recording records.jsonl.gz --output new.json --compare run.json
+
+LLM outputs come from a JSON cache keyed by the request, falling back to a fixed stub answer
+(`--llm stub`, the default) or to a real endpoint (`--llm live`, whose answers are cached). With
+a warm cache or the stub, replays are deterministic, so two code versions can be compared for
+bit-identical rewards.
+"""
+import sys
+import json
+import time
+import hashlib
+import argparse
+import cProfile
+import pstats
+import threading
+from types import SimpleNamespace
+
+import openai
+import bittensor as bt
+
+from logicnet.validator.rewarder import LogicRewarder
+from logicnet.validator.incentive import compute_incentive_rewards, apply_reward_scale
+from logicnet.validator.recorder import read_recording, to_synapses
+
+STUB_RESPONSE = "0.5"
+
+
+class _Completions:
+    def __init__(self, client):
+        self._client = client
+
+    def create(self, **kwargs):
+        return self._client.create(**kwargs)
+
+
+class ReplayLLMClient:
+    """
+    OpenAI-compatible client serving chat completions from a cache keyed by the request.
+    Misses are answered by `live_client` (and cached) when given, otherwise by `stub_response`.
+    """
+
+    def __init__(self, cache_path: str = None, live_client=None, stub_response: str = STUB_RESPONSE):
+        self.cache_path = cache_path
+        self.live_client = live_client
+        self.stub_response = stub_response
+        self.cache = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=_Completions(self))
+        if cache_path:
+            try:
+                with open(cache_path) as f:
+                    self.cache = json.load(f)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def request_key(kwargs: dict) -> str:
+        return hashlib.sha256(json.dumps(kwargs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def create(self, **kwargs):
+        key = self.request_key(kwargs)
+        with self.lock:
+            content = self.cache.get(key)
+            if content is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if content is None:
+            if self.live_client is not None:
+                content = self.live_client.chat.completions.create(**kwargs).choices[0].message.content
+                with self.lock:
+                    self.cache[key] = content
+            else:
+                content = self.stub_response
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=None,
+        )
+
+    def save(self):
+        if self.cache_path and self.live_client is not None:
+            with open(self.cache_path, "w") as f:
+                json.dump(self.cache, f)
+
+
+class ReplayRewarder(LogicRewarder):
+    """LogicRewarder without the task pool: cheat words come from the recording and LLM calls go to `llm_client`."""
+
+    def __init__(self, llm_client, model: str = "replay", warm_embedder: bool = True):
+        # Skip LogicRewarder.__init__, which logs into the task pool for cheat words.
+        self.model_pool = {"openai": ["replay", "replay", model]}
+        self.llm_clients = {}
+        self.llm_clients_lock = threading.Lock()
+        self._embedder = None
+        self._embedder_lock = threading.Lock()
+        if warm_embedder:
+            self._warm_embedder()
+        self.cheat_words = []
+        self.llm_client = llm_client
+
+    def update_all_cheat_words(self):
+        pass
+
+    def _get_openai_client(self, base_url: str, api_key: str):
+        return self.llm_client
+
+
+def replay(recording_path: str, rewarder: LogicRewarder) -> dict:
+    """Score every recorded batch and compute the incentive rewards of every recorded epoch."""
+    batches = []
+    epochs = []
+    epoch_uids, epoch_rewards, epoch_logs = [], [], []
+    num_responses = 0
+    reward_seconds = 0.0
+
+    def close_epoch():
+        final_uids, incentive_rewards, _ = compute_incentive_rewards(epoch_uids, epoch_rewards, epoch_logs)
+        epochs.append({"uids": final_uids, "incentive_rewards": incentive_rewards})
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for record in read_recording(recording_path):
+        if record["type"] == "cheat_words":
+            rewarder.cheat_words = record["cheat_words"]
+            continue
+        if record["type"] == "epoch_end":
+            close_epoch()
+            epoch_uids, epoch_rewards, epoch_logs = [], [], []
+            continue
+
+        base_synapse, responses = to_synapses(record)
+        start = time.perf_counter()
+        uids, rewards, reward_logs = rewarder(record["uids"], responses, base_synapse)
+        reward_seconds += time.perf_counter() - start
+        num_responses += len(responses)
+
+        reward_scales = {int(uid): scale for uid, scale in record["reward_scales"].items()}
+        rewards = apply_reward_scale(uids, rewards, reward_scales)
+        batches.append({"task_uid": base_synapse.task_uid, "uids": uids, "rewards": rewards})
+        if rewards and reward_logs and uids:
+            epoch_uids.append(uids)
+            epoch_rewards.append(rewards)
+            epoch_logs.append(reward_logs)
+
+    if epoch_uids:
+        close_epoch()
+
+    wall_seconds = time.perf_counter() - wall_start
+    return {
+        "recording": recording_path,
+        "batches": batches,
+        "epochs": epochs,
+        "timing": {
+            "wall_seconds": round(wall_seconds, 3),
+            "cpu_seconds": round(time.process_time() - cpu_start, 3),
+            "reward_seconds": round(reward_seconds, 3),
+            "batches": len(batches),
+            "responses": num_responses,
+            "responses_per_second": round(num_responses / reward_seconds, 2) if reward_seconds else None,
+        },
+    }
+
+
+def compare(result: dict, baseline: dict) -> dict:
+    """Compare two replay results reward by reward. Identical means bit-identical floats."""
+    mismatched_batches = 0
+    max_abs_diff = 0.0
+    for batch, base_batch in zip(result["batches"], baseline["batches"]):
+        if batch["uids"] != base_batch["uids"] or batch["rewards"] != base_batch["rewards"]:
+            mismatched_batches += 1
+            for reward, base_reward in zip(batch["rewards"], base_batch["rewards"]):
+                max_abs_diff = max(max_abs_diff, abs(reward - base_reward))
+    identical_epochs = result["epochs"] == baseline["epochs"]
+    return {
+        "identical": (
+            mismatched_batches == 0
+            and identical_epochs
+            and len(result["batches"]) == len(baseline["batches"])
+        ),
+        "batches": len(result["batches"]),
+        "baseline_batches": len(baseline["batches"]),
+        "mismatched_batches": mismatched_batches,
+        "max_abs_reward_diff": max_abs_diff,
+        "identical_incentives": identical_epochs,
+        "speedup": (
+            round(baseline["timing"]["reward_seconds"] / result["timing"]["reward_seconds"], 3)
+            if result["timing"]["reward_seconds"]
+            else None
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded validator batches through the rewarder.")
+    parser.add_argument("--recording", required=True, help="Recording written with --neuron.record_path.")
+    parser.add_argument("--llm", choices=["stub", "live"], default="stub", help="How LLM cache misses are answered.")
+    parser.add_argument("--llm-cache", default=None, help="JSON cache of LLM outputs keyed by request.")
+    parser.add_argument("--stub-response", default=STUB_RESPONSE, help="Answer for every uncached LLM call in stub mode.")
+    parser.add_argument("--base-url", default=None, help="OpenAI-compatible endpoint for --llm live.")
+    parser.add_argument("--api-key", default=None, help="API key for --llm live.")
+    parser.add_argument("--model", default="replay", help="Model name sent with scoring calls.")
+    parser.add_argument("--output", default=None, help="Write the result JSON here instead of stdout.")
+    parser.add_argument("--compare", default=None, help="Baseline result JSON to compare against.")
+    parser.add_argument("--profile", action="store_true", help="Print the top cProfile entries of the replay.")
+    args = parser.parse_args()
+
+    live_client = None
+    if args.llm == "live":
+        live_client = openai.OpenAI(base_url=args.base_url, api_key=args.api_key)
+    llm_client = ReplayLLMClient(args.llm_cache, live_client, args.stub_response)
+    rewarder = ReplayRewarder(llm_client, model=args.model)
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+    result = replay(args.recording, rewarder)
+    if profiler:
+        profiler.disable()
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(30)
+
+    llm_client.save()
+    result["llm_cache"] = {"hits": llm_client.hits, "misses": llm_client.misses}
+    if args.compare:
+        with open(args.compare) as f:
+            result["comparison"] = compare(result, json.load(f))
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+        bt.logging.info(f"Replay written to {args.output}: {json.dumps(result['timing'])}")
+    else:
+        print(output)
+    if args.compare and not result["comparison"]["identical"]:
+        print(json.dumps(result["comparison"], indent=2), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import queue
+import random
+import threading
+import bittensor as bt
+from loguru import logger
+from logicnet.validator.incentive import NUMERIC_LOG_FIELDS
+
+SUMMARY_FIELDS = NUMERIC_LOG_FIELDS
+FULL_FIELDS = SUMMARY_FIELDS + (
+    "miner_response",
+    "miner_reasoning",
+    "question",
+    "logic_question",
+    "ground_truth",
+    "ref_ground_truth",
+)
+
+
+class RewardEventSink:
+    """
+    Structured reward events written off the query path.
+
+    `submit()` only samples and enqueues the batch's reward logs. A background thread drains the
+    queue and writes up to `batch_size` batches as one record of the loguru EVENTS logger
+    (see `check_config`), which rotates and compresses events.log. When the queue is full, batches
+    are dropped and counted rather than blocking the caller.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        sample_rate: float = 1.0,
+        verbosity: str = "summary",
+        max_queue: int = 1024,
+        batch_size: int = 64,
+        flush_interval: float = 1.0,
+    ):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.fields = FULL_FIELDS if verbosity == "full" else SUMMARY_FIELDS
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        # submit() is called from every query thread.
+        self.dropped_lock = threading.Lock()
+        if enabled:
+            threading.Thread(target=self._run, daemon=True, name="reward-events").start()
+
+    def submit(self, reward_logs: list[dict]) -> bool:
+        if not self.enabled or (self.sample_rate < 1 and random.random() >= self.sample_rate):
+            return False
+        try:
+            self.queue.put_nowait(reward_logs)
+            return True
+        except queue.Full:
+            with self.dropped_lock:
+                self.dropped += 1
+            return False
+
+    def _run(self):
+        while True:
+            batches = [self.queue.get()]
+            try:
+                while len(batches) < self.batch_size:
+                    batches.append(self.queue.get(timeout=self.flush_interval))
+            except queue.Empty:
+                pass
+            try:
+                self._write(batches)
+            except Exception as e:
+                bt.logging.warning(f"Failed to write reward events: {e}")
+
+    def _write(self, batches: list[list[dict]]):
+        events = [
+            {field: log.get(field) for field in self.fields}
+            for reward_logs in batches
+            for log in reward_logs
+        ]
+        logger.bind(events=events, dropped=self.dropped).log("EVENTS", "reward_events")
+
+
+def summarize_rewards(uids, rewards, reward_logs) -> str:
+    """One line per miner with its final reward and the correctness, similarity and process time behind it."""
+    logs = {log.get("miner_uid"): log for log in reward_logs}
+    lines = []
+    for uid, reward in zip(uids, rewards):
+        log = logs.get(uid, {})
+        details = ", ".join(
+            f"{field}: {_round(log.get(field))}" for field in ("correctness", "similarity", "process_time")
+        )
+        lines.append(f"UID {uid}: reward: {_round(reward)}, {details}")
+    return "\n".join(lines)
+
+
+def _round(value):
+    return round(value, 3) if isinstance(value, (int, float)) else value
@@ -1,41 +1,79 @@
 import re
 import os
+import hashlib
 import torch
 import openai
 import sympy
 import random
 import requests
+import threading
 import bittensor as bt
 from concurrent import futures
 import time
 
 from logicnet.protocol import LogicSynapse
-from sentence_transformers import SentenceTransformer
 from logicnet.utils.model_selector import model_selector
 from logicnet.utils.regex_helper import extract_numbers
+from logicnet.utils.metrics import span
+from logicnet.validator.llm_accounting import LLM_ACCOUNTANT
+from logicnet.validator.challenger.task_source import LocalTaskBank, TASK_POOL_REQUEST_TIMEOUT
 from logicnet.validator.prompt import DETECT_TRICK_TEMPLATE, CORRECTNESS_TEMPLATE, EXTRACT_ANSWER_PROMPT
 
 SIMILARITY_WEIGHT = 0.3
 CORRECTNESS_WEIGHT = 0.7
 PROCESSING_TIME_WEIGHT = -0.05
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+# Seconds before a scoring LLM request is abandoned; the caller then falls back to its default score
+LLM_REQUEST_TIMEOUT = 60
 
 
 
 class LogicRewarder:
-    def __init__(self, model_pool: dict):
+    def __init__(self, model_pool: dict, warm_embedder: bool = True):
         """
         READ HERE TO LEARN HOW VALIDATOR REWARD THE MINER
+
+        With `warm_embedder`, the embedding model starts loading in the background right away;
+        otherwise it is loaded on first use.
         """
         self.model_pool = model_pool
-        self.embedder = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+        self.llm_clients = {}
+        self.llm_clients_lock = threading.Lock()
+        self._embedder = None
+        self._embedder_lock = threading.Lock()
+        if warm_embedder:
+            self._warm_embedder()
         self.task_pool_url = os.getenv("TASK_POOL_URL")
-        if not self.task_pool_url:
-            raise ValueError("TASK_POOL_URL is not set")
+        task_bank_path = os.getenv("TASK_BANK_PATH")
+        if not self.task_pool_url and not task_bank_path:
+            raise ValueError("Neither TASK_POOL_URL nor TASK_BANK_PATH is set")
+        # Cheat words fetched from the task pool are kept in the task bank and read back from it
+        # while the task pool is unset or unreachable.
+        self.task_bank = LocalTaskBank(task_bank_path) if task_bank_path else None
         self.access_token = None
-        self.cheat_words = []
+        self.cheat_words = self.task_bank.get_cheat_words() if self.task_bank is not None else []
         self.last_update_cheat_words = time.time()
         self.update_all_cheat_words()
 
+    def _warm_embedder(self):
+        """Start loading the embedding model in the background so validator startup does not wait for it."""
+        threading.Thread(target=self._load_embedder, daemon=True, name="embedder-warmup").start()
+
+    def _load_embedder(self):
+        with self._embedder_lock:
+            if self._embedder is None:
+                from sentence_transformers import SentenceTransformer
+
+                self._embedder = SentenceTransformer(EMBEDDING_MODEL)
+        return self._embedder
+
+    @property
+    def embedder(self):
+        """The embedding model. Blocks until the background warm-up finishes, or loads it here if that failed."""
+        if self._embedder is None:
+            return self._load_embedder()
+        return self._embedder
+
     def _login(self):
         """Login to TaskPoolServer to get access token"""
         try:
@@ -44,7 +82,8 @@ class LogicRewarder:
                 json={
                     "username": os.getenv("VALIDATOR_USERNAME"),
                     "password": os.getenv("VALIDATOR_PASSWORD")
-                }
+                },
+                timeout=TASK_POOL_REQUEST_TIMEOUT,
             )
             self.access_token = response.json()["access_token"]
         except Exception as e:
@@ -59,6 +98,9 @@ class LogicRewarder:
 
         bt.logging.info("Updating all cheat words")
         self.last_update_cheat_words = time.time()
+        if not self.task_pool_url:
+            self.cheat_words = self.task_bank.get_cheat_words()
+            return
         try:
             self._login()
             if not self.access_token:
@@ -67,15 +109,27 @@ class LogicRewarder:
             headers = {"Authorization": f"Bearer {self.access_token}"}
             response = requests.get(
                 f"{self.task_pool_url}/cheats",
-                headers=headers
+                headers=headers,
+                timeout=TASK_POOL_REQUEST_TIMEOUT,
             )
             self.cheat_words = [cheat_item["content"] for cheat_item in response.json()]
             bt.logging.info(f"Updated all cheat words: {self.cheat_words}")
+            if self.task_bank is not None:
+                self.task_bank.set_cheat_words(self.cheat_words)
         except Exception as e:
             bt.logging.error(f"Failed to update all cheat words: {e}")
-            self.cheat_words = []
+            self.cheat_words = self.task_bank.get_cheat_words() if self.task_bank is not None else []
+
+    def get_cheat_words(self) -> list[str]:
+        """Refresh the cheat words if due and return the current list.
+
+        `update_all_cheat_words` replaces the list instead of mutating it, so the returned list is
+        a stable snapshot even when another thread refreshes it afterwards.
+        """
+        self.update_all_cheat_words()
+        return self.cheat_words
 
-    def __call__(self, uids, responses: list[LogicSynapse], base_synapse: LogicSynapse):
+    def __call__(self, uids, responses: list[LogicSynapse], base_synapse: LogicSynapse, cheat_words: list[str] = None):
         """Calculate reward for each response using similarity, correctness, and processing time.
 
         Args:
@@ -83,11 +137,13 @@ class LogicRewarder:
             uids (list[int]): List of miner UIDs.
             responses (list[LogicSynapse]): Synapse responses from miners.
             base_synapse (LogicSynapse): Base synapse containing the ground truth and raw logic question.
+            cheat_words (list[str], optional): Cheat words to score with. Defaults to `get_cheat_words()`.
 
         Returns:
             list[float]: List of rewards for each response.
         """
-        self.update_all_cheat_words()
+        if cheat_words is None:
+            cheat_words = self.get_cheat_words()
         # Get the unique task UID from the base_synapse
         task_uid = base_synapse.task_uid
         valid_uids = [
@@ -104,12 +160,22 @@ class LogicRewarder:
         valid_rewards = []
 
         if valid_uids:
-            ref_ground_truth: str = self._get_ground_truth(
-                base_synapse.raw_logic_question
-            )
+            with span("ground_truth"):
+                ref_ground_truth: str = self._get_ground_truth(
+                    base_synapse.raw_logic_question, task_uid=task_uid
+                )
             response_texts = [response.logic_reasoning for response in valid_responses]
-            similarities = self._get_similarity(ref_ground_truth, response_texts)
-            correctness = self._get_correctness(base_synapse, valid_responses)
+
+            # Score each unique (answer, reasoning) pair once and fan the scores out to every UID that sent it
+            unique_indices, response_to_unique = self._group_duplicate_responses(valid_uids, valid_responses)
+            unique_responses = [valid_responses[i] for i in unique_indices]
+            unique_similarities = self._get_similarity(
+                ref_ground_truth, [response.logic_reasoning for response in unique_responses]
+            )
+            with span("correctness"):
+                unique_correctness = self._get_correctness(base_synapse, unique_responses, cheat_words)
+            similarities = [unique_similarities[j] for j in response_to_unique]
+            correctness = [unique_correctness[j] for j in response_to_unique]
             process_times = [
                 response.dendrite.process_time for response in valid_responses
             ]
@@ -170,14 +236,48 @@ class LogicRewarder:
 
         return total_uids, rewards, reward_logs
 
+    def _group_duplicate_responses(self, uids: list[int], responses: list[LogicSynapse]):
+        """Group byte-identical (logic_answer, logic_reasoning) responses.
+
+        Args:
+            uids (list[int]): Miner UIDs of the responses.
+            responses (list[LogicSynapse]): Valid miner responses.
+
+        Returns:
+            tuple[list[int], list[int]]: Index of the first response of each unique group, and for
+                every response the position of its group in that list.
+        """
+        unique_indices = []
+        response_to_unique = []
+        groups = {}
+        for idx, response in enumerate(responses):
+            digest = hashlib.sha256(
+                f"{response.logic_answer}\0{response.logic_reasoning}".encode("utf-8")
+            ).digest()
+            if digest not in groups:
+                groups[digest] = len(unique_indices)
+                unique_indices.append(idx)
+            response_to_unique.append(groups[digest])
+
+        if len(unique_indices) < len(responses):
+            clusters = {}
+            for uid, group in zip(uids, response_to_unique):
+                clusters.setdefault(group, []).append(uid)
+            duplicate_clusters = [cluster for cluster in clusters.values() if len(cluster) > 1]
+            bt.logging.info(
+                f"[DUPLICATES] {len(responses)} responses, {len(unique_indices)} unique. Identical responses from UIDs: {duplicate_clusters}"
+            )
+        return unique_indices, response_to_unique
+
     def _get_correctness(
-        self, base_synapse: LogicSynapse, responses: list[LogicSynapse]
+        self, base_synapse: LogicSynapse, responses: list[LogicSynapse], cheat_words: list[str] = None
     ):
         """Calculate the correctness score for each response.
 
         Args:
             base_synapse (LogicSynapse): The base synapse containing the ground truth and raw logic question.
             responses (list[LogicSynapse]): List of miner responses.
+            cheat_words (list[str], optional): Cheat words to check against. Defaults to `self.cheat_words`.
 
         Returns:
             list[float]: List of correctness scores for each response (float between 0 and 1).
@@ -190,7 +290,7 @@ class LogicRewarder:
         if not api_key:
             raise ValueError("API key is not valid or not provided.")
         
-        openai_client = openai.OpenAI(base_url=base_url, api_key=api_key)
+        openai_client = self._get_llm_client(base_url, api_key)
         bt.logging.info(f"Initiating request with model '{model}' at base URL '{base_url}'.")
 
         ground_truth_answer = base_synapse.ground_truth_answer
@@ -230,6 +330,8 @@ class LogicRewarder:
                                 response=inputs["response"],
                                 model_name=model,
                                 openai_client=openai_client,
+                                task_uid=base_synapse.task_uid,
+                                cheat_words=cheat_words,
                             ),
                             batch_llm_inputs,
                         )
@@ -242,6 +344,22 @@ class LogicRewarder:
                         for idx in indices_for_llm:
                             correctness[idx] = 0.5
         return correctness
+
+    def _get_llm_client(self, base_url: str, api_key: str):
+        """Get the shared client for the scoring endpoint, one per (base_url, api_key).
+
+        Scoring threads reuse its keep-alive connection pool, and vLLM batches their concurrent
+        requests server-side.
+        """
+        key = (base_url, api_key)
+        with self.llm_clients_lock:
+            if key not in self.llm_clients:
+                self.llm_clients[key] = self._get_openai_client(base_url, api_key)
+            return self.llm_clients[key]
+
+    def _get_openai_client(self, base_url: str, api_key: str):
+        """Create the OpenAI-compatible client used for scoring calls. Replay overrides this to stub or cache LLM outputs."""
+        return openai.OpenAI(base_url=base_url, api_key=api_key, timeout=LLM_REQUEST_TIMEOUT)
     
     def clean_response(self, response: str):
         """Clean the response by removing formatting characters.
@@ -258,7 +376,7 @@ class LogicRewarder:
         return response
     
 
-    def _get_correctness_by_llm(self, question: str, ground_truth: str, response: str, model_name: str, openai_client: openai.OpenAI):
+    def _get_correctness_by_llm(self, question: str, ground_truth: str, response: str, model_name: str, openai_client: openai.OpenAI, task_uid: str = None, cheat_words: list[str] = None):
         """Calculate the correctness score for a single response using LLM.
 
         Args:
@@ -266,7 +384,9 @@ class LogicRewarder:
             ground_truth (str): Ground truth answer.
             response (str): Miner's answer.
             model_name (str): Model name for the LLM.
-            openai_client (openai.OpenAI): OpenAI client for API requests.
+            openai_client (openai.OpenAI): Shared OpenAI-compatible client for API requests.
+            task_uid (str): Task the call is accounted to.
+            cheat_words (list[str], optional): Cheat words to check against. Defaults to `self.cheat_words`.
 
         Returns:
             float: Correctness score for the response (float between 0 and 1).
@@ -277,7 +397,7 @@ class LogicRewarder:
         ## check trick case
         try:
             ## check with hard rule
-            for cheat_word in self.cheat_words:
+            for cheat_word in (cheat_words if cheat_words is not None else self.cheat_words):
                 if cheat_word in response.lower():
                     bt.logging.info(f"[CORRECTNESS] Miner response is a cheat word: {response}")
                     return -1
@@ -289,19 +409,23 @@ class LogicRewarder:
             ## check with soft rule
             clone_response = self.clean_response(response)
             clone_response = clone_response.replace("-", " ")
-            response_str = openai_client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": DETECT_TRICK_TEMPLATE.format(
-                            response=clone_response
-                        ),
-                    },
-                ],
-                max_tokens=25,
-                temperature=0,
-            ).choices[0].message.content.strip().lower()
+            with span("correctness_trick"):
+                response_str = LLM_ACCOUNTANT.create(
+                    openai_client,
+                    "correctness_trick",
+                    task_uid,
+                    model=model_name,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": DETECT_TRICK_TEMPLATE.format(
+                                response=clone_response
+                            ),
+                        },
+                    ],
+                    max_tokens=25,
+                    temperature=0,
+                ).choices[0].message.content.strip().lower()
             bt.logging.info(f"[CORRECTNESS] Trick detection: {response_str} ====> {response[:100]}")
             if "yes" in response_str:
                 return -1
@@ -312,41 +436,49 @@ class LogicRewarder:
             if len(response.split()) < 20:
                 extraced_miner_answer = response
             else:
-                extraced_miner_answer = openai_client.chat.completions.create(
+                with span("correctness_extract"):
+                    extraced_miner_answer = LLM_ACCOUNTANT.create(
+                        openai_client,
+                        "correctness_extract",
+                        task_uid,
+                        model=model_name,
+                        messages=[
+                            {
+                                "role": "user",
+                                "content": EXTRACT_ANSWER_PROMPT.format(
+                                    response=response,
+                                    question=question
+                                ),
+                            },
+                        ],
+                        max_tokens=25,
+                        temperature=0,
+                    ).choices[0].message.content.strip().lower()
+                if "not_found" in extraced_miner_answer or "not found" in extraced_miner_answer:
+                    bt.logging.info(f"[CORRECTNESS] Extracted answer not found: {response}")
+                    return 0.0
+                else:
+                    bt.logging.info(f"[CORRECTNESS] Extracted answer: {extraced_miner_answer}")
+
+            with span("correctness_rate"):
+                response_str = LLM_ACCOUNTANT.create(
+                    openai_client,
+                    "correctness_rate",
+                    task_uid,
                     model=model_name,
                     messages=[
                         {
                             "role": "user",
-                            "content": EXTRACT_ANSWER_PROMPT.format(
-                                response=response,
-                                question=question
+                            "content": CORRECTNESS_TEMPLATE.format(
+                                question=question,
+                                ground_truth_answer=ground_truth,
+                                response=extraced_miner_answer
                             ),
                         },
                     ],
-                    max_tokens=25,
+                    max_tokens=15,
                     temperature=0,
                 ).choices[0].message.content.strip().lower()
-                if "not_found" in extraced_miner_answer or "not found" in extraced_miner_answer:
-                    bt.logging.info(f"[CORRECTNESS] Extracted answer not found: {response}")
-                    return 0.0
-                else:
-                    bt.logging.info(f"[CORRECTNESS] Extracted answer: {extraced_miner_answer}")
-
-            response_str = openai_client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": CORRECTNESS_TEMPLATE.format(
-                            question=question,
-                            ground_truth_answer=ground_truth,
-                            response=extraced_miner_answer
-                        ),
-                    },
-                ],
-                max_tokens=15,
-                temperature=0,
-            ).choices[0].message.content.strip().lower()
             bt.logging.info(f"[CORRECTNESS] Rating: {response_str}")
             try:
                 correctness_score = float(response_str)
@@ -423,8 +555,9 @@ class LogicRewarder:
             list[float]: List of similarity scores for each response.
         """
         try:
-            ground_truth_embedding = self.embedder.encode(ground_truth)
-            response_embeddings = self.embedder.encode(responses)
+            with span("embedding"):
+                ground_truth_embedding = self.embedder.encode(ground_truth)
+                response_embeddings = self.embedder.encode(responses)
 
             # Calculate similarity
             similarities = []
@@ -440,11 +573,12 @@ class LogicRewarder:
             bt.logging.warning(f"Failed to calculate similarity.\nError: {e}")
             return [0.5] * len(responses)
 
-    def _get_ground_truth(self, question: str):
+    def _get_ground_truth(self, question: str, task_uid: str = None):
         """Generate self-generated ground truth based on the question.
 
         Args:
             question (str): Raw logic question.
+            task_uid (str): Task the call is accounted to.
 
         Returns:
             str: Self-generated ground truth.
@@ -460,13 +594,17 @@ class LogicRewarder:
         if not api_key:
             raise ValueError("API key is not valid or not provided.")
 
-        openai_client = openai.OpenAI(base_url=base_url, api_key=api_key)
+        openai_client = self._get_llm_client(base_url, api_key)
         bt.logging.info(f"Initiating request with model '{model}' at base URL '{base_url}'.")
 
         response = ""
         for attempt in range(3):  # Retry up to 3 times
             try:
-                response = openai_client.chat.completions.create(
+                response = LLM_ACCOUNTANT.create(
+                    openai_client,
+                    "ground_truth",
+                    task_uid,
+                    attempt=attempt,
                     model=model,
                     messages=messages,
                     max_tokens=300,
@@ -485,10 +623,14 @@ class LogicRewarder:
                         bt.logging.error("No alternative model, base URL, or API key available.")
 
                     else:
-                        openai_client = openai.OpenAI(base_url=base_url, api_key=api_key)
+                        openai_client = self._get_llm_client(base_url, api_key)
                         bt.logging.info(f"Initiating request with model '{model}' at base URL '{base_url}'.")
                         try:
-                            response = openai_client.chat.completions.create(
+                            response = LLM_ACCOUNTANT.create(
+                                openai_client,
+                                "ground_truth",
+                                task_uid,
+                                attempt=attempt + 1,
                                 model=model,
                                 messages=messages,
                                 max_tokens=1024,
@@ -1,17 +1,30 @@
+import os
 import time
+import asyncio
+import threading
 from typing import Tuple
+from collections import Counter
 import bittensor as bt
 from logicnet.base.miner import BaseMinerNeuron
 import logicnet
 from logicnet.protocol import LogicSynapse, Information
-from logicnet.miner.forward import solve
+from logicnet.miner.forward import solve, solve_streaming
+from logicnet.miner.admission import AdmissionController, AdmissionTimeout
+from logicnet.miner.answer_cache import AnswerCache
+from logicnet.miner.backend_pool import BackendPool
 import traceback
-import openai
+
+INFO_PRIORITY = 1e12
+# Longest share of synapse.timeout a request may wait for a free slot; the rest is left for solving it.
+ADMISSION_WAIT_FRACTION = 0.25
+
 
 class Miner(BaseMinerNeuron):
     def __init__(self, config=None):
         super(Miner, self).__init__(config=config)
         self.validator_logs = {}
+        self.hotkey_to_uid = {}
+        self.refresh_hotkey_to_uid()
         self.volume_per_validator = (
             logicnet.utils.volume_setting.get_rate_limit_per_validator(
                 self.metagraph,
@@ -23,29 +36,93 @@ class Miner(BaseMinerNeuron):
             "epoch_volume": self.config.miner.epoch_volume,
             "category": "Logic",
         }
+        # Information polls are answered with this prebuilt response and only counted, never logged per request.
+        self.info_response = dict(self.miner_info)
+        self.info_polls = Counter()
+        # Polls are counted on the axon's thread and read from the main loop.
+        self.info_polls_lock = threading.Lock()
         self.num_processing_requests = 0
         self.total_request_in_interval = 0
+        self.admission = AdmissionController(self.config.miner.max_concurrency)
+        self.answer_cache = None
+        if self.config.miner.cache.enabled:
+            self.answer_cache = AnswerCache(
+                path=self.config.miner.cache.path
+                or os.path.join(self.config.neuron.full_path, "answer_cache"),
+                max_entries=self.config.miner.cache.max_entries,
+                threshold=self.config.miner.cache.threshold,
+            )
         bt.logging.info(f"\033[1;32m🧠 Miner info: {self.miner_info}\033[0m")
-        self.openai_client = openai.AsyncOpenAI(
-            base_url=self.config.miner.llm_client.base_url,
+        self.backend_pool = BackendPool(
+            base_urls=self.config.miner.llm_client.base_urls
+            or [self.config.miner.llm_client.base_url],
             api_key=self.config.miner.llm_client.key,
+            model=self.config.miner.llm_client.model,
         )
 
+    def refresh_hotkey_to_uid(self):
+        """Rebuild the hotkey -> uid lookup used on every request from the current metagraph."""
+        self.hotkey_to_uid = {
+            hotkey: uid for uid, hotkey in enumerate(self.metagraph.hotkeys)
+        }
+
+    def resync_metagraph(self):
+        super().resync_metagraph()
+        self.refresh_hotkey_to_uid()
+
     async def forward(self, synapse: LogicSynapse) -> LogicSynapse:
         """
         Forward pass for the miner neuron. This function is called when a synapse is received by the miner neuron.
         By default, Miner will utilize the LLM API to solve the logic problem.
         """
+        arrival = time.monotonic()
+        question_embedding = None
+        if self.answer_cache is not None:
+            cached, question_embedding = await asyncio.get_running_loop().run_in_executor(
+                None, self.answer_cache.lookup, synapse.logic_question
+            )
+            if cached is not None:
+                synapse.logic_reasoning, synapse.logic_answer = cached
+                bt.logging.info(f"\033[1;32m✅ Served request from answer cache: {self.answer_cache.stats()}\033[0m")
+                return synapse
+
+        max_wait = synapse.timeout * ADMISSION_WAIT_FRACTION
+        try:
+            # Wait for a free slot, higher stake validators first. A request admitted late has no time left to be solved.
+            await asyncio.wait_for(
+                self.admission.acquire(await self.priority(synapse)),
+                timeout=max_wait,
+            )
+        except asyncio.TimeoutError:
+            bt.logging.warning(
+                f"\033[1;35m🛑 Dropping request, no free slot within {round(max_wait, 2)} seconds: {self.admission.stats()}\033[0m"
+            )
+            # Returning the synapse would be reported as a successful empty answer.
+            raise AdmissionTimeout(f"No free slot within {round(max_wait, 2)} seconds")
+
         start_time = time.time()
+        backend = self.backend_pool.acquire()
+        # Only transport and HTTP errors count against the backend, not deadlines or empty answers.
+        backend_errors = []
         try:
             self.num_processing_requests += 1
-            bt.logging.info(f"\033[1;33;44m🚀 Start processing request {self.num_processing_requests}\033[0m")
-            synapse = await solve(
+            bt.logging.info(f"\033[1;33;44m🚀 Start processing request {self.num_processing_requests} on {backend.base_url}\033[0m")
+            solver = solve_streaming if self.config.miner.solve_mode == "stream" else solve
+            synapse = await solver(
                 synapse=synapse,
-                openai_client=self.openai_client,
+                openai_client=backend.client,
                 model=self.config.miner.llm_client.model,
+                deadline=arrival + synapse.timeout,
+                on_backend_error=backend_errors.append,
             )
             self.total_request_in_interval += 1
+            if self.answer_cache is not None and synapse.logic_answer:
+                self.answer_cache.add(
+                    synapse.logic_question,
+                    synapse.logic_reasoning,
+                    synapse.logic_answer,
+                    embedding=question_embedding,
+                )
             
         except Exception as e:
             bt.logging.error(f"\033[1;31m❌ Error in forward: {e}\033[0m")
@@ -53,28 +130,44 @@ class Miner(BaseMinerNeuron):
     
         finally:
             process_time = time.time() - start_time
+            self.backend_pool.release(backend, process_time, success=not backend_errors)
+            self.admission.release(process_time)
             bt.logging.info(f"\033[1;34;47m✅ Served request {self.num_processing_requests}: {round(process_time,2)} seconds\033[0m")
             
         return synapse
 
     async def forward_info(self, synapse: Information) -> Information:
-        synapse.response_dict = self.miner_info
+        synapse.response_dict = self.info_response
         return synapse
 
     async def blacklist_info(self, synapse: Information) -> Tuple[bool, str]:
+        with self.info_polls_lock:
+            self.info_polls[synapse.dendrite.hotkey] += 1
         return False, "All passed!"
 
+    async def priority_info(self, synapse: Information) -> float:
+        # Information polls are answered instantly, never queue them behind LogicSynapse traffic.
+        return INFO_PRIORITY
+
+    def take_info_poll_counts(self) -> dict:
+        """Number of Information polls per validator uid since the last call, and reset the counts."""
+        with self.info_polls_lock:
+            info_polls, self.info_polls = self.info_polls, Counter()
+        return {
+            self.hotkey_to_uid.get(hotkey, hotkey): count
+            for hotkey, count in info_polls.most_common()
+        }
+
     async def blacklist(self, synapse: LogicSynapse) -> Tuple[bool, str]:
-        bt.logging.info(f"synapse in blacklist {synapse}")
         try:
-            if synapse.dendrite.hotkey not in self.metagraph.hotkeys:
+            validator_uid = self.hotkey_to_uid.get(synapse.dendrite.hotkey)
+            if validator_uid is None:
                 # Ignore requests from unrecognized entities.
                 bt.logging.warning(
                     f"\033[1;35m🛑 Blacklisting unrecognized hotkey {synapse.dendrite.hotkey}\033[0m"
                 )
                 return True, "Unrecognized hotkey"
 
-            validator_uid = self.metagraph.hotkeys.index(synapse.dendrite.hotkey)
             stake = self.metagraph.stake[validator_uid].item()
 
             if validator_uid not in self.volume_per_validator:
@@ -82,6 +175,12 @@ class Miner(BaseMinerNeuron):
                     f"\033[1;35m🛑 Blacklisting {validator_uid}-validator has {stake} stake\033[0m"
                 )
                 return True, "Not enough stake"
+            if self.admission.should_reject(float(self.metagraph.S[validator_uid]), synapse.timeout):
+                bt.logging.warning(
+                    f"\033[1;35m🛑 Blacklisting {validator_uid}-validator, miner is overloaded: {self.admission.stats()}\033[0m"
+                )
+                return True, "Miner overloaded"
+
             if logicnet.miner.check_limit(
                 self,
                 uid=validator_uid,
@@ -101,13 +200,13 @@ class Miner(BaseMinerNeuron):
             return False, "All passed!"
 
     async def priority(self, synapse: LogicSynapse) -> float:
-        caller_uid = self.metagraph.hotkeys.index(
+        caller_uid = self.hotkey_to_uid[
             synapse.dendrite.hotkey
-        )  # Get the caller index.
+        ]  # Get the caller index.
         priority = float(
             self.metagraph.S[caller_uid]
         )  # Return the stake as the priority.
-        bt.logging.warning(
+        bt.logging.debug(
             f"\033[1;36m🔝 Prioritizing {synapse.dendrite.hotkey} with value: {priority}\033[0m"
         )
         return priority
@@ -122,8 +221,23 @@ if __name__ == "__main__":
                 bt.logging.info(
                     f"\033[1;32m---Total request in last 5 minutes: {miner.total_request_in_interval}\033[0m"
                 )
+                if miner.answer_cache is not None:
+                    bt.logging.info(f"\033[1;32m---Answer cache: {miner.answer_cache.stats()}\033[0m")
+                bt.logging.info(f"\033[1;32m---LLM backends: {miner.backend_pool.stats()}\033[0m")
+                bt.logging.info(
+                    f"\033[1;32m---Information polls per validator in last 5 minutes: {miner.take_info_poll_counts()}\033[0m"
+                )
                 start_time = time.time()
                 miner.total_request_in_interval = 0
+            if miner.answer_cache is not None:
+                try:
+                    miner.answer_cache.save()
+                except Exception as e:
+                    bt.logging.error(f"\033[1;31m❌ Error saving answer cache: {e}\033[0m")
+            try:
+                miner.backend_pool.run_health_checks()
+            except Exception as e:
+                bt.logging.error(f"\033[1;31m❌ Error checking LLM backends: {e}\033[0m")
             try:
                 miner.volume_per_validator = (
                     logicnet.utils.volume_setting.get_rate_limit_per_validator(
@@ -0,0 +1,277 @@
+import os
+import sys
+import time
+import atexit
+import base64
+import secrets
+import threading
+import subprocess
+import httpx
+import numpy as np
+import bittensor as bt
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.managers import BaseManager
+from logicnet.protocol import LogicSynapse
+from logicnet.validator.incentive import apply_reward_scale
+
+# Number of queued proxy candidates considered per organic request, relative to hedge_k
+CANDIDATE_POOL_FACTOR = 4
+# Seconds between background credential refreshes from the proxy client
+CREDENTIAL_REFRESH_INTERVAL = 600
+# Seconds to wait for the proxy service to answer its health check after launch
+PROXY_STARTUP_TIMEOUT = 120
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+class LatencyTracker:
+    """Rolling window of organic request latencies for tail-latency reporting."""
+
+    def __init__(self, maxlen: int = 1000):
+        self.latencies = deque(maxlen=maxlen)
+        self.total = 0
+        self.failures = 0
+
+    def add(self, latency: float, success: bool):
+        self.latencies.append(latency)
+        self.total += 1
+        if not success:
+            self.failures += 1
+
+    def summary(self) -> dict:
+        if not self.latencies:
+            return {"count": self.total, "failures": self.failures}
+        p50, p90, p99 = np.percentile(np.fromiter(self.latencies, dtype=float), [50, 90, 99])
+        return {
+            "count": self.total,
+            "failures": self.failures,
+            "p50": round(float(p50), 3),
+            "p90": round(float(p90), 3),
+            "p99": round(float(p99), 3),
+            "max": round(max(self.latencies), 3),
+        }
+
+
+class ProxyBridge:
+    """
+    Validator state the organic proxy needs: credentials, proxy query queue, miner scores and axons,
+    and a sink for organic rewards. The proxy only talks to the validator through this object, so it
+    can be called directly when the proxy runs on a validator thread, or over a multiprocessing
+    manager when the proxy runs as its own service.
+
+    Every method is a cheap state lookup or update. Organic responses are queued on one
+    OrganicScorer in the validator process, which reuses the validator's rewarders, so proxy
+    workers never load scoring models or receive the model pool and its API keys.
+    """
+
+    def __init__(self, validator):
+        self.validator = validator
+        self.config = validator.config
+        self.credentials = None
+        self.miner_latency = {}
+        self.latency_tracker = LatencyTracker()
+        self.lock = threading.Lock()
+        self.scorer = OrganicScorer(
+            self,
+            {category: info["rewarder"] for category, info in validator.categories.items()},
+            max_workers=self.config.proxy.max_reward_workers,
+            max_pending=self.config.proxy.max_pending_rewards,
+        )
+
+    def refresh_credentials(self):
+        """Fetch the signed credentials used to authenticate organic requests from the proxy client."""
+        with httpx.Client(timeout=httpx.Timeout(30)) as client:
+            response = client.post(
+                f"{self.config.proxy.proxy_client_url}/get_credentials",
+                json={
+                    "port": self.config.proxy.port,
+                    "uid": self.validator.uid,
+                },
+            )
+        response.raise_for_status()
+        response = response.json()
+        self.credentials = (response["message"], response["signature"])
+
+    def get_credentials(self):
+        """Return (message, base64 signature)."""
+        if self.credentials is None:
+            self.refresh_credentials()
+        return self.credentials
+
+    def start_credential_refresh(self, interval: float = CREDENTIAL_REFRESH_INTERVAL):
+        """Keep credentials fresh from a daemon thread instead of blocking the validator loop on HTTP."""
+
+        def refresh_loop():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.refresh_credentials()
+                    bt.logging.info(
+                        "\033[1;32m🔌 Validator proxy ping to proxy-client successfully\033[0m"
+                    )
+                except Exception:
+                    bt.logging.warning("\033[1;33m⚠️ Warning, proxy can't ping to proxy-client.\033[0m")
+
+        threading.Thread(target=refresh_loop, daemon=True, name="proxy-credentials").start()
+
+    def get_settings(self) -> dict:
+        return {
+            "hedge_k": max(1, self.config.proxy.hedge_k),
+            "hedge_delay": self.config.proxy.hedge_delay,
+            "checking_probability": self.config.proxy.checking_probability,
+        }
+
+    def get_timeout(self, category: str) -> int:
+        return self.validator.categories[category]["timeout"]
+
+    def select_candidates(self, k: int) -> list:
+        """
+        Pick the K miners to race for an organic request. Candidates are drawn from the proxy
+        query queue (so miner rate limits are respected) and ranked by recent score, then latency.
+
+        Returns:
+            list[tuple]: (uid, should_reward, axon, recent scores) per candidate.
+        """
+        candidates = {}
+        with self.lock:
+            for uid, should_reward in self.validator.query_queue.get_query_for_proxy():
+                candidates[uid] = candidates.get(uid, False) or should_reward
+                if len(candidates) >= k * CANDIDATE_POOL_FACTOR:
+                    break
+
+        all_uids_info = self.validator.miner_manager.all_uids_info
+
+        def rank(uid):
+            scores = all_uids_info[uid].scores
+            mean_score = sum(scores) / len(scores) if scores else 0.0
+            return (-mean_score, self.miner_latency.get(uid, float("inf")))
+
+        return [
+            (uid, candidates[uid], self.validator.metagraph.axons[uid], list(all_uids_info[uid].scores))
+            for uid in sorted(candidates, key=rank)[:k]
+        ]
+
+    def record_response(self, uid: int, latency: float):
+        previous = self.miner_latency.get(uid, latency)
+        self.miner_latency[uid] = 0.8 * previous + 0.2 * latency
+
+    def record_request(self, latency: float, success: bool):
+        with self.lock:
+            self.latency_tracker.add(latency, success)
+
+    def stats(self) -> dict:
+        with self.lock:
+            return self.latency_tracker.summary()
+
+    def submit_organic_reward(self, category: str, synapse: dict, response: dict, uid: int) -> bool:
+        """
+        Queue an organic response for scoring. Synapses arrive as plain dicts so only data crosses
+        the bridge. Returns False if the reward queue is full and it was dropped.
+        """
+        return self.scorer.submit(category, LogicSynapse(**synapse), LogicSynapse(**response), uid)
+
+    def apply_organic_rewards(self, uids: list[int], rewards: list[float], reward_logs: list[dict]):
+        """Scale organic rewards by miner volume and fold them into the miner scores."""
+        reward_scales = self.validator.miner_manager.get_reward_scales(uids)
+        rewards = apply_reward_scale(uids, rewards, reward_scales)
+        bt.logging.info(f"Proxy: Updating scores of miners {uids} with rewards {rewards}")
+        self.validator.miner_manager.update_scores(uids, rewards, reward_logs)
+
+
+class OrganicScorer:
+    """
+    Scores organic responses in the validator process with the validator's own rewarders, however
+    many proxy workers feed it.
+
+    Scoring runs on a bounded thread pool; when `max_pending` rewards are already queued, new ones
+    are dropped instead of piling up threads. Only the final rewards cross to the validator.
+    """
+
+    def __init__(self, bridge, rewarders: dict, max_workers: int, max_pending: int):
+        self.bridge = bridge
+        self.rewarders = rewarders
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="organic-reward")
+        self.slots = threading.BoundedSemaphore(max_pending)
+
+    def submit(self, category: str, synapse, response, uid: int) -> bool:
+        """Queue an organic reward. Returns False if the reward queue is full and it was dropped."""
+        if not self.slots.acquire(blocking=False):
+            bt.logging.warning(f"Organic reward queue is full, dropping reward for miner {uid}")
+            return False
+        future = self.executor.submit(self.score, category, synapse, response, uid)
+        future.add_done_callback(lambda _: self.slots.release())
+        return True
+
+    def score(self, category: str, synapse, response, uid: int):
+        try:
+            uids, rewards, reward_logs = self.rewarders[category]([uid], [response], synapse)
+            bt.logging.info(f"Scored organic responses of miners {uids}: {rewards}")
+            self.bridge.apply_organic_rewards(uids, rewards, reward_logs)
+        except Exception as e:
+            bt.logging.error(f"Error in organic reward: {e}")
+
+
+class ProxyBridgeManager(BaseManager):
+    pass
+
+
+def connect_bridge(address: str, authkey: bytes):
+    """Connect to a ProxyBridge served by the validator process."""
+    host, port = address.rsplit(":", 1)
+    ProxyBridgeManager.register("get_bridge")
+    manager = ProxyBridgeManager(address=(host, int(port)), authkey=authkey)
+    manager.connect()
+    return manager.get_bridge()
+
+
+def start_proxy_service(bridge: ProxyBridge, wallet, config) -> subprocess.Popen:
+    """
+    Serve the bridge on a local socket and start the proxy as a separate process running
+    `config.proxy.workers` uvicorn workers, so organic traffic and the synthetic loop no longer
+    share a GIL.
+    """
+    authkey = secrets.token_bytes(32)
+    ProxyBridgeManager.register("get_bridge", callable=lambda: bridge)
+    manager = ProxyBridgeManager(address=("127.0.0.1", 0), authkey=authkey)
+    server = manager.get_server()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.address
+    bt.logging.info(f"Proxy bridge listening on {host}:{port}")
+
+    env = dict(os.environ)
+    env.update(
+        {
+            "PYTHONPATH": os.pathsep.join(filter(None, [REPO_ROOT, env.get("PYTHONPATH")])),
+            "LOGICNET_PROXY_BRIDGE_ADDRESS": f"{host}:{port}",
+            "LOGICNET_PROXY_BRIDGE_AUTHKEY": base64.b64encode(authkey).decode(),
+            "LOGICNET_PROXY_PORT": str(config.proxy.port),
+            "LOGICNET_PROXY_WORKERS": str(config.proxy.workers),
+            "LOGICNET_PROXY_WALLET_NAME": config.wallet.name,
+            "LOGICNET_PROXY_WALLET_HOTKEY": config.wallet.hotkey,
+            "LOGICNET_PROXY_WALLET_PATH": config.wallet.path,
+        }
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-m", "neurons.validator.validator_proxy"],
+        env=env,
+        cwd=REPO_ROOT,
+    )
+    atexit.register(process.terminate)
+    wait_for_proxy(process, config.proxy.port)
+    return process
+
+
+def wait_for_proxy(process: subprocess.Popen, port: int, timeout: float = PROXY_STARTUP_TIMEOUT):
+    """Poll the proxy's /health route until a worker answers, failing early if the service exits."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Proxy service exited with code {process.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=2).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError(f"Proxy service did not become healthy within {timeout}s")
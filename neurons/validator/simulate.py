@@ -0,0 +1,268 @@
+"""
+Synthetic network simulator for the validator's scheduling and scoring path.
+
+Runs QueryQueue, MinerManager and compute_incentive_rewards against a fake metagraph with
+simulated miners on a virtual clock, so whole epochs finish in seconds:
+
+    python -m neurons.validator.simulate --uids 256 1024 4096 --epochs 3 --stake pareto
+
+Per epoch it reports scheduling fairness (Jain's index of queries per unit of rate limit), coverage,
+CPU time of every validator-side stage and traced memory growth. Miner responses are scored with a
+closed-form stand-in for LogicRewarder (no LLM or embedder), so only the validator's own
+bookkeeping is measured.
+"""
+import json
+import math
+import time
+import random
+import argparse
+import tracemalloc
+from types import SimpleNamespace
+
+import numpy as np
+import bittensor as bt
+
+from logicnet.validator.miner_manager import MinerManager
+from logicnet.validator.incentive import compute_incentive_rewards, apply_reward_scale
+from logicnet.validator.rewarder import SIMILARITY_WEIGHT, CORRECTNESS_WEIGHT, PROCESSING_TIME_WEIGHT
+from neurons.validator.core.serving_queue import QueryQueue
+
+TIMEOUT = 64
+# Seconds between batches within an iteration, as in Validator.forward
+BATCH_INTERVAL = 4
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class SimMiner:
+    """A miner with a latency, answer quality and failure profile."""
+
+    def __init__(self, rng: np.random.Generator, failure_rate: float, offline_rate: float):
+        self.online = rng.random() >= offline_rate
+        self.median_latency = float(rng.lognormal(mean=math.log(8), sigma=0.6))
+        self.quality = float(rng.beta(4, 2))
+        self.failure_rate = float(min(1.0, rng.exponential(failure_rate))) if failure_rate else 0.0
+        self.epoch_volume = int(rng.choice([64, 128, 256, 512]))
+
+    def respond(self, rng: np.random.Generator):
+        """Return (success, latency, similarity, correctness) for one query."""
+        latency = float(rng.lognormal(mean=math.log(self.median_latency), sigma=0.4))
+        if not self.online or rng.random() < self.failure_rate or latency > TIMEOUT:
+            return False, min(latency, TIMEOUT), 0.0, 0.0
+        similarity = float(np.clip(rng.normal(self.quality, 0.1), 0, 1))
+        correctness = float(rng.random() < self.quality)
+        return True, latency, similarity, correctness
+
+
+class FakeMetagraph:
+    def __init__(self, n: int, stake: str, rng: np.random.Generator, validators: int):
+        self.n = n
+        self.block = 1
+        self.uids = np.arange(n)
+        self.hotkeys = [f"hotkey-{uid}" for uid in range(n)]
+        self.axons = [SimpleNamespace(uid=uid, hotkey=self.hotkeys[uid]) for uid in range(n)]
+        if stake == "uniform":
+            total_stake = rng.uniform(0, 1e5, size=n)
+        elif stake == "lognormal":
+            total_stake = rng.lognormal(mean=8, sigma=2, size=n)
+        else:
+            total_stake = (rng.pareto(1.2, size=n) + 1) * 1e3
+        # Only a handful of uids hold validator-sized stake.
+        miners = rng.permutation(n)[validators:]
+        total_stake[miners] = np.minimum(total_stake[miners], 100)
+        self.total_stake = total_stake.astype(np.float32)
+
+
+class FakeDendrite:
+    """Answers Information polls from the simulated miners."""
+
+    def __init__(self, miners: dict):
+        self.miners = miners
+
+    def query(self, axons, synapse, deserialize=False, timeout=60):
+        responses = []
+        for axon in axons:
+            miner = self.miners[axon.uid]
+            response_dict = (
+                {"category": "Logic", "epoch_volume": miner.epoch_volume} if miner.online else {}
+            )
+            responses.append(SimpleNamespace(response_dict=response_dict))
+        return responses
+
+
+def jain_index(values) -> float:
+    values = np.asarray(values, dtype=float)
+    if not len(values) or not values.any():
+        return 0.0
+    return float(values.sum() ** 2 / (len(values) * (values ** 2).sum()))
+
+
+class Simulation:
+    def __init__(self, args, n_uids: int):
+        self.args = args
+        self.rng = np.random.default_rng(args.seed)
+        random.seed(args.seed)
+        self.clock = VirtualClock()
+        self.metagraph = FakeMetagraph(n_uids, args.stake, self.rng, args.validators)
+        self.miners = {
+            uid: SimMiner(self.rng, args.failure_rate, args.offline_rate) for uid in range(n_uids)
+        }
+        self.validator = SimpleNamespace(
+            uid=int(np.argmax(self.metagraph.total_stake)),
+            metagraph=self.metagraph,
+            dendrite=FakeDendrite(self.miners),
+            config=SimpleNamespace(min_stake=args.min_stake),
+        )
+        self.miner_manager = MinerManager(self.validator)
+        self.query_queue = QueryQueue()
+
+    def score(self, uid: int):
+        success, latency, similarity, correctness = self.miners[uid].respond(self.rng)
+        if not success:
+            return 0, latency
+        reward = (
+            SIMILARITY_WEIGHT * similarity
+            + CORRECTNESS_WEIGHT * correctness
+            + PROCESSING_TIME_WEIGHT * min(latency / TIMEOUT, 1)
+        )
+        return reward / 2 + 0.5, latency
+
+    def run_epoch(self) -> dict:
+        args = self.args
+        cpu = {}
+
+        def timed(stage, fn, *fn_args):
+            start = time.process_time()
+            result = fn(*fn_args)
+            cpu[stage] = cpu.get(stage, 0.0) + time.process_time() - start
+            return result
+
+        self.metagraph.block += 1
+        epoch_start = self.clock.now
+        timed("update_miners_identity", self.miner_manager.update_miners_identity)
+        all_uids_info = self.miner_manager.all_uids_info
+        timed("update_queue", self.query_queue.update_queue, all_uids_info)
+        proxy_stream = self.query_queue.get_query_for_proxy()
+
+        queried = {}
+        proxied = {}
+        epoch_uids, epoch_rewards, epoch_logs = [], [], []
+        while self.clock.now - epoch_start < args.loop_base_time:
+            start = time.process_time()
+            batches = list(self.query_queue.get_batch_query(args.batch_size, args.batch_number))
+            cpu["get_batch_query"] = cpu.get("get_batch_query", 0.0) + time.process_time() - start
+
+            slowest = 0.0
+            for uids, should_rewards in batches:
+                reward_uids = []
+                rewards = []
+                for uid, should_reward in zip(uids, should_rewards):
+                    queried[uid] = queried.get(uid, 0) + 1
+                    reward, latency = self.score(uid)
+                    slowest = max(slowest, latency)
+                    if should_reward:
+                        reward_uids.append(uid)
+                        rewards.append(reward)
+                if reward_uids:
+                    reward_scales = {uid: all_uids_info[uid].reward_scale for uid in reward_uids}
+                    rewards = timed("apply_reward_scale", apply_reward_scale, reward_uids, rewards, reward_scales)
+                    epoch_uids.append(reward_uids)
+                    epoch_rewards.append(rewards)
+                    epoch_logs.append([{"miner_uid": uid, "reward": r} for uid, r in zip(reward_uids, rewards)])
+            iteration = (len(batches) - 1) * BATCH_INTERVAL + slowest
+
+            # Organic requests arriving during the iteration draw from the proxy queue.
+            for _ in range(int(self.rng.poisson(args.proxy_rate * iteration))):
+                start = time.process_time()
+                uid = next(proxy_stream, None)
+                cpu["get_query_for_proxy"] = cpu.get("get_query_for_proxy", 0.0) + time.process_time() - start
+                if uid is None:
+                    break
+                proxied[uid[0]] = proxied.get(uid[0], 0) + 1
+            self.clock.advance(iteration)
+
+        final_uids, incentive_rewards, representative_logs = timed(
+            "compute_incentive_rewards", compute_incentive_rewards, epoch_uids, epoch_rewards, epoch_logs
+        )
+        timed("update_scores", self.miner_manager.update_scores, final_uids, incentive_rewards, representative_logs)
+        timed("get_model_specific_weights", self.miner_manager.get_model_specific_weights, "Logic")
+
+        valid = [uid for uid, info in all_uids_info.items() if info.category]
+        per_limit = [queried.get(uid, 0) / max(all_uids_info[uid].rate_limit, 1) for uid in valid]
+        return {
+            "virtual_seconds": round(self.clock.now - epoch_start, 1),
+            "valid_miners": len(valid),
+            "queries": sum(queried.values()),
+            "rewarded_responses": sum(len(uids) for uids in epoch_uids),
+            "fairness": round(jain_index(per_limit), 4),
+            "coverage": round(sum(1 for uid in valid if uid in queried) / len(valid), 4) if valid else 0.0,
+            "rewarded_coverage": round(len(final_uids) / len(valid), 4) if valid else 0.0,
+            "proxy_requests": sum(proxied.values()),
+            "cpu_seconds": {stage: round(seconds, 4) for stage, seconds in cpu.items()},
+            "cpu_seconds_total": round(sum(cpu.values()), 4),
+        }
+
+    def run(self) -> dict:
+        tracemalloc.start()
+        wall_start = time.perf_counter()
+        epochs = []
+        baseline = None
+        for _ in range(self.args.epochs):
+            report = self.run_epoch()
+            current, peak = tracemalloc.get_traced_memory()
+            if baseline is None:
+                baseline = current
+            report["memory_mb"] = round(current / 2**20, 2)
+            report["memory_peak_mb"] = round(peak / 2**20, 2)
+            report["memory_growth_mb"] = round((current - baseline) / 2**20, 2)
+            epochs.append(report)
+        tracemalloc.stop()
+        wall_seconds = time.perf_counter() - wall_start
+        virtual_seconds = sum(epoch["virtual_seconds"] for epoch in epochs)
+        return {
+            "uids": self.metagraph.n,
+            "stake": self.args.stake,
+            "wall_seconds": round(wall_seconds, 3),
+            "speedup": round(virtual_seconds / wall_seconds, 1) if wall_seconds else None,
+            "epochs": epochs,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate validator epochs against a synthetic network.")
+    parser.add_argument("--uids", type=int, nargs="+", default=[256, 1024, 4096], help="Network sizes to simulate.")
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--stake", choices=["uniform", "lognormal", "pareto"], default="pareto")
+    parser.add_argument("--validators", type=int, default=64, help="UIDs holding validator-sized stake.")
+    parser.add_argument("--min_stake", type=int, default=10000)
+    parser.add_argument("--failure_rate", type=float, default=0.05, help="Mean per-query failure probability.")
+    parser.add_argument("--offline_rate", type=float, default=0.1, help="Fraction of miners not answering at all.")
+    parser.add_argument("--proxy_rate", type=float, default=0.5, help="Organic requests per virtual second.")
+    parser.add_argument("--loop_base_time", type=int, default=600)
+    parser.add_argument("--batch_size", type=int, default=12)
+    parser.add_argument("--batch_number", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=str, default=None, help="Write the JSON report here instead of stdout.")
+    parser.add_argument("--verbose", action="store_true", help="Keep validator info logs.")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        bt.logging.set_warning()
+
+    results = [Simulation(args, n_uids).run() for n_uids in args.uids]
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
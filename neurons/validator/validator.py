@@ -4,7 +4,6 @@ import asyncio
 load_dotenv()
 import pickle
 import time
-import json
 import re
 import threading
 import datetime
@@ -16,6 +15,7 @@ from copy import deepcopy
 import bittensor as bt
 import logicnet as ln
 from neurons.validator.validator_proxy import ValidatorProxy
+from neurons.validator.core.proxy_bridge import ProxyBridge, start_proxy_service
 from logicnet.base.validator import BaseValidatorNeuron
 from logicnet.validator import MinerManager, LogicChallenger, LogicRewarder
 from logicnet.utils.text_uts import modify_question
@@ -24,7 +24,13 @@ from neurons.validator.core.serving_queue import QueryQueue
 from threading import Lock
 import queue
 from logicnet.utils.minio_manager import MinioManager
-import glob
+from logicnet.utils.log_shipper import LogShipper
+from logicnet.utils.metrics import METRICS, span, resident_memory_bytes
+from logicnet.utils.profiler import PROFILER
+from logicnet.validator.llm_accounting import LLM_ACCOUNTANT
+from logicnet.validator.incentive import EpochAccumulator, apply_reward_scale
+from logicnet.validator.recorder import EpochRecorder
+from logicnet.validator.reward_events import RewardEventSink, summarize_rewards
 
 log_bucket_name = "logs"
 app_name = os.getenv("APP_NAME", "sn35-validator")
@@ -33,8 +39,6 @@ minio_endpoint = os.getenv("MINIO_ENDPOINT")
 access_key = os.getenv("MINIO_ACCESS_KEY")
 secret_key = os.getenv("MINIO_SECRET_KEY")
 pm2_log_dir = os.getenv("PM2_LOG_DIR", "/root/.pm2/logs")
-last_err_file_name = ""
-last_out_file_name = ""
 
 # check if the pm2_log_dir is valid
 if not os.path.exists(pm2_log_dir):
@@ -67,14 +71,6 @@ model_blacklist = [
     "mistralai/Mistral-7B-Instruct"
 ]
 
-def get_latest_previous_log_file(log_files):
-    """Return the second-most-recent log file based on modification time."""
-    if len(log_files) < 2:
-        return None  # Not enough files to have a "previous" file
-    # Sort files by modification time (most recent first)
-    sorted_files = sorted(log_files, key=lambda x: os.path.getmtime(x), reverse=True)
-    return sorted_files[1]  # Second file is the latest previous
-
 class Validator(BaseValidatorNeuron):
     def __init__(self, config=None):
         """
@@ -83,8 +79,36 @@ class Validator(BaseValidatorNeuron):
         super(Validator, self).__init__(config=config)
         bt.logging.info("\033[1;32m🧠 load_state()\033[0m")
 
+        if self.config.neuron.metrics_port:
+            METRICS.serve(self.config.neuron.metrics_port)
+        if self.config.neuron.profile:
+            PROFILER.start(
+                os.path.join(self.config.neuron.full_path, "profile"),
+                sample_interval=self.config.neuron.profile_interval,
+                dump_interval=self.config.neuron.profile_dump_interval,
+            )
+
+        self.reward_events = RewardEventSink(
+            enabled=not self.config.neuron.dont_save_events,
+            sample_rate=self.config.neuron.reward_events_sample_rate,
+            verbosity=self.config.neuron.reward_events_verbosity,
+        )
+
+        self.recorder = None
+        if self.config.neuron.record_path:
+            self.recorder = EpochRecorder(self.config.neuron.record_path)
+
         try:
             self.minio_manager = MinioManager(minio_endpoint, access_key, secret_key)
+            self.log_shipper = LogShipper(
+                self.minio_manager,
+                bucket_name=log_bucket_name,
+                folder=validator_username,
+                log_dir=pm2_log_dir,
+                patterns=[f"*{app_name}*out*.log", f"*{app_name}-error*.log"],
+                manifest_path=os.path.join(self.config.neuron.full_path, "log_manifest.json"),
+            )
+            self.log_shipper.start()
         except Exception as e:
             bt.logging.error(f"Error initializing MinioManager: {e}")
 
@@ -118,7 +142,6 @@ class Validator(BaseValidatorNeuron):
             bt.logging.warning("All models are invalid. Validator cannot proceed.")
             raise ValueError("All models are invalid. Please configure at least one model and restart the validator.")
         
-        self.push_logs_to_minio()
         self.categories = init_category(self.config, self.model_pool)
         self.miner_manager = MinerManager(self)
         self.load_state()
@@ -128,7 +151,16 @@ class Validator(BaseValidatorNeuron):
         self.query_queue = QueryQueue()
         if self.config.proxy.port:
             try:
-                self.validator_proxy = ValidatorProxy(self)
+                self.proxy_bridge = ProxyBridge(self)
+                self.proxy_bridge.refresh_credentials()
+                self.proxy_bridge.start_credential_refresh()
+                if self.config.proxy.workers > 0:
+                    self.proxy_process = start_proxy_service(
+                        self.proxy_bridge, self.wallet, self.config
+                    )
+                else:
+                    self.validator_proxy = ValidatorProxy(self.proxy_bridge, self.wallet)
+                    self.validator_proxy.start_server(self.config.proxy.port)
                 bt.logging.info(
                     "\033[1;32m🟢 Validator proxy started successfully\033[0m"
                 )
@@ -141,6 +173,14 @@ class Validator(BaseValidatorNeuron):
                 )
         self.reward_lock = Lock()
         self.reward_queue = queue.Queue()
+        self.epoch_accumulator = EpochAccumulator(
+            spill_path=os.path.join(self.config.neuron.full_path, "representative_reward_logs.jsonl")
+        )
+        METRICS.gauge(
+            "logicnet_epoch_accumulator_uids",
+            "UIDs with rewards accumulated in the current epoch.",
+            lambda: len(self.epoch_accumulator),
+        )
 
     def forward(self):
         """
@@ -148,14 +188,11 @@ class Validator(BaseValidatorNeuron):
         DEFAULT: 16 miners per batch, 600 seconds per loop.
         """
         # self.store_miner_infomation()
-        self.push_logs_to_minio()
         bt.logging.info("\033[1;34m🔄 Updating available models & uids\033[0m")
         loop_base_time = self.config.loop_base_time  # default is 600s
         self.miner_manager.update_miners_identity()
         self.query_queue.update_queue(self.miner_manager.all_uids_info)
-        self.miner_uids = []
-        self.miner_scores = []
-        self.miner_reward_logs = []
+        self.epoch_accumulator.reset()
 
         # run in 600s
         loop_start = time.time()
@@ -182,74 +219,30 @@ class Validator(BaseValidatorNeuron):
                 thread.join()
 
             # Process all queued results safely
-            with self.reward_lock:
+            with self.reward_lock, PROFILER.trace_allocations("reward_aggregation"):
                 while not self.reward_queue.empty():
                     bt.logging.info(f"\033[1;32m🟢 Update reward logs for miner {uids}")
                     reward_logs, uids, rewards = self.reward_queue.get()
-                    self.miner_reward_logs.append(reward_logs)
-                    self.miner_uids.append(uids)
-                    self.miner_scores.append(rewards)
+                    self.epoch_accumulator.add(uids, rewards, reward_logs)
 
+            METRICS.observe("iteration", time.time() - iter_start)
             bt.logging.info(f"\033[1;32m🟢 Validator iteration completed in {time.time() - iter_start} seconds\033[0m")
         
         # Assign incentive rewards
-        bt.logging.info(f"\033[1;32m🟢 Assign incentive rewards for miner {self.miner_uids}")
-        self.assign_incentive_rewards(self.miner_uids, self.miner_scores, self.miner_reward_logs)
+        if self.recorder:
+            self.recorder.mark_epoch()
+        bt.logging.info(f"\033[1;32m🟢 Assign incentive rewards for miner {self.epoch_accumulator.uids()}")
+        with span("incentive_assignment"), PROFILER.trace_allocations("incentive_assignment"):
+            self.assign_incentive_rewards(self.epoch_accumulator)
+
+        LLM_ACCOUNTANT.report_epoch()
 
         # Update scores on chain
         self.update_scores_on_chain()
         self.save_state()
         # self.store_miner_infomation()
         bt.logging.info(f"\033[1;32m🟢 Validator loop completed in {time.time() - loop_start} seconds\033[0m")
-
-
-    def push_logs_to_minio(self):
-        #########################################################
-        # UPLOAD OUT LOG FILES
-        global last_err_file_name
-        global last_out_file_name
-
-        try:
-            bt.logging.info(f"\033[1;32m🟢 Pushing out log files to MinIO\033[0m")
-            log_regex = os.path.join(pm2_log_dir, f"*{app_name}*out*.log")
-            out_log_files = glob.glob(log_regex)
-            bt.logging.info(f"\033[1;32m🟢 Out log files: {out_log_files}, regex: {log_regex}\033[0m")
-
-            current_file_count = len(out_log_files)
-            # Detect rotation (new file added)
-            if current_file_count >= 2:
-                # A new file was created, so upload the latest previous file
-                previous_file = get_latest_previous_log_file(out_log_files)
-                if previous_file != last_out_file_name and previous_file:
-                    last_out_file_name = previous_file
-                    file_name = os.path.basename(previous_file)
-                    if file_name not in self.minio_manager.get_uploaded_files(log_bucket_name):
-                        bt.logging.info(f"Uploading {previous_file} to MinIO")
-                        if self.minio_manager.upload_file(previous_file, log_bucket_name, validator_username):
-                            bt.logging.info(f"\033[1;32m✅ Uploaded {file_name} to MinIO\033[0m")
-            #########################################################
-
-
-            #########################################################
-            # UPLOAD ERR LOG FILES
-            err_log_files = glob.glob(os.path.join(pm2_log_dir, f"*{app_name}-error*.log"))
-            # bt.logging.info(err_log_files)
-            current_file_count = len(err_log_files)
-
-            # Detect rotation (new file added)
-            if current_file_count >= 2:
-                # A new file was created, so upload the latest previous file
-                previous_file = get_latest_previous_log_file(err_log_files)
-                if previous_file != last_err_file_name and previous_file:
-                    last_err_file_name = previous_file
-                    file_name = os.path.basename(previous_file)
-                    if file_name not in self.minio_manager.get_uploaded_files(log_bucket_name):
-                        bt.logging.info(f"Uploading {previous_file} to MinIO")
-                        if self.minio_manager.upload_file(previous_file, log_bucket_name, validator_username):
-                            bt.logging.info(f"\033[1;32m✅ Uploaded {file_name} to MinIO\033[0m")
-            #########################################################
-        except Exception as e:
-            bt.logging.error(f"Error uploading log files: {e}")
+        bt.logging.info(f"\033[1;34m📦 Resident memory: {resident_memory_bytes() / 2**20:.1f} MB\033[0m")
 
 
     def run_async_query(self, category: str, uids: list[int], should_rewards: list[int]):
@@ -286,12 +279,13 @@ class Validator(BaseValidatorNeuron):
                     axons = [self.metagraph.axons[int(uid)] for uid in uids]
                     sent_time = time.time()
                     # Use aquery instead of query
-                    responses = await dendrite.aquery(
-                        axons=axons,
-                        synapse=synapse,
-                        deserialize=False,
-                        timeout=self.categories[category]["timeout"],
-                    )
+                    with span("dendrite_query"):
+                        responses = await dendrite.aquery(
+                            axons=axons,
+                            synapse=synapse,
+                            deserialize=False,
+                            timeout=self.categories[category]["timeout"],
+                        )
                     for axon, response in zip(axons, responses):
                         bt.logging.info(f"\033[1;34m🧠 {time.time() - sent_time}s Response from {axon}: {response}\033[0m ")
 
@@ -305,29 +299,25 @@ class Validator(BaseValidatorNeuron):
                     ]
 
                     if reward_uids:
-                        uids, rewards, reward_logs = self.categories[category]["rewarder"](
-                            reward_uids, reward_responses, base_synapse
-                        )
-
-                        for i, uid in enumerate(uids):
-                            if rewards[i] > 0:
-                                rewards[i] = rewards[i] * (
-                                    0.9 + 0.1 * self.miner_manager.all_uids_info[uid].reward_scale
-                                )
-
-                        unique_logs = {}
-                        for log in reward_logs:
-                            miner_uid = log["miner_uid"]
-                            if miner_uid not in unique_logs:
-                                unique_logs[miner_uid] = log
-
-                        logs_str = []
-                        for log in unique_logs.values():
-                            logs_str.append(
-                                f"Task ID: [{log['task_uid']}], Miner UID: {log['miner_uid']}, Reward: {log['reward']}, Correctness: {log['correctness']}, Similarity: {log['similarity']}, Process Time: {log['process_time']}, Miner Response: {log['miner_response']}, Ground Truth: {log['ground_truth']}"
+                        rewarder = self.categories[category]["rewarder"]
+                        reward_scales = self.miner_manager.get_reward_scales(reward_uids)
+                        # Snapshot the cheat words so the recording holds exactly the list this batch is scored with
+                        cheat_words = rewarder.get_cheat_words()
+                        with span("reward"):
+                            uids, rewards, reward_logs = rewarder(
+                                reward_uids, reward_responses, base_synapse, cheat_words=cheat_words
                             )
-                        formatted_logs_str = json.dumps(logs_str, indent=5)
-                        bt.logging.info(f"\033[1;32m🏆 Miner Scores: {formatted_logs_str}\033[0m")
+                        if self.recorder:
+                            self.recorder.record(
+                                category, base_synapse, reward_uids, reward_responses, reward_scales, cheat_words
+                            )
+
+                        rewards = apply_reward_scale(uids, rewards, reward_scales)
+
+                        self.reward_events.submit(reward_logs)
+                        bt.logging.info(
+                            f"\033[1;32m🏆 Miner Scores for task [{base_synapse.task_uid}]:\n{summarize_rewards(uids, rewards, reward_logs)}\033[0m"
+                        )
                         if rewards and reward_logs and uids:
                             # Queue the results instead of directly appending
                             self.reward_queue.put((reward_logs, uids, rewards))
@@ -350,83 +340,28 @@ class Validator(BaseValidatorNeuron):
         copy_synapse.logic_question = modify_question(copy_synapse.logic_question)
         return copy_synapse
 
-    def assign_incentive_rewards(self, uids, rewards, reward_logs):
+    def assign_incentive_rewards(self, accumulator: EpochAccumulator):
         """
         Calculate incentive rewards based on the rank.
         Get the incentive rewards for the valid responses using the cubic function and valid_rewards rank.
         """
-        # Flatten the nested lists
-        flat_uids = [uid for uid_list in uids for uid in uid_list]
-        flat_rewards = [reward for reward_list in rewards for reward in reward_list]
-        flat_reward_logs = [log for log_list in reward_logs for log in log_list]
-
-        # Create a dictionary to track the all scores per UID
-        uids_scores = {}
-        uids_logs = {}
-        for uid, reward, log in zip(flat_uids, flat_rewards, flat_reward_logs):
-            if uid not in uids_scores:
-                uids_scores[uid] = []
-                uids_logs[uid] = []
-            uids_scores[uid].append(reward)
-            uids_logs[uid].append(log)
-
-        # Now uids_scores holds all rewards each UID achieved this epoch
-        # Convert them into lists for processing
-        final_uids = list(uids_scores.keys())
-        representative_logs = [logs[0] for logs in uids_logs.values()] 
-               
-        ## compute mean value of rewards
-        final_rewards = [sum(uid_rewards) / len(uid_rewards) for uid_rewards in uids_scores.values()]
-        ## set the rewards to 0 if the mean is negative
-        final_rewards = [reward if reward > 0 else 0 for reward in final_rewards]
-
-        # Now proceed with the incentive rewards calculation on these mean attempts
-        original_rewards = list(enumerate(final_rewards))
-        # Sort and rank as before, but now we're dealing with mean attempts.
-        
-        # Sort rewards in descending order based on the score
-        sorted_rewards = sorted(original_rewards, key=lambda x: x[1], reverse=True)
-        
-        # Calculate ranks, handling ties
-        ranks = []
-        previous_score = None
-        rank = 0
-        for i, (reward_id, score) in enumerate(sorted_rewards):
-            # rank = i + 1 if score != previous_score else rank
-            rank = i + 1
-            ranks.append((reward_id, rank, score))
-            # previous_score = score
-        
-        # Restore the original order
-        ranks.sort(key=lambda x: x[0])
-
-        # Calculate incentive rewards based on the rank, applying the cubic function for positive scores
-        def incentive_formula(rank):
-            reward_value = -1.038e-7 * rank**3 + 6.214e-5 * rank**2 - 0.0129 * rank - 0.0118
-            # Scale up the reward value between 0 and 1
-            scaled_reward_value = reward_value + 1
-            return scaled_reward_value
-        
-        # incentive_rewards = [
-        #     (incentive_formula(rank) if score > 0.3 else 0) for _, rank, score in ranks
-        # ]
-
-        incentive_rewards = []
-        for _, rank, score in ranks:
-            ## only give reward top 160 miners, set 0 reward for 90 bad miners
-            if score > 0.3 and rank <= 160:
-                incentive_rewards.append(incentive_formula(rank))
-            else:
-                incentive_rewards.append(incentive_formula(250)) # add smallest reward for top 90 bad miners
+        final_uids, incentive_rewards, representative_logs = accumulator.incentive_rewards()
 
         bt.logging.info(f"\033[1;32m🟢 Final Uids: {final_uids}\033[0m")
         bt.logging.info(f"\033[1;32m🟢 Incentive rewards: {incentive_rewards}\033[0m")
         self.miner_manager.update_scores(final_uids, incentive_rewards, representative_logs)
-        
-        # Reset logs for next epoch
-        self.miner_scores = []
-        self.miner_reward_logs = []
-        self.miner_uids = []
+
+        # Reset accumulators for next epoch
+        accumulator.reset()
+
+    def on_metagraph_updated(self, replaced_uids: list[int]):
+        """Drop per-UID state of miners that left or were replaced since the last sync."""
+        # The first resync runs in BaseValidatorNeuron.__init__, before the miner manager exists.
+        if not hasattr(self, "miner_manager"):
+            return
+        departed_uids = self.miner_manager.prune(replaced_uids)
+        with self.reward_lock:
+            self.epoch_accumulator.prune(departed_uids + replaced_uids)
 
     def prepare_challenge(self, uids_should_rewards, category):
         """
@@ -458,7 +393,8 @@ class Validator(BaseValidatorNeuron):
         synapses = []
         for i in range(num_batch):
             synapse = synapse_type(category=category, timeout=timeout)
-            synapse = challenger(synapse)
+            with span("challenge"):
+                synapse = challenger(synapse)
             synapses.append(synapse)
         return synapses, batched_uids_should_rewards
 
@@ -496,7 +432,7 @@ class Validator(BaseValidatorNeuron):
         }
         try:
             # Open the file in write-binary mode
-            with open(self.config.neuron.full_path + "/state.pkl", "wb") as f:
+            with open(self.config.neuron.full_path + "/state.pkl", "wb") as f, PROFILER.trace_allocations("save_state"):
                 pickle.dump(state, f)
             bt.logging.info("State successfully saved to state.pkl")
         except Exception as e:
@@ -518,6 +454,7 @@ class Validator(BaseValidatorNeuron):
                 # Restore state from pickle file
                 self.step = state["step"]
                 self.miner_manager.all_uids_info = state["all_uids_info"]
+                self.miner_manager.prune()
                 bt.logging.info("Successfully loaded state from .pkl file")
                 return  # Exit after successful load from .pkl
 
@@ -532,6 +469,7 @@ class Validator(BaseValidatorNeuron):
                 # Restore state from .pt file
                 self.step = state["step"]
                 self.miner_manager.all_uids_info = state["all_uids_info"]
+                self.miner_manager.prune()
                 bt.logging.info("Successfully loaded state from .pt file")
 
             except Exception as e:
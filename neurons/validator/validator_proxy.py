@@ -10,8 +10,16 @@ import logicnet
 import random
 import asyncio
 import traceback
-import httpx
-import threading
+import time
+import os
+from functools import partial
+from neurons.validator.core.proxy_bridge import connect_bridge
+
+# Seconds a verified token is trusted before its signature is checked again; also how often
+# credentials refreshed by the validator are picked up.
+CREDENTIAL_TTL = 300
+# Threads for bridge calls; each one holds its own connection to the validator's manager.
+BRIDGE_IPC_WORKERS = 8
 
 
 class OrganicRequest(BaseModel):
@@ -23,20 +31,36 @@ class Recheck(BaseModel):
     authorization: str
 
 
+class ProxyStatsRequest(BaseModel):
+    authorization: str
+
+
 class ValidatorProxy:
     """
-    TODO. NOT IMPLEMENTED FOR LOGICNET
+    Organic request proxy. All validator state (credentials, query queue, miner scores, organic
+    rewards) is reached through a ProxyBridge, so the same proxy can run on a validator thread or
+    as a separate multi-worker service connected to the validator over IPC.
+
+    Bridge calls block on a socket round trip in service mode, so request handlers run them on a
+    dedicated thread pool instead of the event loop. Organic responses are handed to the bridge
+    for scoring in the validator process, so workers hold no rewarders.
     """
 
     def __init__(
         self,
-        validator,
+        bridge,
+        wallet,
     ):
-        self.validator = validator
-        self.get_credentials()
-        self.miner_request_counter = {}
-        self.dendrite = bt.dendrite(wallet=validator.wallet)
+        self.bridge = bridge
+        self.bridge_executor = ThreadPoolExecutor(max_workers=BRIDGE_IPC_WORKERS, thread_name_prefix="proxy-bridge")
+        self.credentials = None
+        self.verified_tokens = {}
+        self.load_credentials()
+        self.settings = bridge.get_settings()
+        self.timeouts = {}
+        self.dendrite = bt.dendrite(wallet=wallet)
         self.app = FastAPI()
+        self.app.add_api_route("/health", self.health, methods=["GET"])
         self.app.add_api_route(
             "/validator_proxy",
             self.forward,
@@ -49,23 +73,24 @@ class ValidatorProxy:
             methods=["POST"],
             dependencies=[Depends(self.get_self)],
         )
-        self.loop = asyncio.get_event_loop()
-        if self.validator.config.proxy.port:
-            self.start_server()
-
-    def get_credentials(self):
-        with httpx.Client(timeout=httpx.Timeout(30)) as client:
-            response = client.post(
-                f"{self.validator.config.proxy.proxy_client_url}/get_credentials",
-                json={
-                    "port": self.validator.config.proxy.port,
-                    "uid": self.validator.uid,
-                },
-            )
-        response.raise_for_status()
-        response = response.json()
-        message = response["message"]
-        signature = response["signature"]
+        self.app.add_api_route(
+            "/proxy_stats",
+            self.proxy_stats,
+            methods=["POST"],
+            dependencies=[Depends(self.get_self)],
+        )
+
+    def load_credentials(self, refresh: bool = False):
+        if refresh:
+            self.bridge.refresh_credentials()
+        credentials = self.bridge.get_credentials()
+        self.credentials_loaded_at = time.time()
+        if credentials == self.credentials:
+            return
+        self.credentials = credentials
+        # Tokens verified against the previous signature must be checked again.
+        self.verified_tokens = {}
+        message, signature = credentials
         signature = base64.b64decode(signature)
 
         def verify_credentials(public_key_bytes):
@@ -77,17 +102,23 @@ class ValidatorProxy:
 
         self.verify_credentials = verify_credentials
 
-    def start_server(self):
+    def start_server(self, port: int):
         self.executor = ThreadPoolExecutor(max_workers=1)
-        self.executor.submit(
-            uvicorn.run, self.app, host="0.0.0.0", port=self.validator.config.proxy.port
-        )
+        self.executor.submit(uvicorn.run, self.app, host="0.0.0.0", port=port)
 
-    def authenticate_token(self, public_key_bytes):
+    def authenticate_token(self, token):
+        now = time.time()
+        if now - self.credentials_loaded_at > CREDENTIAL_TTL:
+            self.load_credentials()
+        cached = self.verified_tokens.get(token)
+        if cached is not None and cached[1] > now:
+            return cached[0]
         try:
-            public_key_bytes = base64.b64decode(public_key_bytes)
+            public_key_bytes = base64.b64decode(token)
             self.verify_credentials(public_key_bytes)
-            bt.logging.info("Successfully authenticated token")
+            bt.logging.debug("Successfully authenticated token")
+            # Only verified tokens are memoized, so the cache is bounded by the number of real keys.
+            self.verified_tokens[token] = (public_key_bytes, now + CREDENTIAL_TTL)
             return public_key_bytes
         except Exception as e:
             print("Exception occured in authenticating token", e, flush=True)
@@ -96,85 +127,134 @@ class ValidatorProxy:
                 status_code=401, detail="Error getting authentication token"
             )
 
+    async def call_bridge(self, method: str, *args):
+        """Await a bridge call run on the IPC thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.bridge_executor, partial(getattr(self.bridge, method), *args))
+
+    async def authenticate(self, token):
+        # Usually a cache hit, but a credential reload goes over the bridge.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.bridge_executor, self.authenticate_token, token)
+
+    async def get_timeout(self, category: str) -> int:
+        if category not in self.timeouts:
+            self.timeouts[category] = await self.call_bridge("get_timeout", category)
+        return self.timeouts[category]
+
     def re_check(self, data: Recheck):
         self.authenticate_token(data.authorization)
         bt.logging.info("Rechecking validators")
-        self.get_credentials()
+        self.load_credentials(refresh=True)
         return {"message": "done"}
 
-    def organic_reward(self, synapse, response, uid, rewarder, timeout):
-        if callable(rewarder):
-            uids, rewards = rewarder([uid], [response], synapse)
-        else:
-            raise Exception("Rewarder not supported !!")
-        bt.logging.info(
-            f"Proxy: Updating scores of miners {uids} with rewards {rewards}"
+    async def query_miner(self, uid, axon, synapse, timeout):
+        bt.logging.debug(f"Sending request to axon: {axon}")
+        start = time.time()
+        responses = await self.dendrite.forward(
+            [axon], synapse.model_copy(), deserialize=False, timeout=timeout, run_async=True
         )
-
-        # Scale Reward based on Miner Volume
-        for i, uid in enumerate(uids):
-            if rewards[i] > 0:
-                rewards[i] = rewards[i] * (
-                    0.9
-                    + 0.1 * self.validator.miner_manager.all_uids_info[uid].reward_scale
-                )
-
-        bt.logging.info(f"Scored responses: {rewards}")
-
-        self.validator.miner_manager.update_scores(uids, rewards)
+        return uid, responses[0], time.time() - start
 
     async def forward(self, data: OrganicRequest):
-        self.authenticate_token(data.authorization)
+        await self.authenticate(data.authorization)
         bt.logging.info("Received an organic request!")
         synapse = logicnet.protocol.LogicSynapse(**data.synapse_request.dict())
 
         category = synapse.category
-        category_config = self.validator.categories[category]
         if not synapse.logic_question:
             synapse.logic_question = synapse.raw_logic_question
 
-        timeout = category_config["timeout"]
-        rewarder = category_config["rewarder"]
-
-        metagraph = self.validator.metagraph
+        settings = self.settings
+        timeout = await self.get_timeout(category)
+        hedge_delay = settings["hedge_delay"]
 
+        request_start = time.time()
+        remaining = await self.call_bridge("select_candidates", settings["hedge_k"])
+        should_rewards = {}
+        pending = set()
         output = None
-        for uid, should_reward in self.validator.query_queue.get_query_for_proxy(
-            category
-        ):
-            should_reward = (
-                random.random() < self.validator.config.proxy.checking_probability
-                or should_reward
-            )
-            bt.logging.info(
-                f"Forwarding request to miner {uid} with recent scores: {self.validator.miner_manager.all_uids_info[uid].scores}"
-            )
-            axon = metagraph.axons[uid]
-            bt.logging.info(f"Sending request to axon: {axon}")
-            responses = await self.dendrite.forward(
-                [axon], synapse, deserialize=False, timeout=timeout, run_async=True
-            )
-            response = responses[0]
-            bt.logging.info(
-                f"Received response from miner {uid}, status: {response.is_success}"
+        # Race the candidates: start the best one, then hedge with the next one every hedge_delay
+        # seconds (or as soon as one fails) until a valid response arrives, then cancel the rest.
+        while (remaining or pending) and output is None:
+            if remaining:
+                uid, should_reward, axon, scores = remaining.pop(0)
+                should_rewards[uid] = (
+                    random.random() < settings["checking_probability"]
+                    or should_reward
+                )
+                bt.logging.info(
+                    f"Forwarding request to miner {uid} with recent scores: {scores}"
+                )
+                pending.add(asyncio.create_task(self.query_miner(uid, axon, synapse, timeout)))
+
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=hedge_delay if remaining else None,
+                return_when=asyncio.FIRST_COMPLETED,
             )
-            if should_reward:
-                reward_thread = threading.Thread(
-                    target=self.organic_reward,
-                    args=(synapse, response, uid, rewarder, timeout),
+            for task in done:
+                try:
+                    uid, response, latency = task.result()
+                except Exception as e:
+                    bt.logging.warning(f"Organic request to miner failed: {e}")
+                    continue
+                bt.logging.info(
+                    f"Received response from miner {uid} in {round(latency, 2)}s, status: {response.is_success}"
                 )
-                reward_thread.start()
+                # Bookkeeping is fire-and-forget on the IPC pool; the response does not wait for it.
+                self.bridge_executor.submit(self.bridge.record_response, uid, latency)
+                if should_rewards[uid]:
+                    self.bridge_executor.submit(
+                        self.bridge.submit_organic_reward,
+                        category,
+                        synapse.model_dump(),
+                        response.model_dump(),
+                        uid,
+                    )
+                if response.is_success and output is None:
+                    output = response
+
+        for task in pending:
+            task.cancel()
 
-            if response.is_success:
-                output = response
-                break
-            else:
-                continue
+        self.bridge_executor.submit(self.bridge.record_request, time.time() - request_start, output is not None)
         if output:
             response = output.deserialize_response()
             return response
         else:
             return HTTPException(status_code=500, detail="No valid response received")
 
+    async def proxy_stats(self, data: ProxyStatsRequest):
+        await self.authenticate(data.authorization)
+        return await self.call_bridge("stats")
+
+    async def health(self):
+        return {"status": "ok"}
+
     async def get_self(self):
         return self
+
+
+def create_app() -> FastAPI:
+    """App factory for the standalone proxy service; each uvicorn worker connects to the validator's bridge."""
+    bridge = connect_bridge(
+        os.environ["LOGICNET_PROXY_BRIDGE_ADDRESS"],
+        base64.b64decode(os.environ["LOGICNET_PROXY_BRIDGE_AUTHKEY"]),
+    )
+    wallet = bt.wallet(
+        name=os.environ["LOGICNET_PROXY_WALLET_NAME"],
+        hotkey=os.environ["LOGICNET_PROXY_WALLET_HOTKEY"],
+        path=os.environ["LOGICNET_PROXY_WALLET_PATH"],
+    )
+    return ValidatorProxy(bridge, wallet).app
+
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "neurons.validator.validator_proxy:create_app",
+        factory=True,
+        host="0.0.0.0",
+        port=int(os.environ["LOGICNET_PROXY_PORT"]),
+        workers=int(os.environ.get("LOGICNET_PROXY_WORKERS", 1)),
+    )
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from logicnet.miner.admission import AdmissionController
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_admits_up_to_max_concurrency_without_waiting():
+    async def scenario():
+        admission = AdmissionController(max_concurrency=2)
+        await admission.acquire(1.0)
+        await admission.acquire(1.0)
+        assert admission.stats()["in_flight"] == 2
+        assert admission.stats()["waiting"] == 0
+
+    run(scenario())
+
+
+def test_waiters_are_admitted_by_priority():
+    async def scenario():
+        admission = AdmissionController(max_concurrency=1)
+        await admission.acquire(0.0)
+        admitted = []
+
+        async def request(priority):
+            await admission.acquire(priority)
+            admitted.append(priority)
+
+        tasks = [asyncio.create_task(request(priority)) for priority in (1.0, 5.0, 3.0)]
+        await asyncio.sleep(0)
+        assert admission.stats()["waiting"] == 3
+        for _ in range(3):
+            admission.release()
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        assert admitted == [5.0, 3.0, 1.0]
+
+    run(scenario())
+
+
+def test_cancelled_waiter_does_not_leak_its_slot():
+    async def scenario():
+        admission = AdmissionController(max_concurrency=1)
+        await admission.acquire(0.0)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(admission.acquire(1.0), timeout=0.01)
+        assert admission.stats()["waiting"] == 0
+        admission.release()
+        assert admission.stats()["in_flight"] == 0
+        await asyncio.wait_for(admission.acquire(1.0), timeout=0.1)
+
+    run(scenario())
+
+
+def test_service_time_is_an_exponential_moving_average():
+    admission = AdmissionController(max_concurrency=4)
+    admission.in_flight = 2
+    admission.release(10.0)
+    assert admission.avg_service_time == 10.0
+    admission.release(20.0)
+    assert admission.avg_service_time == pytest.approx(12.0)
+
+
+def test_rejects_only_requests_that_cannot_finish_in_time():
+    admission = AdmissionController(max_concurrency=1)
+    # Nothing is known about the service time yet.
+    assert not admission.should_reject(1.0, timeout=1)
+    admission.avg_service_time = 10.0
+    # A free slot: only the service time counts.
+    assert not admission.should_reject(1.0, timeout=12)
+    admission.in_flight = 1
+    assert admission.expected_wait(1.0) == 10.0
+    assert admission.should_reject(1.0, timeout=12)
+    assert admission.stats()["rejected"] == 1
@@ -0,0 +1,70 @@
+import re
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from logicnet.miner.answer_cache import AnswerCache
+
+DIM = 16
+
+
+class WordEmbedder:
+    """Bag-of-words embedding that ignores digits, so questions differing only in numbers embed identically."""
+
+    def __init__(self, model_name):
+        pass
+
+    def get_sentence_embedding_dimension(self):
+        return DIM
+
+    def encode(self, text, normalize_embeddings=True):
+        vector = np.zeros(DIM, dtype=np.float32)
+        for word in re.findall(r"[a-z]+", text.lower()):
+            vector[sum(map(ord, word)) % DIM] += 1
+        return vector / (np.linalg.norm(vector) or 1)
+
+
+@pytest.fixture(autouse=True)
+def embedder(monkeypatch):
+    monkeypatch.setitem(sys.modules, "sentence_transformers", SimpleNamespace(SentenceTransformer=WordEmbedder))
+
+
+def test_hit_requires_the_same_numbers(tmp_path):
+    cache = AnswerCache(str(tmp_path / "cache"))
+    cache.add("How many apples are in 12 baskets of 4?", "12 * 4", "48")
+    assert cache.lookup("How many apples are in 12 baskets of 4?")[0] == ("12 * 4", "48")
+    assert cache.lookup("How many apples are in 12 baskets of 5?")[0] is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_most_similar_entry_with_matching_numbers_wins(tmp_path):
+    cache = AnswerCache(str(tmp_path / "cache"), threshold=0.5)
+    cache.add("How many apples are in 12 baskets of 4?", "12 * 4", "48")
+    cache.add("How many apples are in 12 baskets of 5?", "12 * 5", "60")
+    assert cache.lookup("How many apples are in 12 baskets of 5?")[0] == ("12 * 5", "60")
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = AnswerCache(str(tmp_path / "cache"), max_entries=2)
+    cache.add("apples 1", "r", "1")
+    cache.add("pears 2", "r", "2")
+    cache.lookup("apples 1")
+    cache.add("plums 3", "r", "3")
+    assert cache.lookup("pears 2")[0] is None
+    assert cache.lookup("apples 1")[0] == ("r", "1")
+    assert cache.lookup("plums 3")[0] == ("r", "3")
+
+
+def test_index_is_saved_atomically_and_reloaded(tmp_path):
+    path = str(tmp_path / "cache")
+    cache = AnswerCache(path)
+    cache.add("How many apples are in 12 baskets of 4?", "12 * 4", "48")
+    cache.save()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cache.npz"]
+
+    reloaded = AnswerCache(path)
+    assert reloaded.stats()["entries"] == 1
+    assert reloaded.lookup("How many apples are in 12 baskets of 4?")[0] == ("12 * 4", "48")
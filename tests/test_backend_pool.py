@@ -0,0 +1,83 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from logicnet.miner.backend_pool import BackendPool
+
+
+class BackendHandler(BaseHTTPRequestHandler):
+    """Serves /<mode>/chat/completions: ok answers, failing returns 500, hung stalls."""
+
+    def do_POST(self):
+        mode = self.path.split("/")[1]
+        if mode == "hung":
+            time.sleep(2)
+        body = json.dumps({"choices": [{"message": {"content": "2"}}]}).encode()
+        self.send_response(500 if mode == "failing" else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        # Listing models works even on the failing backend.
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BackendHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_go_to_the_least_loaded_healthy_backend():
+    pool = BackendPool(["http://a", "http://b"], api_key="key", model="m")
+    first = pool.acquire()
+    second = pool.acquire()
+    assert {first.base_url, second.base_url} == {"http://a", "http://b"}
+    pool.release(first, latency=1.0, success=True)
+    assert pool.acquire() is first
+
+
+def test_backend_is_ejected_after_consecutive_failures():
+    pool = BackendPool(["http://a", "http://b"], api_key="key", model="m", max_failures=2)
+    a = pool.backends[0]
+    for _ in range(2):
+        pool.acquire()
+        pool.release(a, latency=1.0, success=False)
+    assert not a.healthy
+    assert all(pool.acquire().base_url == "http://b" for _ in range(3))
+
+
+def test_health_checks_use_a_real_completion(server_url):
+    pool = BackendPool([f"{server_url}/ok", f"{server_url}/failing"], api_key="key", model="m")
+    for backend in pool.backends:
+        backend.healthy = False
+    pool.run_health_checks(timeout=1)
+    assert [backend.healthy for backend in pool.backends] == [True, False]
+
+
+def test_backend_is_ejected_after_consecutive_failed_health_checks(server_url):
+    pool = BackendPool([f"{server_url}/failing"], api_key="key", model="m", max_failures=2)
+    backend = pool.backends[0]
+    pool.run_health_checks(timeout=1)
+    assert backend.healthy
+    pool.run_health_checks(timeout=1)
+    assert not backend.healthy
+
+
+def test_health_checks_run_concurrently(server_url):
+    pool = BackendPool([f"{server_url}/hung"] * 3 + [f"{server_url}/ok"], api_key="key", model="m", max_failures=1)
+    start = time.time()
+    pool.run_health_checks(timeout=0.5)
+    assert time.time() - start < 1.5
+    assert [backend.healthy for backend in pool.backends] == [False, False, False, True]
@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+from logicnet.miner.blacklist import SlidingWindowCounter, check_limit
+
+
+def test_counts_up_to_the_limit_within_a_window():
+    counter = SlidingWindowCounter(interval=60, now=0)
+    assert [counter.hit(3, now=t) for t in (1, 2, 3, 4)] == [False, False, False, True]
+    # Rejected requests are not counted.
+    assert counter.current == 3
+
+
+def test_previous_window_is_weighted_by_its_overlap():
+    counter = SlidingWindowCounter(interval=60, now=0)
+    for t in range(4):
+        assert not counter.hit(4, now=t)
+    # Halfway through the next window, half of the previous window's 4 requests still count.
+    assert not counter.hit(4, now=90)
+    assert not counter.hit(4, now=90)
+    assert counter.hit(4, now=90)
+
+
+def test_no_burst_at_the_window_boundary():
+    counter = SlidingWindowCounter(interval=60, now=0)
+    for _ in range(5):
+        assert not counter.hit(5, now=59)
+    # A fixed window would allow 5 more right after the boundary.
+    assert counter.hit(5, now=60.5)
+
+
+def test_old_windows_are_forgotten():
+    counter = SlidingWindowCounter(interval=60, now=0)
+    for _ in range(5):
+        counter.hit(5, now=1)
+    assert not counter.hit(5, now=200)
+    assert counter.previous == 0
+    assert counter.current == 1
+
+
+def test_check_limit_keeps_one_counter_per_validator():
+    miner = SimpleNamespace(validator_logs={})
+    volume_per_validator = {1: 2, 2: 1}
+    assert not check_limit(miner, uid=1, stake=0, volume_per_validator=volume_per_validator)
+    assert not check_limit(miner, uid=1, stake=0, volume_per_validator=volume_per_validator)
+    assert check_limit(miner, uid=1, stake=0, volume_per_validator=volume_per_validator)
+    assert not check_limit(miner, uid=2, stake=0, volume_per_validator=volume_per_validator)
+    assert check_limit(miner, uid=2, stake=0, volume_per_validator=volume_per_validator)
+
+
+def test_check_limit_resets_the_counter_when_the_interval_changes():
+    miner = SimpleNamespace(validator_logs={})
+    volume_per_validator = {1: 1}
+    assert not check_limit(miner, uid=1, stake=0, volume_per_validator=volume_per_validator, interval=600)
+    assert check_limit(miner, uid=1, stake=0, volume_per_validator=volume_per_validator, interval=600)
+    assert not check_limit(miner, uid=1, stake=0, volume_per_validator=volume_per_validator, interval=300)
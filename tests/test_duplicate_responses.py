@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import pytest
+
+from logicnet.protocol import LogicSynapse
+from logicnet.validator.replay import ReplayLLMClient, ReplayRewarder
+
+
+def make_response(answer, reasoning, process_time=1.0):
+    return SimpleNamespace(
+        logic_answer=answer,
+        logic_reasoning=reasoning,
+        is_success=True,
+        dendrite=SimpleNamespace(process_time=process_time),
+    )
+
+
+@pytest.fixture
+def rewarder():
+    return ReplayRewarder(ReplayLLMClient(), warm_embedder=False)
+
+
+def test_identical_responses_share_a_group(rewarder):
+    responses = [
+        make_response("42", "6 * 7"),
+        make_response("41", "6 * 7"),
+        make_response("42", "6 * 7"),
+        make_response("42", "6*7"),
+    ]
+    unique_indices, response_to_unique = rewarder._group_duplicate_responses([10, 11, 12, 13], responses)
+    assert unique_indices == [0, 1, 3]
+    assert response_to_unique == [0, 1, 0, 2]
+
+
+def test_answer_and_reasoning_are_not_concatenated_ambiguously(rewarder):
+    responses = [make_response("4", "2x"), make_response("42", "x")]
+    unique_indices, _ = rewarder._group_duplicate_responses([1, 2], responses)
+    assert unique_indices == [0, 1]
+
+
+def test_duplicates_are_scored_once_and_fanned_out(rewarder, monkeypatch):
+    scored = {"similarity": [], "correctness": []}
+
+    def get_similarity(ground_truth, texts):
+        scored["similarity"].append(list(texts))
+        return [0.5 + 0.1 * i for i in range(len(texts))]
+
+    def get_correctness(base_synapse, responses, cheat_words=None):
+        scored["correctness"].append([response.logic_answer for response in responses])
+        return [1.0 if response.logic_answer == "42" else 0.0 for response in responses]
+
+    monkeypatch.setattr(rewarder, "_get_ground_truth", lambda question, task_uid=None: "42")
+    monkeypatch.setattr(rewarder, "_get_similarity", get_similarity)
+    monkeypatch.setattr(rewarder, "_get_correctness", get_correctness)
+
+    base_synapse = LogicSynapse(
+        raw_logic_question="What is 6 * 7?", ground_truth_answer="42", task_uid="task", timeout=64
+    )
+    responses = [
+        make_response("42", "6 * 7"),
+        make_response("41", "6 * 6"),
+        make_response("42", "6 * 7", process_time=2.0),
+    ]
+    uids, rewards, reward_logs = rewarder([1, 2, 3], responses, base_synapse, cheat_words=[])
+
+    assert scored["similarity"] == [["6 * 7", "6 * 6"]]
+    assert scored["correctness"] == [["42", "41"]]
+    assert uids == [1, 2, 3]
+    assert [log["similarity"] for log in reward_logs] == [0.5, 0.6, 0.5]
+    assert [log["correctness"] for log in reward_logs] == [1.0, 0.0, 1.0]
+    # Same scores, but each miner keeps its own process time.
+    assert rewards[0] > rewards[2] > rewards[1]
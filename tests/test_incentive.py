@@ -0,0 +1,100 @@
+import json
+import random
+
+from logicnet.validator import incentive
+from logicnet.validator.incentive import (
+    NUMERIC_LOG_FIELDS,
+    EpochAccumulator,
+    compute_incentive_rewards,
+    rank_incentive_rewards,
+)
+
+
+def make_log(uid, reward):
+    return {
+        "task_uid": "task",
+        "miner_uid": uid,
+        "reward": reward,
+        "correctness": reward,
+        "similarity": reward,
+        "process_time": 1.0,
+        "miner_response": "42",
+        "question": "What is 6 * 7?",
+    }
+
+
+def list_based_incentive_rewards(uids, rewards):
+    """The per-epoch lists the accumulator replaced: mean reward per UID, ranked."""
+    per_uid = {}
+    for batch_uids, batch_rewards in zip(uids, rewards):
+        for uid, reward in zip(batch_uids, batch_rewards):
+            per_uid.setdefault(uid, []).append(reward)
+    final_uids = list(per_uid)
+    means = [sum(per_uid[uid]) / len(per_uid[uid]) for uid in final_uids]
+    return final_uids, rank_incentive_rewards(means)
+
+
+def test_matches_the_list_based_computation_exactly():
+    rng = random.Random(0)
+    uids, rewards, reward_logs = [], [], []
+    for _ in range(200):
+        batch_uids = rng.sample(range(64), 8)
+        batch_rewards = [rng.random() for _ in batch_uids]
+        uids.append(batch_uids)
+        rewards.append(batch_rewards)
+        reward_logs.append([make_log(uid, reward) for uid, reward in zip(batch_uids, batch_rewards)])
+
+    final_uids, incentive_rewards, representative_logs = compute_incentive_rewards(uids, rewards, reward_logs)
+    assert (final_uids, incentive_rewards) == list_based_incentive_rewards(uids, rewards)
+    assert all(set(log) == set(NUMERIC_LOG_FIELDS) for log in representative_logs)
+
+
+def test_keeps_the_first_log_of_each_uid_stripped():
+    accumulator = EpochAccumulator()
+    accumulator.add([1, 2], [0.5, 0.6], [make_log(1, 0.5), make_log(2, 0.6)])
+    accumulator.add([1], [0.9], [make_log(1, 0.9)])
+    final_uids, _, logs = accumulator.incentive_rewards()
+    assert final_uids == [1, 2]
+    assert [log["reward"] for log in logs] == [0.5, 0.6]
+    assert "question" not in logs[0]
+
+
+def test_prune_forgets_uids():
+    accumulator = EpochAccumulator()
+    accumulator.add([1, 2, 3], [0.5, 0.6, 0.7], [make_log(uid, 0.5) for uid in (1, 2, 3)])
+    accumulator.prune([2, 4])
+    assert accumulator.uids() == [1, 3]
+    assert len(accumulator) == 2
+
+
+def test_spills_only_new_logs_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(incentive, "SPILL_BATCH_SIZE", 3)
+    spill_path = tmp_path / "logs.jsonl"
+    accumulator = EpochAccumulator(spill_path=str(spill_path))
+    accumulator.add([1, 2], [0.5, 0.6], [make_log(1, 0.5), make_log(2, 0.6)])
+    assert not spill_path.exists()
+    # UID 1 already has its representative log, so only UID 3 is new.
+    accumulator.add([1, 3], [0.7, 0.8], [make_log(1, 0.7), make_log(3, 0.8)])
+    assert [json.loads(line)["miner_uid"] for line in spill_path.read_text().splitlines()] == [1, 2, 3]
+
+    modified = spill_path.stat().st_mtime_ns
+    accumulator.add([1, 2, 3], [0.1, 0.2, 0.3], [make_log(uid, 0.1) for uid in (1, 2, 3)])
+    accumulator.incentive_rewards()
+    assert spill_path.stat().st_mtime_ns == modified
+
+    accumulator.add([4], [0.4], [make_log(4, 0.4)])
+    accumulator.reset()
+    assert json.loads(spill_path.read_text().splitlines()[-1])["question"] == "What is 6 * 7?"
+    assert len(spill_path.read_text().splitlines()) == 4
+
+
+def test_spill_file_is_rotated(tmp_path):
+    spill_path = tmp_path / "logs.jsonl"
+    accumulator = EpochAccumulator(spill_path=str(spill_path), spill_max_bytes=10)
+    accumulator.add([1], [0.5], [make_log(1, 0.5)])
+    accumulator.flush()
+    accumulator.reset()
+    accumulator.add([1], [0.5], [make_log(1, 0.5)])
+    accumulator.flush()
+    assert (tmp_path / "logs.jsonl.1").exists()
+    assert len(spill_path.read_text().splitlines()) == 1
@@ -0,0 +1,83 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+from logicnet.utils.metrics import NOOP_SPAN, STAGE_METRIC, Histogram, MetricsRegistry
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram(buckets=(0.1, 1))
+    for value in (0.05, 0.1, 0.5, 5):
+        histogram.observe(value)
+    assert histogram.cumulative_counts() == [2, 3, 4]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(5.65)
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry()
+    assert registry.span("reward") is NOOP_SPAN
+    with registry.span("reward"):
+        pass
+    registry.observe("reward", 1.0)
+    assert registry.histograms == {}
+
+
+def test_render_prometheus_text():
+    registry = MetricsRegistry()
+    registry.enable()
+    registry.observe("reward", 0.2)
+    registry.observe("reward", 3.0)
+    registry.observe("challenge", 0.001)
+    registry.gauge("logicnet_queue_size", "Pending batches.", lambda: 7)
+    lines = registry.render().splitlines()
+
+    assert lines[:2] == [
+        f"# HELP {STAGE_METRIC} Time spent in each validator pipeline stage.",
+        f"# TYPE {STAGE_METRIC} histogram",
+    ]
+    assert f'{STAGE_METRIC}_bucket{{stage="reward",le="0.25"}} 1' in lines
+    assert f'{STAGE_METRIC}_bucket{{stage="reward",le="5"}} 2' in lines
+    assert f'{STAGE_METRIC}_bucket{{stage="reward",le="+Inf"}} 2' in lines
+    assert f'{STAGE_METRIC}_sum{{stage="reward"}} 3.2' in lines
+    assert f'{STAGE_METRIC}_count{{stage="reward"}} 2' in lines
+    # Stages are rendered in sorted order.
+    assert lines.index(f'{STAGE_METRIC}_count{{stage="challenge"}} 1') < lines.index(
+        f'{STAGE_METRIC}_count{{stage="reward"}} 2'
+    )
+    assert lines[-3:] == [
+        "# HELP logicnet_queue_size Pending batches.",
+        "# TYPE logicnet_queue_size gauge",
+        "logicnet_queue_size 7",
+    ]
+
+
+def test_failing_gauges_are_skipped():
+    registry = MetricsRegistry()
+
+    def broken():
+        raise RuntimeError("unavailable")
+
+    registry.gauge("logicnet_broken", "Broken gauge.", broken)
+    registry.gauge("logicnet_ok", "Working gauge.", lambda: 1)
+    text = registry.render()
+    assert "logicnet_broken" not in text
+    assert "logicnet_ok 1" in text
+
+
+def test_serve_exposes_metrics_only():
+    registry = MetricsRegistry()
+    registry.serve(0, host="127.0.0.1")
+    try:
+        port = registry.server.server_address[1]
+        with registry.span("reward"):
+            pass
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert f'{STAGE_METRIC}_count{{stage="reward"}} 1' in response.read().decode()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/other")
+    finally:
+        registry.server.shutdown()
+        registry.server.server_close()
@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+
+from logicnet.validator.miner_manager import MinerManager
+
+
+class Uid(int):
+    def item(self):
+        return int(self)
+
+
+def make_manager(uids):
+    validator = SimpleNamespace(metagraph=SimpleNamespace(uids=[Uid(uid) for uid in uids]))
+    return MinerManager(validator), validator
+
+
+def test_prune_drops_departed_and_resets_replaced_uids():
+    manager, validator = make_manager([0, 1, 2])
+    for uid in (0, 1, 2):
+        manager.all_uids_info[uid].scores = [1.0]
+        manager.all_uids_info[uid].reward_logs = [{"reward": 1.0, "question": "text"}]
+    previous = manager.all_uids_info
+
+    validator.metagraph.uids = [Uid(0), Uid(1), Uid(3)]
+    assert manager.prune(replaced_uids=[1]) == [2]
+
+    assert sorted(manager.all_uids_info) == [0, 1, 3]
+    assert manager.all_uids_info[0].scores == [1.0]
+    assert "question" not in manager.all_uids_info[0].reward_logs[0]
+    assert manager.all_uids_info[1].scores == []
+    assert manager.all_uids_info[3].scores == []
+    # Threads still iterating the old dict see it unchanged.
+    assert previous is not manager.all_uids_info
+    assert sorted(previous) == [0, 1, 2]
+
+
+def test_pruned_uids_are_skipped_when_late_rewards_arrive():
+    manager, validator = make_manager([0, 1])
+    manager.all_uids_info[1].reward_scale = 1.0
+    validator.metagraph.uids = [Uid(0)]
+    manager.prune()
+
+    assert manager.get_reward_scales([0, 1]) == {0: 0.0, 1: 0.0}
+    manager.update_scores([1, 0], [0.5, 0.7], [{"reward": 0.5}, {"reward": 0.7}])
+    assert manager.all_uids_info[0].scores == [0.7]
+    assert 1 not in manager.all_uids_info
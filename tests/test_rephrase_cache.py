@@ -0,0 +1,61 @@
+import sqlite3
+
+from logicnet.validator.challenger.rephrase_cache import RephraseCache
+
+
+def persona(profile):
+    return {"profile": profile, "mood": "curious", "tone": "playful"}
+
+
+def test_get_matches_the_exact_persona(tmp_path):
+    cache = RephraseCache(str(tmp_path / "rephrase.db"))
+    cache.put("What is 6 * 7?", persona("student"), "Hey, what's 6 times 7?")
+    assert cache.get("What is 6 * 7?", persona("student")) == "Hey, what's 6 times 7?"
+    assert cache.get("What is 6 * 7?", persona("teacher")) is None
+    assert cache.count("What is 6 * 7?") == 1
+    assert cache.sample("What is 6 * 7?") == ("Hey, what's 6 times 7?", persona("student"))
+    assert cache.sample("What is 6 * 8?") is None
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = RephraseCache(str(tmp_path / "rephrase.db"), max_entries=2)
+    cache.put("q1", persona("student"), "r1")
+    cache.put("q2", persona("student"), "r2")
+    # Serving q1 makes q2 the least recently used, even though q1 was written first.
+    assert cache.get("q1", persona("student")) == "r1"
+    cache.put("q3", persona("student"), "r3")
+    assert cache.get("q2", persona("student")) is None
+    assert cache.get("q1", persona("student")) == "r1"
+    assert cache.get("q3", persona("student")) == "r3"
+    assert cache.size == 2
+
+
+def test_sampling_counts_as_a_use(tmp_path):
+    cache = RephraseCache(str(tmp_path / "rephrase.db"), max_entries=2)
+    cache.put("q1", persona("student"), "r1")
+    cache.put("q2", persona("student"), "r2")
+    cache.sample("q1")
+    cache.put("q3", persona("student"), "r3")
+    assert cache.count("q1") == 1
+    assert cache.count("q2") == 0
+
+
+def test_cache_written_before_lru_is_migrated(tmp_path):
+    path = str(tmp_path / "rephrase.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE rephrasings (question_hash TEXT, profile TEXT, mood TEXT, tone TEXT, "
+        "text TEXT, created_at REAL, PRIMARY KEY (question_hash, profile, mood, tone))"
+    )
+    conn.execute(
+        "INSERT INTO rephrasings VALUES (?, 'student', 'curious', 'playful', 'r1', 1.0)",
+        (RephraseCache.hash_question("q1"),),
+    )
+    conn.commit()
+    conn.close()
+
+    cache = RephraseCache(path, max_entries=1)
+    assert cache.get("q1", persona("student")) == "r1"
+    cache.put("q2", persona("student"), "r2")
+    assert cache.get("q1", persona("student")) is None
+    assert cache.get("q2", persona("student")) == "r2"
@@ -0,0 +1,95 @@
+import gzip
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from logicnet.protocol import LogicSynapse
+from logicnet.validator.recorder import EpochRecorder, read_recording, to_synapses
+from logicnet.validator.replay import ReplayLLMClient, ReplayRewarder, compare, replay
+
+
+def make_response(answer, status_code=200, process_time=1.5):
+    return SimpleNamespace(
+        logic_answer=answer,
+        logic_reasoning=f"so the answer is {answer}",
+        dendrite=SimpleNamespace(status_code=status_code, process_time=process_time),
+    )
+
+
+def make_base_synapse(task_uid):
+    return LogicSynapse(
+        logic_question="What is 6 * 7?",
+        raw_logic_question="What is 6 * 7?",
+        ground_truth_answer="42",
+        task_uid=task_uid,
+        timeout=64,
+    )
+
+
+@pytest.fixture
+def recording(tmp_path):
+    path = str(tmp_path / "records.jsonl.gz")
+    recorder = EpochRecorder(path)
+    responses = [make_response("42"), make_response("41"), make_response("", status_code=408)]
+    recorder.record("Logic", make_base_synapse("a"), [1, 2, 3], responses, {1: 1.0, 2: 0.5, 3: 0.0}, ["cheat"])
+    recorder.record("Logic", make_base_synapse("b"), [1, 2], responses[:2], {1: 1.0, 2: 0.5}, ["cheat"])
+    recorder.mark_epoch()
+    recorder.record("Logic", make_base_synapse("c"), [2], responses[:1], {2: 0.5}, ["cheat", "new"])
+    recorder.close()
+    return path
+
+
+def test_round_trip(recording):
+    records = list(read_recording(recording))
+    assert [record["type"] for record in records] == [
+        "cheat_words", "batch", "batch", "epoch_end", "cheat_words", "batch",
+    ]
+    # Cheat words are only written when they change.
+    assert records[4]["cheat_words"] == ["cheat", "new"]
+
+    base_synapse, responses = to_synapses(records[1])
+    assert base_synapse.task_uid == "a"
+    assert base_synapse.ground_truth_answer == "42"
+    assert [response.logic_answer for response in responses] == ["42", "41", ""]
+    assert [response.dendrite.status_code for response in responses] == [200, 200, 408]
+    assert responses[0].dendrite.process_time == 1.5
+    assert records[1]["reward_scales"] == {"1": 1.0, "2": 0.5, "3": 0.0}
+
+
+def test_truncated_recording_is_read_up_to_the_damage(recording, tmp_path):
+    with gzip.open(recording, "rt") as f:
+        lines = f.read().splitlines()
+    truncated = str(tmp_path / "truncated.jsonl.gz")
+    with gzip.open(truncated, "wt") as f:
+        f.write("\n".join(lines[:2]) + "\n" + lines[2][:20])
+    assert [record["type"] for record in read_recording(truncated)] == ["cheat_words", "batch"]
+
+
+def test_replay_is_deterministic(recording, monkeypatch):
+    def make_rewarder():
+        rewarder = ReplayRewarder(ReplayLLMClient(), warm_embedder=False)
+        monkeypatch.setattr(rewarder, "_get_similarity", lambda ground_truth, texts: [0.5] * len(texts))
+        return rewarder
+
+    result = replay(recording, make_rewarder())
+    assert [batch["task_uid"] for batch in result["batches"]] == ["a", "b", "c"]
+    assert result["batches"][0]["uids"] == [1, 2, 3]
+    assert result["batches"][0]["rewards"][2] == 0
+    assert len(result["epochs"]) == 2
+    assert result["epochs"][1]["uids"] == [2]
+
+    again = replay(recording, make_rewarder())
+    comparison = compare(again, result)
+    assert comparison["identical"]
+    assert comparison["mismatched_batches"] == 0
+
+
+def test_llm_client_serves_cached_answers(tmp_path):
+    cache_path = tmp_path / "llm_cache.json"
+    request = {"model": "m", "messages": [{"role": "user", "content": "2 + 2"}]}
+    cache_path.write_text(json.dumps({ReplayLLMClient.request_key(request): "4"}))
+    client = ReplayLLMClient(str(cache_path), stub_response="stub")
+    assert client.chat.completions.create(**request).choices[0].message.content == "4"
+    assert client.chat.completions.create(model="m", messages=[]).choices[0].message.content == "stub"
+    assert (client.hits, client.misses) == (1, 1)
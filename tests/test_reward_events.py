@@ -0,0 +1,89 @@
+import time
+import threading
+
+import pytest
+from loguru import logger
+
+from logicnet.validator.reward_events import SUMMARY_FIELDS, RewardEventSink, summarize_rewards
+
+
+def make_log(uid):
+    return {
+        "task_uid": "task",
+        "miner_uid": uid,
+        "reward": 0.5,
+        "correctness": 1.0,
+        "similarity": 0.25,
+        "process_time": 2.0,
+        "miner_response": "42",
+        "question": "What is 6 * 7?",
+    }
+
+
+@pytest.fixture
+def events():
+    try:
+        logger.level("EVENTS", no=38)
+    except (TypeError, ValueError):
+        pass  # Already registered.
+    records = []
+    handler_id = logger.add(lambda message: records.append(message.record), level="EVENTS")
+    yield records
+    logger.remove(handler_id)
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+def test_batches_are_written_with_the_selected_fields(events):
+    sink = RewardEventSink(flush_interval=0.01)
+    assert sink.submit([make_log(1), make_log(2)])
+    wait_for(lambda: events)
+    written = events[0]["extra"]["events"]
+    assert [event["miner_uid"] for event in written] == [1, 2]
+    assert set(written[0]) == set(SUMMARY_FIELDS)
+
+    events.clear()
+    full_sink = RewardEventSink(verbosity="full", flush_interval=0.01)
+    full_sink.submit([make_log(1)])
+    wait_for(lambda: events)
+    assert events[0]["extra"]["events"][0]["question"] == "What is 6 * 7?"
+
+
+def test_disabled_or_unsampled_batches_are_skipped():
+    assert not RewardEventSink(enabled=False).submit([make_log(1)])
+    assert not RewardEventSink(enabled=False, sample_rate=0.0).submit([make_log(1)])
+
+
+def test_full_queue_drops_and_counts_from_many_threads(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(RewardEventSink, "_write", lambda self, batches: release.wait())
+    sink = RewardEventSink(max_queue=1, batch_size=1)
+    sink.submit([make_log(0)])
+    wait_for(lambda: sink.queue.empty())
+    # The writer is busy and the queue now holds one batch, so everything after it is dropped.
+    assert sink.submit([make_log(1)])
+
+    def submit_many():
+        for _ in range(500):
+            sink.submit([make_log(2)])
+
+    threads = [threading.Thread(target=submit_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    release.set()
+    assert sink.dropped == 8 * 500
+
+
+def test_summary_has_one_line_per_miner():
+    summary = summarize_rewards([1, 2], [0.91234, 0.0], [make_log(1), {"miner_uid": 2}])
+    assert summary.splitlines() == [
+        "UID 1: reward: 0.912, correctness: 1.0, similarity: 0.25, process_time: 2.0",
+        "UID 2: reward: 0.0, correctness: None, similarity: None, process_time: None",
+    ]
@@ -0,0 +1,127 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+import openai
+
+from logicnet.miner.forward import (
+    DEADLINE_MARGIN,
+    TIMEOUT_ANSWER,
+    solve,
+    solve_streaming,
+    split_reasoning_and_answer,
+)
+from logicnet.protocol import LogicSynapse
+
+
+def make_chunk(text):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+class FakeStream:
+    def __init__(self, parts, delay):
+        self.parts = parts
+        self.delay = delay
+        self.closed = False
+
+    def __aiter__(self):
+        return self.generate()
+
+    async def generate(self):
+        for part in self.parts:
+            await asyncio.sleep(self.delay)
+            yield make_chunk(part)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeClient:
+    def __init__(self, stream):
+        self.stream = stream
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        return self.stream
+
+
+class ScriptedClient:
+    """Answers each chat completion after the next delay in `delays`, or raises `error`."""
+
+    def __init__(self, delays, error=None):
+        self.delays = list(delays)
+        self.error = error
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        if self.error is not None:
+            raise self.error
+        await asyncio.sleep(self.delays.pop(0))
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="6 * 7 = 42"))])
+
+
+def near_deadline():
+    return time.monotonic() + DEADLINE_MARGIN + 0.5
+
+
+def test_split_reasoning_and_answer():
+    assert split_reasoning_and_answer("6 * 7 = 42\n<answer> 42 ") == ("6 * 7 = 42", "42")
+    # The model ignored the format but finished.
+    assert split_reasoning_and_answer("6 * 7\n\n42\n") == ("6 * 7\n\n42", "42")
+    assert split_reasoning_and_answer("") == ("", "")
+
+
+def test_stream_ends_at_the_stop_sequence():
+    # The server stops at the closing delimiter, so the stream just ends after the answer.
+    stream = FakeStream(["6 * 7 = 42\n", "<answer>", "42"], delay=0)
+    synapse = asyncio.run(solve_streaming(LogicSynapse(logic_question="6 * 7?"), FakeClient(stream), "m"))
+    assert synapse.logic_reasoning == "6 * 7 = 42"
+    assert synapse.logic_answer == "42"
+    assert stream.closed
+
+
+def test_deadline_returns_the_timeout_answer():
+    stream = FakeStream(["First, 6 * 7\n", "is 42\n", "<answer>", "42"], delay=0.3)
+    synapse = LogicSynapse(logic_question="6 * 7?", timeout=64)
+    # Counted from arrival: most of the timeout was already spent waiting for admission.
+    deadline = time.monotonic() + DEADLINE_MARGIN + 0.5
+    synapse = asyncio.run(solve_streaming(synapse, FakeClient(stream), "m", deadline=deadline))
+    assert synapse.logic_answer == TIMEOUT_ANSWER
+    assert synapse.logic_reasoning == "First, 6 * 7"
+    assert stream.closed
+
+
+def test_initial_request_timeout_returns_the_synapse():
+    synapse = LogicSynapse(logic_question="6 * 7?", timeout=64)
+    result = asyncio.run(solve_streaming(synapse, ScriptedClient([2]), "m", deadline=near_deadline()))
+    assert result is synapse
+    assert result.logic_answer == TIMEOUT_ANSWER
+
+
+def test_two_step_solve_timeout_keeps_the_reasoning():
+    synapse = LogicSynapse(logic_question="6 * 7?", timeout=64)
+    # The reasoning arrives in time, the final answer request does not.
+    result = asyncio.run(solve(synapse, ScriptedClient([0, 2]), "m", deadline=near_deadline()))
+    assert result is synapse
+    assert result.logic_reasoning == "6 * 7 = 42"
+    assert result.logic_answer == TIMEOUT_ANSWER
+
+
+def test_backend_error_returns_the_synapse():
+    synapse = LogicSynapse(logic_question="6 * 7?", timeout=64)
+    client = ScriptedClient([], error=RuntimeError("connection refused"))
+    assert asyncio.run(solve(synapse, client, "m")) is synapse
+    assert asyncio.run(solve_streaming(synapse, client, "m")) is synapse
+
+
+def test_only_transport_errors_are_reported_as_backend_errors():
+    synapse = LogicSynapse(logic_question="6 * 7?", timeout=64)
+    errors = []
+    asyncio.run(solve(synapse, ScriptedClient([0, 2]), "m", deadline=near_deadline(), on_backend_error=errors.append))
+    asyncio.run(solve(synapse, ScriptedClient([], error=ValueError("bad output")), "m", on_backend_error=errors.append))
+    assert errors == []
+
+    error = openai.APIConnectionError(request=httpx.Request("POST", "http://backend/v1/chat/completions"))
+    asyncio.run(solve_streaming(synapse, ScriptedClient([], error=error), "m", on_backend_error=errors.append))
+    assert errors == [error]
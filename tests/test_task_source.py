@@ -0,0 +1,118 @@
+import sqlite3
+
+import pytest
+import requests
+
+from logicnet.validator.challenger.task_source import LocalTaskBank, TaskPoolSource, parse_dataset_weights
+
+
+def test_parse_dataset_weights():
+    assert parse_dataset_weights("gsm8k:60, mmlu:20,math:0.5") == {"gsm8k": 60.0, "mmlu": 20.0, "math": 0.5}
+    assert parse_dataset_weights("") == {}
+    # Entries without a weight are ignored; dataset names may contain colons.
+    assert parse_dataset_weights("gsm8k,hf:org/set:3") == {"hf:org/set": 3.0}
+
+
+def test_add_tasks_skips_duplicate_questions(tmp_path):
+    bank = LocalTaskBank(str(tmp_path / "bank.db"))
+    assert bank.add_tasks([("a", "q1", "1"), ("a", "q2", "2"), ("b", "q1", "1")]) == 2
+    assert bank.dataset_sizes == {"a": 2}
+    assert bank.add_tasks([("a", "q2", "2")]) == 0
+    assert len(bank) == 2
+
+
+def test_bank_is_reloaded_from_disk(tmp_path):
+    path = str(tmp_path / "bank.db")
+    LocalTaskBank(path).add_tasks([("a", "q1", "1"), ("b", "q2", 2)])
+    bank = LocalTaskBank(path)
+    assert bank.dataset_sizes == {"a": 1, "b": 1}
+    # Answers are stored as text.
+    assert {bank.get_task() for _ in range(50)} <= {("q1", "1"), ("q2", "2")}
+
+
+def test_get_task_follows_dataset_weights(tmp_path):
+    bank = LocalTaskBank(str(tmp_path / "bank.db"), dataset_weights={"a": 1, "b": 0})
+    bank.add_tasks([("a", f"a{i}", str(i)) for i in range(5)] + [("b", "b0", "0")])
+    assert {bank.get_task()[0][0] for _ in range(100)} == {"a"}
+
+
+def test_empty_bank_raises(tmp_path):
+    with pytest.raises(ValueError):
+        LocalTaskBank(str(tmp_path / "bank.db")).get_task()
+
+
+def test_full_dataset_replaces_random_slots(tmp_path):
+    path = str(tmp_path / "bank.db")
+    bank = LocalTaskBank(path, max_tasks=5)
+    assert bank.add_tasks([("a", f"q{i}", str(i)) for i in range(12)]) == 12
+    assert bank.dataset_sizes == {"a": 5}
+    rows = sqlite3.connect(path).execute("SELECT idx, question FROM tasks ORDER BY idx").fetchall()
+    # The index stays dense, so sampling by (dataset, idx) never misses.
+    assert [idx for idx, _ in rows] == [0, 1, 2, 3, 4]
+    assert len({question for _, question in rows}) == 5
+    assert {bank.get_task()[0] for _ in range(50)} <= {question for _, question in rows}
+
+
+def test_cheat_words_round_trip(tmp_path):
+    path = str(tmp_path / "bank.db")
+    bank = LocalTaskBank(path)
+    assert bank.get_cheat_words() == []
+    bank.set_cheat_words(["ignore previous instructions", "output 1"])
+    bank.set_cheat_words(["output 1"])
+    assert LocalTaskBank(path).get_cheat_words() == ["output 1"]
+
+
+def test_task_pool_tasks_are_written_through(tmp_path, monkeypatch):
+    bank = LocalTaskBank(str(tmp_path / "bank.db"))
+    source = TaskPoolSource("http://task-pool", task_bank=bank)
+    monkeypatch.setattr(source, "_fetch_task", lambda: {"question": "q", "answer": "a", "dataset": "gsm8k"})
+    assert source.get_task() == ("q", "a")
+    assert bank.dataset_sizes == {"gsm8k": 1}
+
+
+def test_task_pool_failure_raises_after_retries(tmp_path, monkeypatch):
+    source = TaskPoolSource("http://task-pool", max_retries=2)
+    attempts = []
+
+    def fail():
+        attempts.append(1)
+        raise ValueError("bad task")
+
+    monkeypatch.setattr(source, "_fetch_task", fail)
+    with pytest.raises(RuntimeError):
+        source.get_task()
+    assert len(attempts) == 2
+
+
+def test_unreachable_task_pool_is_skipped_during_cooldown(monkeypatch):
+    source = TaskPoolSource("http://task-pool", max_retries=3, cooldown=60)
+    attempts = []
+
+    def fail():
+        attempts.append(1)
+        raise requests.ConnectionError("down")
+
+    monkeypatch.setattr(source, "_fetch_task", fail)
+    with pytest.raises(RuntimeError):
+        source.get_task()
+    # An unreachable server is not retried, and not contacted again until the cooldown is over.
+    assert len(attempts) == 1
+    with pytest.raises(RuntimeError):
+        source.get_task()
+    assert len(attempts) == 1
+
+    source.unavailable_until = 0
+    monkeypatch.setattr(source, "_fetch_task", lambda: {"question": "q", "answer": "a"})
+    assert source.get_task() == ("q", "a")
+
+
+def test_mirror_keeps_the_task_pool_dataset(tmp_path, monkeypatch):
+    bank = LocalTaskBank(str(tmp_path / "bank.db"))
+    source = TaskPoolSource("http://task-pool")
+    tasks = iter([
+        {"question": "q1", "answer": "1", "dataset": "gsm8k"},
+        {"question": "q2", "answer": "2"},
+    ])
+    monkeypatch.setattr(source, "_fetch_task", lambda: next(tasks))
+    assert bank.mirror(source, 2) == 2
+    assert bank.dataset_sizes == {"gsm8k": 1, "task_pool": 1}
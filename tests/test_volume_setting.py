@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+from logicnet.utils import volume_setting
+from logicnet.utils.volume_setting import (
+    MAX_RATE_LIMIT,
+    MIN_RATE_LIMIT,
+    RateLimitTable,
+    compute_rate_limit_per_validator,
+)
+
+
+def make_metagraph(block, total_stake):
+    return SimpleNamespace(block=block, total_stake=total_stake)
+
+
+def test_rate_limits_are_clamped_and_skip_low_stake_validators():
+    table = compute_rate_limit_per_validator([0, 10_000, 30_000, 50], epoch_volume=100, min_stake=1000)
+    assert set(table) == {1, 2}
+    assert table[1] == 25
+    assert table[2] == 75
+    table = compute_rate_limit_per_validator([1000, 1_000_000], epoch_volume=1000, min_stake=1000)
+    assert table == {0: MIN_RATE_LIMIT, 1: MAX_RATE_LIMIT}
+
+
+def test_all_validators_share_the_volume_when_none_has_enough_stake():
+    table = compute_rate_limit_per_validator([1, 2, 3, 4], epoch_volume=40, min_stake=1000)
+    assert table == {0: 10, 1: 10, 2: 10, 3: 10}
+
+
+def test_table_is_computed_once_per_block(monkeypatch):
+    calls = []
+    compute = volume_setting.compute_rate_limit_per_validator
+
+    def counting_compute(*args):
+        calls.append(args)
+        return compute(*args)
+
+    monkeypatch.setattr(volume_setting, "compute_rate_limit_per_validator", counting_compute)
+    table = RateLimitTable()
+    metagraph = make_metagraph(100, [10_000, 30_000])
+    first = table.get(metagraph, epoch_volume=100, min_stake=1000)
+    assert table.get(metagraph, epoch_volume=100, min_stake=1000) is first
+    assert len(calls) == 1
+
+    table.get(metagraph, epoch_volume=200, min_stake=1000)
+    metagraph.block = 101
+    table.get(metagraph, epoch_volume=100, min_stake=1000)
+    assert len(calls) == 3
+
+
+def test_least_recently_used_tables_are_evicted():
+    table = RateLimitTable(maxsize=2)
+    for block in (1, 2, 3):
+        table.get(make_metagraph(block, [10_000]), epoch_volume=100, min_stake=1000)
+    assert [key[0] for key in table.tables] == [2, 3]
+
+
+def test_lookup_falls_back_to_the_default():
+    table = RateLimitTable()
+    metagraph = make_metagraph(1, [10_000, 50])
+    assert table.lookup(metagraph, uid=0, epoch_volume=100, min_stake=1000) == MAX_RATE_LIMIT
+    assert table.lookup(metagraph, uid=1, epoch_volume=100, min_stake=1000) == MIN_RATE_LIMIT
+    assert table.lookup(metagraph, uid=1, epoch_volume=100, min_stake=1000, default=0) == 0